@@ -4,117 +4,630 @@ Flask web application for Yahoo Fantasy Stats visualization.
 Author: Braedon Giblin
 """
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from markupsafe import Markup
 import logging
+import gzip
+import hashlib
 import json
+import os
 import re
-from collections import defaultdict
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List
+import pandas as pd
 from oauth import YahooOAuth
 from credentials import CLIENT_ID, CLIENT_SECRET, REDIRECT_URI
 from yahoo_fantasy_api import YahooFantasyAPI
+from cache_manager import CacheManager, RedisCache, TTLCache, REDIS_AVAILABLE
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, so jsonify() and request.get_json() skip the stdlib encoder."""
+    
+    def _dumps_bytes(self, obj, **kwargs):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option)
+    
+    def dumps(self, obj, **kwargs):
+        return self._dumps_bytes(obj, **kwargs).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Same as DefaultJSONProvider.response, but hands orjson's bytes straight to the
+        # response instead of decoding them to str for Flask to encode again
+        obj = self._prepare_response_obj(args, kwargs)
+        dump_args = {}
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            dump_args['indent'] = 2
+        return self._app.response_class(self._dumps_bytes(obj, **dump_args) + b'\n', mimetype=self.mimetype)
+
 
 app = Flask(__name__)
-app.config['SECRET_KEY'] = 'yahoo-fantasy-stats-secret-key'
+app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY') or secrets.token_hex(32)
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
+
+# Compress the HTML page (with its inline JSON) and the JSON API responses when Flask-Compress is installed
+if COMPRESS_AVAILABLE:
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_LEVEL'] = 6
+    app.config['COMPRESS_BR_LEVEL'] = 4
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    app.config['COMPRESS_MIMETYPES'] = ['text/html', 'application/json']
+    Compress(app)
+
+# In-process caches so repeat requests within the TTL skip the Yahoo API entirely
+LEAGUE_DATA_TTL = 300  # seconds
+LEAGUE_DATA_TTL_PRIOR_SEASON = 24 * 3600  # seconds; completed seasons no longer change
+GAMES_LEAGUES_TTL = 1800  # seconds; seasons/leagues rarely change
+# With REDIS_URL set (e.g. under multi-worker gunicorn), league data is shared across processes
+REDIS_URL = os.environ.get('REDIS_URL')
+
+
+def _make_shared_cache(name, maxsize, ttl):
+    """Create a cache shared across worker processes via Redis if configured, in-process otherwise."""
+    if REDIS_URL and REDIS_AVAILABLE:
+        return RedisCache(REDIS_URL, prefix=f'yahoo-fantasy-stats:{name}', ttl=ttl)
+    return TTLCache(maxsize=maxsize, ttl=ttl)
+
 
-# Global variables to store API client and data
-api_client = None
-team_stats_df = None
-weekly_df = None
-league_info = None
-league_key = None
+_league_data_cache = _make_shared_cache('league_data', maxsize=64, ttl=LEAGUE_DATA_TTL)
+_games_leagues_cache = _make_shared_cache('games_leagues', maxsize=1, ttl=GAMES_LEAGUES_TTL)
+# Pre-serialized JSON for the cached league data, so cache hits skip DataFrame serialization
+_league_json_cache = TTLCache(maxsize=64, ttl=LEAGUE_DATA_TTL)
+# Serialized aggregate standings keyed by (league_regex, year_start, year_end)
+_aggregate_standings_cache = TTLCache(maxsize=32, ttl=LEAGUE_DATA_TTL)
+# Gzipped JSON payloads keyed by ETag (content-addressed, so the TTL only bounds memory use)
+_gzip_cache = TTLCache(maxsize=128, ttl=LEAGUE_DATA_TTL_PRIOR_SEASON)
 
+# On-disk snapshots beneath the in-process cache, so restarts (e.g. dev auto-reload) skip the API.
+# Current-season scores change during games, so those snapshots stay fresh for a short time only
+# and are read only on a league's first load in this process; after that, in-process misses refetch.
+SNAPSHOT_MAX_AGE = 3600  # seconds
+SNAPSHOT_MAX_AGE_PRIOR_SEASON = 30 * 24 * 3600  # seconds
+GAMES_LEAGUES_SNAPSHOT_MAX_AGE = 24 * 3600  # seconds
+GLOBAL_SNAPSHOT_KEY = '_global_'  # snapshot "league key" for data not tied to one league
+# Columns the dashboard reads from the chart-only datasets. The teams and weekly tables
+# display every column, so those DataFrames are serialized whole.
+WEEKLY_STATS_JSON_FIELDS = ('team_key', 'week', 'number_of_moves', 'number_of_trades', 'faab_balance')
+WEEKLY_PERFORMANCE_JSON_COLUMNS = ['week', 'team_key', 'team_name', 'record_percentage_vs_all']
 
-def initialize_api():
-    """Initialize the Yahoo Fantasy API client."""
-    global api_client
+# Browsers may reuse API responses for this long, then revalidate with If-None-Match
+HTTP_CACHE_MAX_AGE = 120  # seconds
+# Cached JSON payloads at least this large are gzipped once per ETag rather than on every response
+PRECOMPRESS_MIN_SIZE = 1024  # bytes
+PRECOMPRESS_LEVEL = 6
+
+# Yahoo access tokens last an hour. A background thread refreshes them well before expiry
+# so request handlers never wait on the OAuth endpoint.
+TOKEN_REFRESH_CHECK_INTERVAL = 60  # seconds between checks when the token's expiry is unknown
+TOKEN_REFRESH_RETRY_INTERVAL = 30  # seconds to wait before retrying a failed background refresh
+TOKEN_REFRESH_MARGIN = 900  # seconds before expiry to refresh in the background
+TOKEN_REFRESH_MARGIN_REQUEST = 120  # seconds before expiry to refresh inline, if the background refresh lagged
+
+_api_client_lock = threading.Lock()
+
+# Shared pool for independent Yahoo API fetches. Only leaf fetches are submitted to it
+# (tasks never wait on other tasks in the pool), so it cannot deadlock when saturated.
+_fetch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='yahoo-fetch')
+
+_snapshot_cache = CacheManager(cache_dir=os.path.join(CacheManager.CACHE_DIR, 'snapshots'))
+# Leagues loaded at least once by this process
+_loaded_league_keys = set()
+
+
+@lru_cache(maxsize=1)
+def _create_api_client():
+    """Create the Yahoo Fantasy API client (memoized; use get_api_client)."""
+    logger.info("Initializing Yahoo OAuth...")
+    oauth = YahooOAuth(CLIENT_ID, CLIENT_SECRET, REDIRECT_URI)
     
-    if api_client is None:
-        logging.info("Initializing Yahoo OAuth...")
-        oauth = YahooOAuth(CLIENT_ID, CLIENT_SECRET, REDIRECT_URI)
-        
-        if oauth.load_tokens():
+    if oauth.load_tokens():
+        try:
+            oauth.create_authenticated_session()
+            logger.info("Successfully authenticated with saved tokens")
+        except Exception as e:
+            logger.warning("Saved tokens are invalid or expired: %s", e)
+            if oauth.refresh_token:
+                try:
+                    oauth.refresh_access_token()
+                    oauth.save_tokens()
+                    oauth.create_authenticated_session()
+                    logger.info("Successfully refreshed and authenticated")
+                except Exception as refresh_error:
+                    logger.error("Token refresh failed: %s", refresh_error)
+                    raise Exception("Authentication failed. Please re-authenticate.")
+    
+    client = YahooFantasyAPI(oauth.oauth_session, oauth_client=oauth)
+    # Saved tokens are often close to expiry after a restart; refresh them now rather than on a request
+    try:
+        if client.refresh_token_if_expiring(TOKEN_REFRESH_MARGIN):
+            logger.info("Refreshed access token at startup")
+    except Exception as e:
+        logger.warning("Startup token refresh failed: %s", e)
+    _start_token_refresher(client)
+    return client
+
+
+def get_api_client():
+    """Get the shared Yahoo Fantasy API client, initializing it on first use."""
+    # lru_cache alone may run the factory twice for simultaneous first callers
+    with _api_client_lock:
+        return _create_api_client()
+
+
+def _start_token_refresher(client):
+    """Start a daemon thread that sleeps until shortly before the access token expires, then refreshes it."""
+    def refresh_loop():
+        while True:
+            expires_in = client.oauth_client.token_expires_in() if client.oauth_client else None
+            if expires_in is None:
+                delay = TOKEN_REFRESH_CHECK_INTERVAL
+            else:
+                delay = max(expires_in - TOKEN_REFRESH_MARGIN, TOKEN_REFRESH_RETRY_INTERVAL)
+            time.sleep(delay)
             try:
-                oauth.create_authenticated_session()
-                logging.info("Successfully authenticated with saved tokens")
+                if client.refresh_token_if_expiring(TOKEN_REFRESH_MARGIN):
+                    logger.info("Refreshed access token in the background")
             except Exception as e:
-                logging.warning(f"Saved tokens are invalid or expired: {e}")
-                if oauth.refresh_token:
-                    try:
-                        oauth.refresh_access_token()
-                        oauth.save_tokens()
-                        oauth.create_authenticated_session()
-                        logging.info("Successfully refreshed and authenticated")
-                    except Exception as refresh_error:
-                        logging.error(f"Token refresh failed: {refresh_error}")
-                        raise Exception("Authentication failed. Please re-authenticate.")
-        
-        api_client = YahooFantasyAPI(oauth.oauth_session, oauth_client=oauth)
+                logger.warning("Background token refresh failed: %s", e)
     
-    return api_client
+    threading.Thread(target=refresh_loop, name='token-refresher', daemon=True).start()
+
 
+@app.before_request
+def ensure_fresh_token():
+    """Refresh the access token inline only if it is about to expire."""
+    if _create_api_client.cache_info().currsize == 0:
+        return
+    try:
+        get_api_client().refresh_token_if_expiring(TOKEN_REFRESH_MARGIN_REQUEST)
+    except Exception as e:
+        # Requests still retry on 401, so let them proceed
+        logger.warning("Token refresh failed: %s", e)
 
-def get_all_games_and_leagues():
-    """Get all football games and their leagues."""
-    global api_client
+
+def get_all_games_and_leagues(force_refresh=False):
+    """Get all football games and their leagues.
+    Results are cached in-process for GAMES_LEAGUES_TTL seconds.
     
-    if api_client is None:
-        api_client = initialize_api()
+    Args:
+        force_refresh: If True, bypass the in-process cache
+    """
+    return load_games_leagues_json(force_refresh=force_refresh)['games_with_leagues']
+
+
+def load_games_leagues_json(force_refresh=False):
+    """Get all football games and their leagues, along with their JSON serialization.
+    The JSON is built once per fetch and cached with the data.
     
+    Args:
+        force_refresh: If True, bypass the in-process cache
+        
+    Returns:
+        dict: games_with_leagues, json (bytes), markup (for templates) and etag
+    """
+    # Concurrent cold-cache callers share a single fetch
+    return _games_leagues_cache.get_or_compute(
+        'games_leagues', lambda: _fetch_games_leagues_payload(force_refresh=force_refresh),
+        force=force_refresh)
+
+
+def _fetch_games_leagues_payload(force_refresh=False):
+    """Fetch all football games and their leagues and serialize them.
+    Cold starts reuse the on-disk copy when it is recent, and the last-known good
+    copy of any age is used if the API call fails.
+    """
+    games_with_leagues = None
+    if not force_refresh:
+        games_with_leagues = _snapshot_cache.get(GLOBAL_SNAPSHOT_KEY, 'games_leagues',
+                                                 max_age=GAMES_LEAGUES_SNAPSHOT_MAX_AGE)
+    if games_with_leagues is None:
+        try:
+            games_with_leagues = _fetch_games_and_leagues()
+        except Exception as e:
+            games_with_leagues = _snapshot_cache.get(GLOBAL_SNAPSHOT_KEY, 'games_leagues')
+            if games_with_leagues is None:
+                raise
+            logger.warning("Fetching games and leagues failed, using last-known good copy: %s", e)
+        else:
+            _snapshot_cache.set(GLOBAL_SNAPSHOT_KEY, 'games_leagues', games_with_leagues)
+    
+    body = dumps_json(games_with_leagues)
+    return {
+        'games_with_leagues': games_with_leagues,
+        'json': body,
+        'markup': json_script_markup(body),
+        'etag': compute_etag(body),
+    }
+
+
+def _fetch_games_and_leagues():
+    """Fetch all football games and their leagues from the API."""
+    api_client = get_api_client()
     games = api_client.get_user_games()
-    games_with_leagues = []
+    football_games = [game for game in games if api_client.is_football_game(game)]
     
-    for game in games:
-        if api_client.is_football_game(game):
-            game_key = game.get('game_key')
-            game_name = game.get('name', 'N/A')
-            season = game.get('season', 'N/A')
-            
-            leagues = api_client.get_leagues(game_key)
-            if leagues:
-                games_with_leagues.append({
-                    'game_key': game_key,
-                    'game_name': game_name,
-                    'season': season,
-                    'leagues': leagues
-                })
+    # One get_leagues call per season; fetch them concurrently (map preserves order)
+    leagues_per_game = _fetch_executor.map(lambda game: api_client.get_leagues(game.get('game_key')),
+                                           football_games)
+    
+    games_with_leagues = []
+    for game, leagues in zip(football_games, leagues_per_game):
+        if leagues:
+            games_with_leagues.append({
+                'game_key': game.get('game_key'),
+                'game_name': game.get('name', 'N/A'),
+                'season': game.get('season', 'N/A'),
+                'leagues': leagues
+            })
     
     return games_with_leagues
 
 
+@dataclass
+class LeagueBundle:
+    """All data the dashboard shows for one league, fetched and cached together."""
+    league_key: str
+    league_info: Dict[str, Any]
+    teams_df: Any  # pd.DataFrame
+    weekly_df: Any  # pd.DataFrame
+    weekly_team_stats: List[Dict[str, Any]]
+    weekly_performance_df: Any  # pd.DataFrame
+    # Identifies this fetch; survives pickling through a shared cache, unlike object identity
+    fetched_at: float = field(default_factory=time.time)
+
+
+def _snapshot_max_age(league_info_data):
+    """Return how long on-disk snapshots for a league stay fresh, in seconds."""
+    if _snapshot_cache.is_prior_season(league_info_data):
+        return SNAPSHOT_MAX_AGE_PRIOR_SEASON
+    return SNAPSHOT_MAX_AGE
+
+
+def _load_bundle_snapshot(league_key, prior_season_only=False):
+    """Load a league's data from the on-disk snapshot.
+    
+    Args:
+        league_key: League key
+        prior_season_only: If True, ignore snapshots of current-season leagues
+        
+    Returns:
+        LeagueBundle: Snapshot data, or None if missing or stale
+    """
+    league_info_data = _snapshot_cache.get(league_key, 'snapshot_league_info',
+                                           max_age=SNAPSHOT_MAX_AGE_PRIOR_SEASON)
+    if not league_info_data:
+        return None
+    
+    if prior_season_only and not _snapshot_cache.is_prior_season(league_info_data):
+        return None
+    
+    max_age = _snapshot_max_age(league_info_data)
+    if _snapshot_cache.get(league_key, 'snapshot_league_info', max_age=max_age) is None:
+        return None
+    
+    teams_df = _snapshot_cache.get_dataframe(league_key, 'snapshot_teams', max_age=max_age)
+    weekly_data = _snapshot_cache.get_dataframe(league_key, 'snapshot_weekly', max_age=max_age)
+    weekly_team_stats = _snapshot_cache.get(league_key, 'snapshot_weekly_stats', max_age=max_age)
+    weekly_performance_df = _snapshot_cache.get_dataframe(league_key, 'snapshot_weekly_performance', max_age=max_age)
+    if teams_df is None or weekly_data is None or weekly_team_stats is None or weekly_performance_df is None:
+        return None
+    
+    return LeagueBundle(league_key, league_info_data, teams_df, weekly_data,
+                        weekly_team_stats, weekly_performance_df)
+
+
+def _save_bundle_snapshot(bundle):
+    """Write a league's data to the on-disk snapshot."""
+    if not bundle.league_info or bundle.weekly_team_stats is None:
+        return
+    lk = bundle.league_key
+    _snapshot_cache.set_dataframe(lk, 'snapshot_teams', bundle.teams_df)
+    _snapshot_cache.set_dataframe(lk, 'snapshot_weekly', bundle.weekly_df)
+    _snapshot_cache.set_dataframe(lk, 'snapshot_weekly_performance', bundle.weekly_performance_df)
+    _snapshot_cache.set(lk, 'snapshot_weekly_stats', bundle.weekly_team_stats)
+    # Written last so a partial snapshot is never considered fresh
+    _snapshot_cache.set(lk, 'snapshot_league_info', bundle.league_info)
+
+
+def _load_bundle_uncached(league_key, force_refresh=False):
+    """Fetch all dashboard data for a league.
+    Reads the on-disk snapshot when fresh, otherwise fetches from the API.
+    """
+    # A current-season snapshot is only worth reading on a cold process. Later misses come from
+    # the in-process TTL expiring, and the snapshot (up to SNAPSHOT_MAX_AGE old) would serve
+    # data older than that TTL promises.
+    warm = league_key in _loaded_league_keys
+    _loaded_league_keys.add(league_key)
+    if not force_refresh:
+        bundle = _load_bundle_snapshot(league_key, prior_season_only=warm)
+        if bundle is not None:
+            return bundle
+    
+    api_client = get_api_client()
+    
+    # The fetches are independent, so run them concurrently (each uses cache for prior seasons)
+    fetches = [
+        api_client.get_league_info,
+        api_client.get_teams_stats_dataframe,
+        api_client.get_weekly_dataframe,
+        # Weekly team stats (moves, trades, FAAB by week)
+        api_client.get_all_teams_weekly_stats,
+    ]
+    futures = [_fetch_executor.submit(fetch, league_key, force_refresh=force_refresh) for fetch in fetches]
+    league_info_data, teams_df, weekly_data, weekly_team_stats = (future.result() for future in futures)
+    
+    # Weekly team performance (points and record percentage vs all) is derived from the
+    # weekly matchups, so reuse them rather than fetching every scoreboard again
+    weekly_performance_df = api_client.get_weekly_team_performance_dataframe(
+        league_key, force_refresh=force_refresh, weekly_df=weekly_data)
+    
+    bundle = LeagueBundle(league_key, league_info_data, teams_df, weekly_data,
+                          weekly_team_stats, weekly_performance_df)
+    _save_bundle_snapshot(bundle)
+    return bundle
+
+
+def default_league_key(games_with_leagues):
+    """Get the league shown when none is selected: the first league of the first game.
+    
+    Args:
+        games_with_leagues: Result of get_all_games_and_leagues
+        
+    Returns:
+        str: League key
+    """
+    if not games_with_leagues:
+        raise Exception("No fantasy football leagues found")
+    
+    league_key = games_with_leagues[0]['leagues'][0].get('league_key')
+    if not league_key:
+        raise Exception("No league key found")
+    return league_key
+
+
+def is_league_data_cached(league_key=None):
+    """Check whether load_data can be served from the in-process cache without calling the API.
+    
+    Args:
+        league_key: Optional league key (the default league if omitted)
+        
+    Returns:
+        bool: True if the games list (when needed) and the league's data are cached
+    """
+    if league_key is None:
+        payload = _games_leagues_cache.get('games_leagues')
+        if not payload:
+            return False
+        try:
+            league_key = default_league_key(payload['games_with_leagues'])
+        except Exception:
+            return False
+    return _league_data_cache.contains(league_key)
+
+
+def _league_data_ttl(bundle):
+    """Return how long a league's data stays in the in-process cache, in seconds."""
+    if _snapshot_cache.is_prior_season(bundle.league_info):
+        return LEAGUE_DATA_TTL_PRIOR_SEASON
+    return LEAGUE_DATA_TTL
+
+
 def load_data(league_key=None, force_refresh=False):
     """Load fantasy league data for a specific league.
-    Uses cache for prior seasons automatically.
+    Uses cache for prior seasons automatically, and caches results
+    in-process for LEAGUE_DATA_TTL seconds (LEAGUE_DATA_TTL_PRIOR_SEASON for completed seasons).
     
     Args:
         league_key: Optional league key
         force_refresh: If True, bypass cache and fetch from API
+        
+    Returns:
+        LeagueBundle: League info, team stats, weekly matchups, weekly team stats and weekly performance
     """
-    global api_client, team_stats_df, weekly_df, league_info
-    
-    if api_client is None:
-        api_client = initialize_api()
-    
     # If no league_key provided, get the first available league
     if league_key is None:
-        games_with_leagues = get_all_games_and_leagues()
-        if not games_with_leagues:
-            raise Exception("No fantasy football leagues found")
+        league_key = default_league_key(get_all_games_and_leagues())
+    
+    # Concurrent cold-cache callers for the same league share a single fetch
+    return _league_data_cache.get_or_compute(
+        league_key, lambda: _load_bundle_uncached(league_key, force_refresh=force_refresh),
+        force=force_refresh, ttl=_league_data_ttl)
+
+
+def dumps_json(obj):
+    """Serialize an object to JSON bytes, using orjson when available.
+    
+    Args:
+        obj: JSON-serializable object (numpy scalars/arrays are supported with orjson)
         
-        # Use first league from first game
-        league_key = games_with_leagues[0]['leagues'][0].get('league_key')
-        if not league_key:
-            raise Exception("No league key found")
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC)
+    return json.dumps(obj, default=str).encode('utf-8')
+
+
+def df_to_json_bytes(df):
+    """Serialize a DataFrame to a JSON array of records (b'[]' when missing or empty).
     
-    # Get league info (uses cache for prior seasons)
-    league_info = api_client.get_league_info(league_key, force_refresh=force_refresh)
+    Args:
+        df: pandas DataFrame or None
+        
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if df is None or df.empty:
+        return b'[]'
+    if ORJSON_AVAILABLE:
+        # NaN floats serialize as null, matching pandas to_json
+        return dumps_json(df.to_dict(orient='records'))
+    return df.to_json(orient='records').encode('utf-8')
+
+
+def json_script_markup(body):
+    """Prepare JSON bytes for embedding in an inline <script>, like Jinja's |tojson.
+    HTML-significant characters can only occur inside JSON strings, where their
+    \\u escapes are equivalent, so the result is still the same JSON value.
     
-    # Get team stats DataFrame (uses cache for prior seasons)
-    team_stats_df = api_client.get_teams_stats_dataframe(league_key, force_refresh=force_refresh)
+    Args:
+        body: JSON bytes
+        
+    Returns:
+        Markup: Script-safe JSON text that Jinja will not re-escape
+    """
+    text = body.decode('utf-8')
+    for char, escaped in (('<', '\\u003c'), ('>', '\\u003e'), ('&', '\\u0026'), ("'", '\\u0027')):
+        text = text.replace(char, escaped)
+    return Markup(text)
+
+
+def prune_for_json(df, columns, float_decimals=None):
+    """Keep only the columns a client uses, optionally rounding floats, before serialization.
     
-    # Get weekly DataFrame (uses cache for prior seasons)
-    weekly_df = api_client.get_weekly_dataframe(league_key, force_refresh=force_refresh)
+    Args:
+        df: pandas DataFrame or None
+        columns: Columns to keep (missing ones are ignored)
+        float_decimals: Optional number of decimals to round float columns to
+        
+    Returns:
+        pd.DataFrame: Pruned copy, or df unchanged if missing or empty
+    """
+    if df is None or df.empty:
+        return df
+    df = df[[col for col in columns if col in df.columns]]
+    if float_decimals is not None:
+        df = df.round(float_decimals)
+    return df
+
+
+def compute_etag(body):
+    """Compute a strong ETag for a response body.
     
-    return league_info, team_stats_df, weekly_df, league_key
+    Args:
+        body: Response body bytes
+        
+    Returns:
+        str: Hex digest used as the ETag value
+    """
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def force_refresh_requested():
+    """Check whether the request asks to bypass caches with ?force_refresh=1 (or true/yes)."""
+    return request.args.get('force_refresh', '').lower() in ('1', 'true', 'yes')
+
+
+def json_response(body, etag=None):
+    """Build a cacheable JSON response, answering 304 Not Modified when the client's ETag matches.
+    Large bodies are sent gzipped (compressed once per ETag) to clients that accept it.
+    
+    Args:
+        body: JSON bytes
+        etag: Optional precomputed ETag (computed from body if omitted)
+        
+    Returns:
+        Response: Flask response
+    """
+    etag = etag or compute_etag(body)
+    if len(body) >= PRECOMPRESS_MIN_SIZE and request.accept_encodings['gzip'] > 0:
+        body = _gzip_cache.get_or_compute(
+            etag, lambda: gzip.compress(body, compresslevel=PRECOMPRESS_LEVEL, mtime=0))
+        response = Response(body, mimetype='application/json')
+        # Flask-Compress leaves responses that already have a Content-Encoding alone
+        response.headers['Content-Encoding'] = 'gzip'
+        # The gzipped representation has different bytes, so it needs its own strong ETag
+        etag += '-gzip'
+    else:
+        response = Response(body, mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = f'private, max-age={HTTP_CACHE_MAX_AGE}'
+    return response.make_conditional(request)
+
+
+def load_data_json(league_key=None, force_refresh=False):
+    """Load league data for a league, pre-serialized to JSON bytes.
+    The payloads are rebuilt only when load_data returns freshly fetched data.
+    
+    Args:
+        league_key: Optional league key
+        force_refresh: If True, bypass cache and fetch from API
+        
+    Returns:
+        dict: league_key, league_info, and the *_json payloads for league_info, teams, weekly,
+            weekly_stats and weekly_performance, ETags for teams, weekly and the whole league,
+            and the prebuilt index.html template_context
+    """
+    bundle = load_data(league_key, force_refresh=force_refresh)
+    lk = bundle.league_key
+    
+    payload = _league_json_cache.get(lk)
+    if payload is None or payload['fetched_at'] != bundle.fetched_at:
+        league_info_data = bundle.league_info if bundle.league_info else {}
+        payload = {
+            'fetched_at': bundle.fetched_at,
+            'league_key': lk,
+            'league_info': league_info_data,
+            'league_info_json': dumps_json(league_info_data),
+            'teams_json': df_to_json_bytes(bundle.teams_df),
+            'weekly_json': df_to_json_bytes(bundle.weekly_df),
+            'weekly_stats_json': dumps_json([
+                {field: stat.get(field) for field in WEEKLY_STATS_JSON_FIELDS}
+                for stat in bundle.weekly_team_stats
+            ]) if bundle.weekly_team_stats else b'[]',
+            'weekly_performance_json': df_to_json_bytes(prune_for_json(
+                bundle.weekly_performance_df, WEEKLY_PERFORMANCE_JSON_COLUMNS, float_decimals=2)),
+        }
+        payload['teams_etag'] = compute_etag(payload['teams_json'])
+        payload['weekly_etag'] = compute_etag(payload['weekly_json'])
+        payload['etag'] = compute_etag(b''.join([
+            compute_etag(payload['league_info_json']).encode(),
+            payload['teams_etag'].encode(),
+            payload['weekly_etag'].encode(),
+            compute_etag(payload['weekly_stats_json']).encode(),
+            compute_etag(payload['weekly_performance_json']).encode(),
+        ]))
+        # Decoded once here so renders of index only splice the strings into the page
+        payload['template_context'] = {
+            'league_info_data': json_script_markup(payload['league_info_json']),
+            'teams_data': json_script_markup(payload['teams_json']),
+            'weekly_data': json_script_markup(payload['weekly_json']),
+            'weekly_stats_data': json_script_markup(payload['weekly_stats_json']),
+            'weekly_performance_data': json_script_markup(payload['weekly_performance_json']),
+            'selected_league_key': lk,
+        }
+        _league_json_cache.set(lk, payload, ttl=_league_data_ttl(bundle))
+    
+    return payload
 
 
 @app.route('/')
@@ -123,42 +636,35 @@ def index():
     try:
         # Get league_key from query parameter if provided
         league_key = request.args.get('league_key', None)
+        force_refresh = force_refresh_requested()
         
-        # Get all games and leagues for dropdown
-        games_with_leagues = get_all_games_and_leagues()
-        
-        # Load data for selected or default league
-        league_info_data, teams_df, weekly_data, lk = load_data(league_key)
-        
-        # Get weekly team stats (moves, trades, FAAB by week)
-        weekly_team_stats = api_client.get_all_teams_weekly_stats(lk)
+        # On a cold cache, render the page shell immediately and let the browser
+        # fetch the games list and league data from the API endpoints
+        if force_refresh or not is_league_data_cached(league_key):
+            return render_template('index.html',
+                                 league_info_data='{}',
+                                 teams_data='[]',
+                                 weekly_data='[]',
+                                 weekly_stats_data='[]',
+                                 weekly_performance_data='[]',
+                                 games_leagues_data='null',
+                                 selected_league_key=league_key or '',
+                                 hydrate=True,
+                                 force_refresh=force_refresh)
         
-        # Get weekly team performance (points and record percentage vs all)
-        weekly_performance_df = api_client.get_weekly_team_performance_dataframe(lk)
+        # Get all games and leagues for dropdown (pre-serialized to JSON for JavaScript)
+        games_leagues = load_games_leagues_json()
         
-        # Convert DataFrames to JSON for JavaScript
-        teams_json = teams_df.to_json(orient='records') if teams_df is not None and not teams_df.empty else '[]'
-        weekly_json = weekly_df.to_json(orient='records') if weekly_df is not None and not weekly_df.empty else '[]'
-        weekly_stats_json = json.dumps(weekly_team_stats) if weekly_team_stats else '[]'
-        weekly_performance_json = weekly_performance_df.to_json(orient='records') if weekly_performance_df is not None and not weekly_performance_df.empty else '[]'
-        
-        # Prepare games and leagues data for dropdowns
-        games_leagues_json = json.dumps(games_with_leagues)
-        
-        # Ensure league_info is a dict
-        if league_info_data is None:
-            league_info_data = {}
+        # Load data for selected or default league (pre-serialized to JSON for JavaScript)
+        league_data = load_data_json(league_key)
         
         return render_template('index.html', 
-                             league_info=league_info_data,
-                             teams_data=teams_json,
-                             weekly_data=weekly_json,
-                             weekly_stats_data=weekly_stats_json,
-                             weekly_performance_data=weekly_performance_json,
-                             games_leagues_data=games_leagues_json,
-                             selected_league_key=lk)
+                             **league_data['template_context'],
+                             games_leagues_data=games_leagues['markup'],
+                             hydrate=False,
+                             force_refresh=False)
     except Exception as e:
-        logging.error(f"Error loading data: {e}", exc_info=True)
+        logger.error("Error loading data: %s", e, exc_info=True)
         return render_template('error.html', error_message=str(e))
 
 
@@ -166,10 +672,10 @@ def index():
 def api_games_leagues():
     """API endpoint for games and leagues data."""
     try:
-        games_with_leagues = get_all_games_and_leagues()
-        return jsonify(games_with_leagues)
+        games_leagues = load_games_leagues_json(force_refresh=force_refresh_requested())
+        return json_response(games_leagues['json'], games_leagues['etag'])
     except Exception as e:
-        logging.error(f"Error fetching games and leagues: {e}")
+        logger.error("Error fetching games and leagues: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -181,23 +687,20 @@ def api_league_data():
         if not league_key:
             return jsonify({'error': 'league_key parameter required'}), 400
         
-        league_info_data, teams_df, weekly_data, lk = load_data(league_key)
+        league_data = load_data_json(league_key, force_refresh=force_refresh_requested())
         
-        # Get weekly team stats (moves, trades, FAAB by week)
-        weekly_team_stats = api_client.get_all_teams_weekly_stats(lk)
-        
-        # Get weekly team performance (points and record percentage vs all)
-        weekly_performance_df = api_client.get_weekly_team_performance_dataframe(lk)
-        
-        return jsonify({
-            'league_info': league_info_data if league_info_data else {},
-            'teams': teams_df.to_dict(orient='records') if teams_df is not None and not teams_df.empty else [],
-            'weekly': weekly_data.to_dict(orient='records') if weekly_data is not None and not weekly_data.empty else [],
-            'weekly_stats': weekly_team_stats if weekly_team_stats else [],
-            'weekly_performance': weekly_performance_df.to_dict(orient='records') if weekly_performance_df is not None and not weekly_performance_df.empty else []
-        })
+        # Splice the cached payloads together rather than re-serializing them
+        body = b''.join([
+            b'{"league_info": ', league_data['league_info_json'],
+            b', "teams": ', league_data['teams_json'],
+            b', "weekly": ', league_data['weekly_json'],
+            b', "weekly_stats": ', league_data['weekly_stats_json'],
+            b', "weekly_performance": ', league_data['weekly_performance_json'],
+            b'}',
+        ])
+        return json_response(body, league_data['etag'])
     except Exception as e:
-        logging.error(f"Error fetching league data: {e}")
+        logger.error("Error fetching league data: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -206,12 +709,10 @@ def api_teams():
     """API endpoint for team stats data."""
     try:
         league_key = request.args.get('league_key', None)
-        _, teams_df, _, _ = load_data(league_key)
-        if teams_df is not None and not teams_df.empty:
-            return jsonify(teams_df.to_dict(orient='records'))
-        return jsonify([])
+        league_data = load_data_json(league_key, force_refresh=force_refresh_requested())
+        return json_response(league_data['teams_json'], league_data['teams_etag'])
     except Exception as e:
-        logging.error(f"Error fetching teams data: {e}")
+        logger.error("Error fetching teams data: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -220,15 +721,219 @@ def api_weekly():
     """API endpoint for weekly matchup data."""
     try:
         league_key = request.args.get('league_key', None)
-        _, _, weekly_data, _ = load_data(league_key)
-        if weekly_data is not None and not weekly_data.empty:
-            return jsonify(weekly_data.to_dict(orient='records'))
-        return jsonify([])
+        league_data = load_data_json(league_key, force_refresh=force_refresh_requested())
+        return json_response(league_data['weekly_json'], league_data['weekly_etag'])
     except Exception as e:
-        logging.error(f"Error fetching weekly data: {e}")
+        logger.error("Error fetching weekly data: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/refresh', methods=['POST'])
+def api_refresh():
+    """API endpoint to invalidate the in-process league data cache and on-disk snapshots."""
+    league_key = request.args.get('league_key')
+    if league_key:
+        _league_data_cache.pop(league_key)
+        _league_json_cache.pop(league_key)
+        _snapshot_cache.clear(league_key=league_key)
+    else:
+        _snapshot_cache.clear()
+        _league_data_cache.clear()
+        _league_json_cache.clear()
+        _games_leagues_cache.clear()
+    # Aggregate standings span many leagues, so any refresh invalidates them
+    _aggregate_standings_cache.clear()
+    if _create_api_client.cache_info().currsize:
+        get_api_client().clear_memo()
+    return jsonify({'status': 'ok'})
+
+
+# Per-team columns summed across leagues, and the aggregate standings field each one feeds
+AGGREGATE_SUM_COLUMNS = {
+    'wins': 'total_wins',
+    'losses': 'total_losses',
+    'ties': 'total_ties',
+    'points_for': 'total_points_for',
+    'points_against': 'total_points_against',
+    'expected_wins': 'total_expected_wins',
+    'expected_losses': 'total_expected_losses',
+    'number_of_moves': 'total_number_of_moves',
+    'number_of_trades': 'total_number_of_trades',
+}
+AGGREGATE_INT_COLUMNS = ['wins', 'losses', 'ties', 'number_of_moves', 'number_of_trades']
+
+
+def _prepare_standings_frame(team_stats_df):
+    """Select and coerce the columns aggregate standings needs from one league's team stats.
+    
+    Args:
+        team_stats_df: DataFrame from get_teams_stats_dataframe
+        
+    Returns:
+        pd.DataFrame: manager_nickname, team_name and numeric stat columns ('N/A' and missing
+            values count as 0), without rows lacking a manager; None if there is no manager column
+    """
+    if 'manager_nickname' not in team_stats_df.columns:
+        return None
+    
+    managers = team_stats_df['manager_nickname']
+    df = team_stats_df[managers.notna() & (managers != 'N/A') & (managers != '')]
+    
+    frame = pd.DataFrame({'manager_nickname': df['manager_nickname']})
+    frame['team_name'] = df['team_name'] if 'team_name' in df.columns else 'N/A'
+    for col in AGGREGATE_SUM_COLUMNS:
+        frame[col] = pd.to_numeric(df[col], errors='coerce').fillna(0) if col in df.columns else 0
+    return frame
+
+
+def _join_team_names(team_names):
+    """Join a manager's distinct team names in order of appearance ('N/A' if none)."""
+    unique_names = dict.fromkeys(name for name in team_names if name and name != 'N/A' and isinstance(name, str))
+    return ', '.join(unique_names) if unique_names else 'N/A'
+
+
+def _aggregate_standings(frames):
+    """Aggregate per-league team stats into standings per manager.
+    
+    Args:
+        frames: DataFrames from _prepare_standings_frame, one per league
+        
+    Returns:
+        list: Standings dictionaries, one per manager in order of first appearance
+    """
+    if not frames:
+        return []
+    
+    combined = pd.concat(frames, ignore_index=True)
+    grouped = combined.groupby('manager_nickname', sort=False)
+    totals = grouped[list(AGGREGATE_SUM_COLUMNS)].sum()
+    totals[AGGREGATE_INT_COLUMNS] = totals[AGGREGATE_INT_COLUMNS].astype(int)
+    totals = totals.rename(columns=AGGREGATE_SUM_COLUMNS)
+    
+    leagues_played = grouped.size()
+    total_games = totals['total_wins'] + totals['total_losses'] + totals['total_ties']
+    avg_win_percentage = (totals['total_wins'] / total_games * 100).where(total_games > 0, 0.0)
+    
+    total_expected_games = totals['total_expected_wins'] + totals['total_expected_losses']
+    avg_expected_win_percentage = (
+        totals['total_expected_wins'] / total_expected_games * 100
+    ).where(total_expected_games > 0, 0.0)
+    
+    standings = pd.DataFrame({
+        'manager_nickname': totals.index,
+        'team_name': grouped['team_name'].agg(_join_team_names),
+        'leagues_played': leagues_played,
+        'total_wins': totals['total_wins'],
+        'total_losses': totals['total_losses'],
+        'total_ties': totals['total_ties'],
+        'total_games': total_games,
+        'avg_win_percentage': avg_win_percentage.round(3),
+        'total_points_for': totals['total_points_for'].round(2),
+        'total_points_against': totals['total_points_against'].round(2),
+        'avg_points_for': (totals['total_points_for'] / leagues_played).round(2),
+        'avg_points_against': (totals['total_points_against'] / leagues_played).round(2),
+        'total_expected_wins': totals['total_expected_wins'].round(1),
+        'total_expected_losses': totals['total_expected_losses'].round(1),
+        'avg_expected_win_percentage': avg_expected_win_percentage.round(3),
+        'win_percentage_difference': (avg_win_percentage - avg_expected_win_percentage).round(3),
+        'total_number_of_moves': totals['total_number_of_moves'],
+        'total_number_of_trades': totals['total_number_of_trades'],
+        'avg_moves_per_league': (totals['total_number_of_moves'] / leagues_played).round(1),
+        'avg_trades_per_league': (totals['total_number_of_trades'] / leagues_played).round(1),
+    })
+    return standings.to_dict(orient='records')
+
+
+@lru_cache(maxsize=64)
+def _compile_league_pattern(league_regex):
+    """Compile a league name filter (memoized, so repeat dashboard filters skip compilation)."""
+    return re.compile(league_regex, re.IGNORECASE)
+
+
+def _build_aggregate_standings_payload(pattern, year_start, year_end, force_refresh=False):
+    """Fetch and aggregate standings for every league matching a name pattern and year range.
+    
+    Args:
+        pattern: Compiled regex matched against league names, or None to include every league
+        year_start: Optional first season to include
+        year_end: Optional last season to include
+        force_refresh: If True, bypass cache and fetch from API
+        
+    Returns:
+        dict: 'json' (serialized response body) and 'etag'
+    """
+    api_client = get_api_client()
+    
+    # Get all games and leagues
+    games_with_leagues = get_all_games_and_leagues(force_refresh=force_refresh)
+    
+    # Filter leagues by regex pattern and year range
+    matching_leagues = []
+    for game in games_with_leagues:
+        season = game.get('season', 'N/A')
+        
+        # Filter by year range if provided
+        if season != 'N/A':
+            try:
+                season_year = int(season)
+                if year_start and season_year < year_start:
+                    continue
+                if year_end and season_year > year_end:
+                    continue
+            except (ValueError, TypeError):
+                # If season is not a valid integer, skip year filtering for this game
+                pass
+        
+        for league in game.get('leagues', []):
+            league_name = league.get('name', '')
+            if pattern is None or pattern.search(league_name):
+                matching_leagues.append({
+                    'league_key': league.get('league_key'),
+                    'league_name': league_name,
+                    'season': season,
+                    'game_name': game.get('game_name')
+                })
+    
+    if not matching_leagues:
+        body = dumps_json({
+            'standings': [],
+            'leagues_count': 0,
+            'message': 'No leagues found matching the regex pattern'
+        })
+        return {'json': body, 'etag': compute_etag(body)}
+    
+    # Get team stats for every matching league concurrently
+    futures = [
+        _fetch_executor.submit(api_client.get_teams_stats_dataframe, league_info['league_key'],
+                               force_refresh=force_refresh)
+        for league_info in matching_leagues
+    ]
+    
+    # Prepare each matching league (in the original order, so output order is stable)
+    frames = []
+    for league_info, future in zip(matching_leagues, futures):
+        league_key = league_info['league_key']
+        try:
+            team_stats_df = future.result()
+            if team_stats_df is None or team_stats_df.empty:
+                continue
+            frame = _prepare_standings_frame(team_stats_df)
+            if frame is not None and not frame.empty:
+                frames.append(frame)
+        except Exception as e:
+            logger.warning("Error processing league %s: %s", league_key, e)
+            continue
+    
+    # Aggregate stats by manager nickname (assuming same manager across leagues)
+    standings_list = _aggregate_standings(frames)
+    
+    body = dumps_json({
+        'standings': standings_list,
+        'leagues_count': len(matching_leagues)
+    })
+    return {'json': body, 'etag': compute_etag(body)}
+
+
 @app.route('/api/aggregate-standings')
 def api_aggregate_standings():
     """API endpoint for aggregate standings across multiple leagues."""
@@ -256,157 +961,54 @@ def api_aggregate_standings():
         if year_start and year_end and year_start > year_end:
             return jsonify({'error': 'year_start must be less than or equal to year_end'}), 400
         
-        # Initialize API if needed
-        if api_client is None:
-            initialize_api()
-        
-        # Get all games and leagues
-        games_with_leagues = get_all_games_and_leagues()
-        
-        # Filter leagues by regex pattern and year range
-        matching_leagues = []
         try:
-            pattern = re.compile(league_regex, re.IGNORECASE)
+            # '.*' (the default) matches every league, so skip the regex engine entirely
+            pattern = None if league_regex == '.*' else _compile_league_pattern(league_regex)
         except re.error as e:
             return jsonify({'error': f'Invalid regex pattern: {e}'}), 400
         
-        for game in games_with_leagues:
-            season = game.get('season', 'N/A')
-            
-            # Filter by year range if provided
-            if season != 'N/A':
-                try:
-                    season_year = int(season)
-                    if year_start and season_year < year_start:
-                        continue
-                    if year_end and season_year > year_end:
-                        continue
-                except (ValueError, TypeError):
-                    # If season is not a valid integer, skip year filtering for this game
-                    pass
-            
-            for league in game.get('leagues', []):
-                league_name = league.get('name', '')
-                if pattern.search(league_name):
-                    matching_leagues.append({
-                        'league_key': league.get('league_key'),
-                        'league_name': league_name,
-                        'season': season,
-                        'game_name': game.get('game_name')
-                    })
-        
-        if not matching_leagues:
-            return jsonify({
-                'standings': [],
-                'leagues_count': 0,
-                'message': 'No leagues found matching the regex pattern'
-            })
-        
-        # Aggregate stats by manager nickname (assuming same manager across leagues)
-        aggregated_stats = defaultdict(lambda: {
-            'manager_nickname': '',
-            'team_names': [],  # Collect all team names for this manager
-            'total_wins': 0,
-            'total_losses': 0,
-            'total_ties': 0,
-            'total_points_for': 0.0,
-            'total_points_against': 0.0,
-            'leagues_played': 0,
-            'total_expected_wins': 0.0,
-            'total_expected_losses': 0.0,
-            'total_number_of_moves': 0,
-            'total_number_of_trades': 0
-        })
-        
-        # Process each matching league
-        for league_info in matching_leagues:
-            league_key = league_info['league_key']
-            try:
-                # Get team stats for this league
-                team_stats_df = api_client.get_teams_stats_dataframe(league_key)
-                if team_stats_df is None or team_stats_df.empty:
-                    continue
-                
-                # Aggregate by manager nickname
-                for _, row in team_stats_df.iterrows():
-                    manager = row.get('manager_nickname', 'N/A')
-                    if manager == 'N/A' or not manager:
-                        continue
-                    
-                    # Initialize if first time seeing this manager
-                    if aggregated_stats[manager]['manager_nickname'] == '':
-                        aggregated_stats[manager]['manager_nickname'] = manager
-                    
-                    # Collect team name
-                    team_name = row.get('team_name', 'N/A')
-                    if team_name != 'N/A' and team_name and team_name not in aggregated_stats[manager]['team_names']:
-                        aggregated_stats[manager]['team_names'].append(team_name)
-                    
-                    # Aggregate stats
-                    aggregated_stats[manager]['total_wins'] += int(row.get('wins', 0)) if str(row.get('wins', 0)) != 'N/A' else 0
-                    aggregated_stats[manager]['total_losses'] += int(row.get('losses', 0)) if str(row.get('losses', 0)) != 'N/A' else 0
-                    aggregated_stats[manager]['total_ties'] += int(row.get('ties', 0)) if str(row.get('ties', 0)) != 'N/A' else 0
-                    aggregated_stats[manager]['total_points_for'] += float(row.get('points_for', 0)) if str(row.get('points_for', 0)) != 'N/A' else 0.0
-                    aggregated_stats[manager]['total_points_against'] += float(row.get('points_against', 0)) if str(row.get('points_against', 0)) != 'N/A' else 0.0
-                    aggregated_stats[manager]['total_expected_wins'] += float(row.get('expected_wins', 0)) if str(row.get('expected_wins', 0)) != 'N/A' else 0.0
-                    aggregated_stats[manager]['total_expected_losses'] += float(row.get('expected_losses', 0)) if str(row.get('expected_losses', 0)) != 'N/A' else 0.0
-                    aggregated_stats[manager]['total_number_of_moves'] += int(row.get('number_of_moves', 0)) if str(row.get('number_of_moves', 0)) != 'N/A' else 0
-                    aggregated_stats[manager]['total_number_of_trades'] += int(row.get('number_of_trades', 0)) if str(row.get('number_of_trades', 0)) != 'N/A' else 0
-                    aggregated_stats[manager]['leagues_played'] += 1
-                    
-            except Exception as e:
-                logging.warning(f"Error processing league {league_key}: {e}")
-                continue
-        
-        # Convert to list and calculate derived stats
-        standings_list = []
-        for manager, stats in aggregated_stats.items():
-            total_games = stats['total_wins'] + stats['total_losses'] + stats['total_ties']
-            avg_win_percentage = (stats['total_wins'] / total_games * 100) if total_games > 0 else 0.0
-            
-            total_expected_games = stats['total_expected_wins'] + stats['total_expected_losses']
-            avg_expected_win_percentage = (stats['total_expected_wins'] / total_expected_games * 100) if total_expected_games > 0 else 0.0
-            
-            win_pct_diff = avg_win_percentage - avg_expected_win_percentage
-            
-            # Get team name(s) - use first one, or join if multiple
-            team_names = stats.get('team_names', [])
-            team_name_display = ', '.join(team_names) if team_names else 'N/A'
-            
-            standings_list.append({
-                'manager_nickname': stats['manager_nickname'],
-                'team_name': team_name_display,
-                'leagues_played': stats['leagues_played'],
-                'total_wins': stats['total_wins'],
-                'total_losses': stats['total_losses'],
-                'total_ties': stats['total_ties'],
-                'total_games': total_games,
-                'avg_win_percentage': round(avg_win_percentage, 3),
-                'total_points_for': round(stats['total_points_for'], 2),
-                'total_points_against': round(stats['total_points_against'], 2),
-                'avg_points_for': round(stats['total_points_for'] / stats['leagues_played'], 2) if stats['leagues_played'] > 0 else 0.0,
-                'avg_points_against': round(stats['total_points_against'] / stats['leagues_played'], 2) if stats['leagues_played'] > 0 else 0.0,
-                'total_expected_wins': round(stats['total_expected_wins'], 1),
-                'total_expected_losses': round(stats['total_expected_losses'], 1),
-                'avg_expected_win_percentage': round(avg_expected_win_percentage, 3),
-                'win_percentage_difference': round(win_pct_diff, 3),
-                'total_number_of_moves': stats['total_number_of_moves'],
-                'total_number_of_trades': stats['total_number_of_trades'],
-                'avg_moves_per_league': round(stats['total_number_of_moves'] / stats['leagues_played'], 1) if stats['leagues_played'] > 0 else 0.0,
-                'avg_trades_per_league': round(stats['total_number_of_trades'] / stats['leagues_played'], 1) if stats['leagues_played'] > 0 else 0.0
-            })
-        
-        return jsonify({
-            'standings': standings_list,
-            'leagues_count': len(matching_leagues)
-        })
+        force_refresh = force_refresh_requested()
+        payload = _aggregate_standings_cache.get_or_compute(
+            (league_regex, year_start or None, year_end or None),
+            lambda: _build_aggregate_standings_payload(pattern, year_start, year_end, force_refresh),
+            force=force_refresh,
+        )
+        return json_response(payload['json'], payload['etag'])
         
     except Exception as e:
-        logging.error(f"Error fetching aggregate standings: {e}", exc_info=True)
+        logger.error("Error fetching aggregate standings: %s", e, exc_info=True)
         return jsonify({'error': str(e)}), 500
 
 
+def _warm_cache():
+    """Load the games list and every league's data, so first page loads are served from cache.
+    Prior seasons also land in the on-disk caches, so later restarts warm up without API calls.
+    """
+    try:
+        games_with_leagues = get_all_games_and_leagues()
+    except Exception as e:
+        logger.warning("Cache warm-up failed: %s", e)
+        return
+    
+    # The default league comes first, so the index page is ready soonest
+    league_keys = [league.get('league_key') for game in games_with_leagues
+                   for league in game.get('leagues', []) if league.get('league_key')]
+    for league_key in league_keys:
+        try:
+            load_data(league_key)
+        except Exception as e:
+            logger.warning("Cache warm-up failed for league %s: %s", league_key, e)
+    logger.info("Cache warm-up finished for %d leagues", len(league_keys))
+
+
 if __name__ == '__main__':
     logging.basicConfig(level=logging.INFO)
+    # Per-request access logs are noisy and cost CPU under load; keep only warnings and errors
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    # With the debug reloader, this block also runs in the watcher process; warm only the serving one
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        threading.Thread(target=_warm_cache, name='cache-warmer', daemon=True).start()
+    # Werkzeug's own startup banner is logged at INFO, so announce the address here
+    logger.info("Serving on http://127.0.0.1:5000")
     app.run(debug=True, host='127.0.0.1', port=5000)
 
@@ -7,17 +7,351 @@ unnecessary API calls for prior seasons.
 Author: Braedon Giblin
 """
 
+import glob
 import json
 import os
-from typing import Dict, Optional, Any
-from datetime import datetime
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, Optional, Any, Callable, Hashable, Union
+from datetime import date, datetime
+from functools import lru_cache
 import hashlib
 
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+try:
+    import pyarrow  # noqa: F401  (required by DataFrame.to_feather / pd.read_feather)
+    FEATHER_AVAILABLE = True
+except ImportError:
+    FEATHER_AVAILABLE = False
+
+
+class TTLCache:
+    """Thread-safe in-memory cache whose entries expire after a fixed time-to-live."""
+    
+    def __init__(self, maxsize: int = 64, ttl: float = 300):
+        """
+        Initialize the in-memory cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept (least recently used are evicted first)
+            ttl: Default time-to-live for entries, in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._inflight: Dict[Hashable, tuple] = {}  # key -> (future, forced)
+        self._lock = threading.Lock()
+    
+    def contains(self, key: Hashable) -> bool:
+        """Check whether a key is present and has not expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and time.monotonic() < entry[0]
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Retrieve a value if it is present and has not expired.
+        
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+            
+        Returns:
+            Cached value, or default if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Optional time-to-live override, in seconds
+        """
+        with self._lock:
+            self._set_locked(key, value, ttl)
+    
+    def _set_locked(self, key: Hashable, value: Any, ttl: Optional[float]) -> None:
+        """Store a value; the caller must hold the lock."""
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any], force: bool = False,
+                       ttl: Union[float, Callable[[Any], float], None] = None) -> Any:
+        """
+        Retrieve a value, computing and storing it on a miss.
+        Concurrent misses for the same key are coalesced: only the first caller runs
+        compute, the others wait for and share its result (or exception). A forced call
+        never joins a non-forced compute (which may return the data being refreshed): it
+        starts its own, and the superseded compute's result is not stored.
+        
+        Args:
+            key: Cache key
+            compute: Zero-argument callable producing the value
+            force: If True, ignore any cached value and recompute
+            ttl: Optional time-to-live override, in seconds, or a callable computing it from the value
+            
+        Returns:
+            Cached or freshly computed value
+        """
+        with self._lock:
+            if not force:
+                entry = self._entries.get(key)
+                if entry is not None and time.monotonic() < entry[0]:
+                    self._entries.move_to_end(key)
+                    return entry[1]
+            inflight = self._inflight.get(key)
+            owner = inflight is None or (force and not inflight[1])
+            if owner:
+                future = Future()
+                self._inflight[key] = (future, force)
+            else:
+                future = inflight[0]
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            value = compute()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            expires_in = ttl(value) if callable(ttl) else ttl
+            with self._lock:
+                # Skip the store if a forced refresh superseded this compute
+                inflight = self._inflight.get(key)
+                if inflight is not None and inflight[0] is future:
+                    self._set_locked(key, value, expires_in)
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                inflight = self._inflight.get(key)
+                if inflight is not None and inflight[0] is future:
+                    del self._inflight[key]
+    
+    def pop(self, key: Hashable) -> None:
+        """Remove a single entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Default for RedisCache lookups, so a cached None is not mistaken for a miss
+_MISSING = object()
+
+
+class RedisCache:
+    """
+    Redis-backed cache with the same interface as TTLCache, so several worker
+    processes share one copy of the data. Values are pickled, so only point it
+    at a Redis instance you trust.
+    """
+    
+    def __init__(self, url: str, prefix: str, ttl: float = 300, lock_timeout: float = 120,
+                 poll_interval: float = 0.1):
+        """
+        Initialize the Redis cache.
+        
+        Args:
+            url: Redis URL (e.g., 'redis://localhost:6379/0')
+            prefix: Namespace prepended to every key
+            ttl: Default time-to-live for entries, in seconds
+            lock_timeout: Seconds after which an abandoned compute lock expires
+            poll_interval: Seconds between checks while another process computes a value
+        """
+        if not REDIS_AVAILABLE:
+            raise ImportError("redis is required for RedisCache. Install it with: pip install redis")
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+    
+    def _key(self, key: Hashable) -> str:
+        """Build the Redis key for a cache key (tuples are joined with ':')."""
+        if isinstance(key, tuple):
+            key = ':'.join(str(part) for part in key)
+        return f"{self.prefix}:{key}"
+    
+    def contains(self, key: Hashable) -> bool:
+        """Check whether a key is present and has not expired."""
+        return bool(self.client.exists(self._key(key)))
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Retrieve a value if it is present and has not expired.
+        
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+            
+        Returns:
+            Cached value, or default if missing or expired
+        """
+        raw = self.client.get(self._key(key))
+        if raw is None:
+            return default
+        try:
+            return pickle.loads(raw)
+        except Exception:
+            return default
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+        
+        Args:
+            key: Cache key
+            value: Value to cache (must be picklable)
+            ttl: Optional time-to-live override, in seconds
+        """
+        expires_in = max(1, int(self.ttl if ttl is None else ttl))
+        self.client.set(self._key(key), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), ex=expires_in)
+    
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any], force: bool = False,
+                       ttl: Union[float, Callable[[Any], float], None] = None) -> Any:
+        """
+        Retrieve a value, computing and storing it on a miss.
+        Concurrent misses across processes are coalesced with a SET NX lock: only the
+        lock holder runs compute, the others wait for it to finish and read its result.
+        A forced call never waits on a non-forced compute (which may return the data being
+        refreshed): it takes over the lock, and the superseded compute's result is not stored.
+        
+        Args:
+            key: Cache key
+            compute: Zero-argument callable producing the value
+            force: If True, ignore any cached value and recompute
+            ttl: Optional time-to-live override, in seconds, or a callable computing it from the value
+            
+        Returns:
+            Cached or freshly computed value
+        """
+        if not force:
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+        
+        lock_key = self._key(key) + ':lock'
+        lock_expires_in = max(1, int(self.lock_timeout))
+        # The lock value records whether its holder is a forced refresh
+        token = (b'F' if force else b'N') + os.urandom(16)
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            acquired = self.client.set(lock_key, token, nx=True, ex=lock_expires_in)
+            if not acquired and force:
+                holder = self.client.get(lock_key)
+                if holder is None:
+                    # Released in the meantime; try to take it again
+                    continue
+                if not holder.startswith(b'F'):
+                    self.client.set(lock_key, token, ex=lock_expires_in)
+                    acquired = True
+            if acquired:
+                try:
+                    value = compute()
+                    self._set_if_lock_held(key, lock_key, token, value, ttl(value) if callable(ttl) else ttl)
+                    return value
+                finally:
+                    # Release only our own lock (it may have expired and been taken over)
+                    if self.client.get(lock_key) == token:
+                        self.client.delete(lock_key)
+            
+            # Another process is computing; wait for it to finish, then use its result
+            while self.client.exists(lock_key) and time.monotonic() < deadline:
+                time.sleep(self.poll_interval)
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            if time.monotonic() >= deadline:
+                # The other process failed or stalled; compute without the lock
+                value = compute()
+                self.set(key, value, ttl(value) if callable(ttl) else ttl)
+                return value
+    
+    def _set_if_lock_held(self, key: Hashable, lock_key: str, token: bytes, value: Any,
+                          ttl: Optional[float]) -> None:
+        """
+        Store a value only while still holding the compute lock, so a compute superseded
+        by a forced refresh (or outliving its lock) cannot overwrite a newer value.
+        
+        Args:
+            key: Cache key
+            lock_key: Redis key of the compute lock
+            token: Lock value written by this caller
+            value: Value to cache (must be picklable)
+            ttl: Optional time-to-live override, in seconds
+        """
+        expires_in = max(1, int(self.ttl if ttl is None else ttl))
+        with self.client.pipeline() as pipe:
+            try:
+                pipe.watch(lock_key)
+                if pipe.get(lock_key) != token:
+                    return
+                pipe.multi()
+                pipe.set(self._key(key), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), ex=expires_in)
+                pipe.execute()
+            except redis.WatchError:
+                # The lock changed hands between the check and the write
+                pass
+    
+    def pop(self, key: Hashable) -> None:
+        """Remove a single entry if present."""
+        self.client.delete(self._key(key))
+    
+    def clear(self) -> None:
+        """Remove all entries under this cache's prefix."""
+        keys = list(self.client.scan_iter(match=f"{self.prefix}:*"))
+        if keys:
+            self.client.delete(*keys)
+
 
 class CacheManager:
     """Manages local caching of fantasy league data."""
     
     CACHE_DIR = "yahoo_fantasy_cache"
+    # DataFrames are stored as Feather (fastest to read) when pyarrow is installed, pickle otherwise
+    DATAFRAME_EXT = ".feather" if FEATHER_AVAILABLE else ".pkl"
+    # Length of the league key hash that prefixes every cache filename
+    HASH_LENGTH = 8
     
     def __init__(self, cache_dir: str = None):
         """
@@ -40,11 +374,44 @@ class CacheManager:
         Returns:
             str: Cache key (sanitized filename)
         """
-        # Create a hash of the league_key to avoid filesystem issues
-        key_hash = hashlib.md5(league_key.encode()).hexdigest()[:8]
-        # Sanitize data_type
-        safe_data_type = data_type.replace('/', '_').replace('\\', '_')
-        return f"{key_hash}_{safe_data_type}.json"
+        return f"{self._hash_league_key(league_key)}_{self._sanitize_data_type(data_type)}.json"
+    
+    @staticmethod
+    def _hash_league_key(league_key: str) -> str:
+        """Hash a league key into the fixed-length filename prefix used for its cache files."""
+        # Create a hash of the league_key to avoid filesystem issues (BLAKE2 is faster than MD5
+        # and isn't flagged by security scanners; this hash only needs to be stable, not secure)
+        return hashlib.blake2b(league_key.encode(), digest_size=CacheManager.HASH_LENGTH // 2).hexdigest()
+    
+    @staticmethod
+    def _legacy_hash_league_key(league_key: str) -> str:
+        """Hash a league key the way cache files were named before the switch to BLAKE2."""
+        return hashlib.md5(league_key.encode()).hexdigest()[:CacheManager.HASH_LENGTH]
+    
+    def _migrate_legacy_file(self, league_key: str, path: str) -> bool:
+        """
+        Rename a cache file written under the legacy MD5 filename to its current name.
+        
+        Args:
+            league_key: League key
+            path: Current path of the cache file
+            
+        Returns:
+            bool: True if a legacy file was found and renamed, False otherwise
+        """
+        filename = os.path.basename(path)
+        legacy_path = os.path.join(self.cache_dir,
+                                   self._legacy_hash_league_key(league_key) + filename[self.HASH_LENGTH:])
+        try:
+            os.replace(legacy_path, path)
+            return True
+        except OSError:
+            return False
+    
+    @staticmethod
+    def _sanitize_data_type(data_type: str) -> str:
+        """Make a data type safe to use in a filename."""
+        return data_type.replace('/', '_').replace('\\', '_')
     
     def _get_cache_path(self, league_key: str, data_type: str) -> str:
         """
@@ -60,32 +427,35 @@ class CacheManager:
         cache_key = self._get_cache_key(league_key, data_type)
         return os.path.join(self.cache_dir, cache_key)
     
-    def get(self, league_key: str, data_type: str) -> Optional[Any]:
+    def get(self, league_key: str, data_type: str, max_age: Optional[float] = None) -> Optional[Any]:
         """
         Retrieve data from cache.
         
         Args:
             league_key: League key
             data_type: Type of data to retrieve
+            max_age: Optional maximum age of the cache file, in seconds
             
         Returns:
             Cached data if available, None otherwise
         """
         cache_path = self._get_cache_path(league_key, data_type)
         
-        if not os.path.exists(cache_path):
-            return None
+        if not self._is_fresh(cache_path, max_age):
+            if not (self._migrate_legacy_file(league_key, cache_path) and self._is_fresh(cache_path, max_age)):
+                return None
         
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            with open(cache_path, 'rb') as f:
+                raw = f.read()
+            cache_data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
             
             # Check if cache is valid (has data and timestamp)
             if 'data' in cache_data and 'cached_at' in cache_data:
                 return cache_data['data']
             
             return None
-        except (json.JSONDecodeError, IOError, Exception) as e:
+        except (ValueError, IOError, Exception) as e:
             # If cache is corrupted, return None
             return None
     
@@ -111,14 +481,122 @@ class CacheManager:
                 'data': data
             }
             
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2, default=str)
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(cache_data, default=str,
+                                       option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+            else:
+                payload = json.dumps(cache_data, default=str).encode('utf-8')
+            
+            # Write a temp file and swap it in, so concurrent readers never see a partial file
+            tmp_path = self._get_tmp_path(cache_path)
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                self._remove_quietly(tmp_path)
+                raise
             
             return True
         except (TypeError, IOError, Exception) as e:
             # If data can't be serialized or file can't be written, return False
             return False
     
+    @staticmethod
+    def _get_tmp_path(path: str) -> str:
+        """Get a per-process, per-thread temp path next to a cache file (keeping its extension)."""
+        root, ext = os.path.splitext(path)
+        return f"{root}.{os.getpid()}.{threading.get_ident()}.tmp{ext}"
+    
+    @staticmethod
+    def _remove_quietly(path: str) -> None:
+        """Remove a file, ignoring errors (e.g. if it was never created)."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
+    def _get_dataframe_path(self, league_key: str, data_type: str) -> str:
+        """
+        Get the full path to a DataFrame cache file.
+        
+        Args:
+            league_key: League key
+            data_type: Type of data
+            
+        Returns:
+            str: Full path to cache file
+        """
+        cache_path = self._get_cache_path(league_key, data_type)
+        return cache_path[:-len('.json')] + self.DATAFRAME_EXT
+    
+    @staticmethod
+    def _is_fresh(path: str, max_age: Optional[float]) -> bool:
+        """Check that a cache file exists and, if max_age is given, is at most max_age seconds old."""
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return False
+        return max_age is None or time.time() - mtime <= max_age
+    
+    def get_dataframe(self, league_key: str, data_type: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """
+        Retrieve a DataFrame from cache.
+        
+        Args:
+            league_key: League key
+            data_type: Type of data to retrieve
+            max_age: Optional maximum age of the cache file, in seconds
+            
+        Returns:
+            DataFrame if cached (and fresh), None otherwise
+        """
+        if not PANDAS_AVAILABLE:
+            return None
+        
+        cache_path = self._get_dataframe_path(league_key, data_type)
+        if not self._is_fresh(cache_path, max_age):
+            if not (self._migrate_legacy_file(league_key, cache_path) and self._is_fresh(cache_path, max_age)):
+                return None
+        
+        try:
+            if FEATHER_AVAILABLE:
+                return pd.read_feather(cache_path)
+            return pd.read_pickle(cache_path)
+        except Exception:
+            # If cache is corrupted, return None
+            return None
+    
+    def set_dataframe(self, league_key: str, data_type: str, df: Any) -> bool:
+        """
+        Store a DataFrame in cache.
+        
+        Args:
+            league_key: League key
+            data_type: Type of data
+            df: DataFrame to cache
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not PANDAS_AVAILABLE or df is None:
+            return False
+        
+        cache_path = self._get_dataframe_path(league_key, data_type)
+        tmp_path = self._get_tmp_path(cache_path)
+        
+        try:
+            if FEATHER_AVAILABLE:
+                # Feather only supports a default RangeIndex
+                df.reset_index(drop=True).to_feather(tmp_path)
+            else:
+                df.to_pickle(tmp_path)
+            os.replace(tmp_path, cache_path)
+            return True
+        except Exception:
+            self._remove_quietly(tmp_path)
+            return False
+    
     def is_cached(self, league_key: str, data_type: str) -> bool:
         """
         Check if data is cached.
@@ -147,39 +625,45 @@ class CacheManager:
         deleted = 0
         
         if league_key and data_type:
-            # Clear specific cache entry
-            cache_path = self._get_cache_path(league_key, data_type)
-            if os.path.exists(cache_path):
-                try:
-                    os.remove(cache_path)
-                    deleted = 1
-                except:
-                    pass
-        else:
-            # Clear all or filtered cache entries
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(self.cache_dir, filename)
+            # Clear specific cache entry (under its current and legacy filenames)
+            for cache_path in (self._get_cache_path(league_key, data_type),
+                               self._get_dataframe_path(league_key, data_type)):
+                legacy_path = os.path.join(self.cache_dir, self._legacy_hash_league_key(league_key)
+                                           + os.path.basename(cache_path)[self.HASH_LENGTH:])
+                for path in (cache_path, legacy_path):
+                    # Just try the removal; a separate exists() check would cost another stat call
                     try:
-                        # If filtering by league_key, check the file
-                        if league_key:
-                            with open(file_path, 'r') as f:
-                                cache_data = json.load(f)
-                                if cache_data.get('league_key') == league_key:
-                                    os.remove(file_path)
-                                    deleted += 1
-                        elif data_type:
-                            with open(file_path, 'r') as f:
-                                cache_data = json.load(f)
-                                if cache_data.get('data_type') == data_type:
-                                    os.remove(file_path)
-                                    deleted += 1
-                        else:
-                            # Clear all
-                            os.remove(file_path)
+                        os.remove(path)
+                        deleted += 1
+                    except OSError:
+                        pass
+        elif league_key or data_type:
+            # Filenames encode both filters (<league hash>_<data type>.<ext>, the hash always
+            # HASH_LENGTH characters), so glob for the matching files instead of opening each one
+            if league_key:
+                key_parts = (self._hash_league_key(league_key), self._legacy_hash_league_key(league_key))
+            else:
+                key_parts = ('?' * self.HASH_LENGTH,)
+            type_part = glob.escape(self._sanitize_data_type(data_type)) if data_type else '*'
+            patterns = [os.path.join(glob.escape(self.cache_dir), f"{key_part}_{type_part}{ext}")
+                        for key_part in key_parts for ext in ('.json', self.DATAFRAME_EXT)]
+            for pattern in patterns:
+                for file_path in glob.glob(pattern):
+                    try:
+                        os.remove(file_path)
+                        deleted += 1
+                    except OSError:
+                        pass
+        else:
+            # Clear all cache entries (scandir yields full paths and cached file types, no extra stat calls)
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(('.json', self.DATAFRAME_EXT)) and entry.is_file():
+                        try:
+                            os.remove(entry.path)
                             deleted += 1
-                    except:
-                        continue
+                        except OSError:
+                            pass
         
         return deleted
     
@@ -196,39 +680,55 @@ class CacheManager:
         if not league_info:
             return False
         
-        # Get current year
-        current_year = datetime.now().year
-        current_month = datetime.now().month
-        
-        # Get season from league info
-        season = league_info.get('season')
-        if not season:
-            return False
+        # Prior-season status only depends on these fields and today's date, so memoize on them
+        return _is_prior_season_cached(league_info.get('season'), league_info.get('current_week'),
+                                       league_info.get('end_week'), date.today().toordinal())
+
+
+@lru_cache(maxsize=256)
+def _is_prior_season_cached(season: Any, current_week: Any, end_week: Any, day_ordinal: int) -> bool:
+    """
+    Determine if a league is from a prior (completed) season (memoized; use CacheManager.is_prior_season).
+    
+    Args:
+        season: League season (e.g., '2023')
+        current_week: League's current week
+        end_week: League's last week
+        day_ordinal: Today's date as a proleptic Gregorian ordinal, so results expire daily
         
+    Returns:
+        bool: True if prior season, False if current season
+    """
+    # Get current year
+    today = date.fromordinal(day_ordinal)
+    current_year = today.year
+    current_month = today.month
+    
+    # Get season from league info
+    if not season:
+        return False
+    
+    try:
+        season_year = int(season)
+    except (ValueError, TypeError):
+        return False
+    
+    # NFL season typically ends in January/February
+    # If we're past February and the season is from last year, it's a prior season
+    # If season is more than 1 year old, it's definitely prior
+    if season_year < current_year - 1:
+        return True
+    
+    if season_year == current_year - 1 and current_month > 2:
+        return True
+    
+    # Check if season has ended (current_week >= end_week)
+    if current_week and end_week:
         try:
-            season_year = int(season)
+            if int(current_week) >= int(end_week):
+                return True
         except (ValueError, TypeError):
-            return False
-        
-        # NFL season typically ends in January/February
-        # If we're past February and the season is from last year, it's a prior season
-        # If season is more than 1 year old, it's definitely prior
-        if season_year < current_year - 1:
-            return True
-        
-        if season_year == current_year - 1 and current_month > 2:
-            return True
-        
-        # Check if season has ended (current_week >= end_week)
-        current_week = league_info.get('current_week')
-        end_week = league_info.get('end_week')
-        
-        if current_week and end_week:
-            try:
-                if int(current_week) >= int(end_week):
-                    return True
-            except (ValueError, TypeError):
-                pass
-        
-        return False
+            pass
+    
+    return False
 
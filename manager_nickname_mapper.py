@@ -8,16 +8,53 @@ Author: Braedon Giblin
 """
 
 import csv
+import io
 import os
-from typing import Dict, Optional
+import pickle
+import sys
+import threading
+from typing import Dict, Iterator, List, Optional
 import logging
 
+# Shared empty inner mapping for lookups in leagues without any mappings (never mutated)
+_EMPTY: Dict[str, str] = {}
+
+# Current nicknames that apply_mapping replaces with a mapped one
+_UNMAPPED_NICKNAMES = frozenset({"--hidden--", "N/A", "", None})
+
 
 class ManagerNicknameMapper:
     """Maps team names to manager nicknames using a CSV file."""
     
     CSV_FILE = "manager_nicknames.csv"
     CSV_COLUMNS = ['team_name', 'league_key', 'season', 'manager_nickname']
+    _CSV_COLUMNS_SET = frozenset(CSV_COLUMNS)  # For header validation
+    # Superseded rows tolerated in the append-only CSV before it is compacted
+    COMPACT_MIN_STALE_ROWS = 50
+    
+    # Last parse of each CSV file, shared by all instances:
+    # abspath -> (mtime_ns, size, mappings, mapping count, stale rows)
+    _parsed: Dict[str, tuple] = {}
+    _parsed_lock = threading.Lock()
+    
+    # Shared instance for the default CSV file (see get_default)
+    _default: Optional['ManagerNicknameMapper'] = None
+    _default_lock = threading.Lock()
+    
+    @classmethod
+    def get_default(cls) -> 'ManagerNicknameMapper':
+        """
+        Get the process-wide mapper for the default CSV file, creating it on first use.
+        Sharing one instance avoids reloading the file and keeps every caller's view of
+        auto-added mappings consistent.
+        
+        Returns:
+            ManagerNicknameMapper: Shared mapper instance
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
     
     def __init__(self, csv_file: str = None):
         """
@@ -27,7 +64,14 @@ class ManagerNicknameMapper:
             csv_file: Optional custom CSV file path (default: manager_nicknames.csv)
         """
         self.csv_file = csv_file or self.CSV_FILE
-        self.mappings: Dict[str, str] = {}  # Key: (team_name, league_key, season), Value: manager_nickname
+        # Key: (league_key, season), Value: {team_name: manager_nickname}
+        self.mappings: Dict[tuple, Dict[str, str]] = {}
+        self._mapping_count = 0  # Total team mappings across all leagues
+        self._lock = threading.Lock()  # Guards updates and CSV writes from concurrent API fetches
+        self._stale_rows = 0  # Rows in the CSV superseded by a later row for the same key
+        self._pending: List[tuple] = []  # Auto-added rows not yet written (see flush)
+        self._batch_depth = 0  # Open `with mapper:` blocks; rows are buffered while any is open
+        self._file_state: Optional[tuple] = None  # (mtime_ns, size) of the CSV after our last read or write
         self._load_mappings()
     
     def _get_key(self, team_name: str, league_key: str, season: str) -> tuple:
@@ -42,45 +86,133 @@ class ManagerNicknameMapper:
         Returns:
             tuple: (team_name, league_key, season)
         """
+        # Values from the API and the CSV are already strings, so skip the str() conversions for them
+        if type(team_name) is str and type(league_key) is str and type(season) is str:
+            return (team_name.strip(), league_key.strip(), season.strip())
         return (str(team_name).strip(), str(league_key).strip(), str(season).strip())
     
     def _load_mappings(self):
         """Load mappings from CSV file. Creates file if it doesn't exist."""
-        if not os.path.exists(self.csv_file):
+        try:
+            st = os.stat(self.csv_file)
+        except FileNotFoundError:
             # Create empty CSV file with headers
             self._create_csv_file()
+            self._remember_file_state()
+            return
+        self._file_state = (st.st_mtime_ns, st.st_size)
+        
+        # Reuse the mappings parsed by another instance if the file hasn't changed since
+        path = os.path.abspath(self.csv_file)
+        with ManagerNicknameMapper._parsed_lock:
+            parsed = ManagerNicknameMapper._parsed.get(path)
+        if parsed is None or parsed[:2] != (st.st_mtime_ns, st.st_size):
+            # Then try the parse persisted next to the CSV by an earlier run
+            parsed = self._load_sidecar()
+        if parsed is not None and parsed[:2] == (st.st_mtime_ns, st.st_size):
+            _, _, mappings, self._mapping_count, self._stale_rows = parsed
+            self.mappings = {league: teams.copy() for league, teams in mappings.items()}
+            with ManagerNicknameMapper._parsed_lock:
+                ManagerNicknameMapper._parsed[path] = parsed
             return
         
         try:
             with open(self.csv_file, 'r', encoding='utf-8', newline='') as f:
-                reader = csv.DictReader(f)
+                rows = self._read_rows(f)
                 
                 # Verify columns exist
-                if not all(col in reader.fieldnames for col in self.CSV_COLUMNS):
+                if rows is None:
                     logging.warning(f"CSV file {self.csv_file} has incorrect columns. Recreating...")
                     self._create_csv_file()
                     return
                 
-                for row in reader:
-                    team_name = row.get('team_name', '').strip()
-                    league_key = row.get('league_key', '').strip()
-                    season = row.get('season', '').strip()
-                    manager_nickname = row.get('manager_nickname', '').strip()
-                    
+                for team_name, league_key, season, manager_nickname in rows:
                     if team_name and league_key and season and manager_nickname:
-                        key = self._get_key(team_name, league_key, season)
-                        self.mappings[key] = manager_nickname
+                        # _read_rows already stripped the values
+                        if self._store(team_name, league_key, season, manager_nickname) is not None:
+                            self._stale_rows += 1
+            
+            mappings = {league: teams.copy() for league, teams in self.mappings.items()}
+            parsed = (st.st_mtime_ns, st.st_size, mappings, self._mapping_count, self._stale_rows)
+            with ManagerNicknameMapper._parsed_lock:
+                ManagerNicknameMapper._parsed[path] = parsed
+            self._save_sidecar(parsed)
         except Exception as e:
             logging.error(f"Error loading manager nickname mappings: {e}")
             # If file is corrupted, recreate it
             self._create_csv_file()
     
+    def _sidecar_path(self) -> str:
+        """Get the path of the pickle file caching the parsed CSV."""
+        directory, filename = os.path.split(self.csv_file)
+        return os.path.join(directory, f".{filename}.pkl")
+    
+    def _load_sidecar(self) -> Optional[tuple]:
+        """
+        Load the parsed CSV persisted by _save_sidecar.
+        
+        Returns:
+            tuple: (mtime_ns, size, mappings, mapping count, stale rows) of the CSV it was
+                parsed from, or None if missing or unreadable
+        """
+        try:
+            with open(self._sidecar_path(), 'rb') as f:
+                parsed = pickle.load(f)
+            return parsed if isinstance(parsed, tuple) and len(parsed) == 5 else None
+        except Exception:
+            return None
+    
+    def _save_sidecar(self, parsed: tuple) -> None:
+        """Persist a parsed CSV so later runs can skip parsing it while it is unchanged."""
+        sidecar_path = self._sidecar_path()
+        tmp_path = f"{sidecar_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, sidecar_path)
+        except Exception as e:
+            logging.debug(f"Could not write manager nickname cache {sidecar_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    def _read_rows(self, f) -> Optional[Iterator[tuple]]:
+        """
+        Read mapping rows from an open CSV file by column position.
+        
+        Args:
+            f: CSV file opened for reading
+            
+        Returns:
+            iterator: (team_name, league_key, season, manager_nickname) tuples with whitespace
+                stripped, or None if the header is missing any of CSV_COLUMNS. The file is read
+                up front, so the iterator stays usable after it is closed.
+        """
+        text = f.read()
+        if '"' in text:
+            # Quoted fields (e.g. team names containing commas) need the csv module's parser
+            reader = csv.reader(io.StringIO(text))
+        else:
+            # Without quotes every comma is a delimiter, and str.split is several times faster
+            reader = (line.split(',') for line in text.replace('\r\n', '\n').split('\n'))
+        header = next(reader, None)
+        if not header or not self._CSV_COLUMNS_SET.issubset(header):
+            return None
+        
+        # Look up the column positions once instead of building a dict per row
+        indices = [header.index(col) for col in self.CSV_COLUMNS]
+        width = max(indices) + 1
+        team_i, league_i, season_i, nickname_i = indices
+        # Yield rows lazily so a large file is never held as a full list of row tuples
+        return ((row[team_i].strip(), row[league_i].strip(), row[season_i].strip(), row[nickname_i].strip())
+                for row in reader if len(row) >= width)
+    
     def _create_csv_file(self):
         """Create a new CSV file with headers."""
         try:
             with open(self.csv_file, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=self.CSV_COLUMNS)
-                writer.writeheader()
+                csv.writer(f).writerow(self.CSV_COLUMNS)
             logging.info(f"Created manager nickname CSV file: {self.csv_file}")
         except Exception as e:
             logging.error(f"Error creating manager nickname CSV file: {e}")
@@ -97,8 +229,39 @@ class ManagerNicknameMapper:
         Returns:
             str: Manager nickname if found, None otherwise
         """
-        key = self._get_key(team_name, league_key, season)
-        return self.mappings.get(key)
+        team_name, league_key, season = self._get_key(team_name, league_key, season)
+        return self.mappings.get((league_key, season), _EMPTY).get(team_name)
+    
+    def get_all_for_league(self, league_key: str, season: str) -> Dict[str, str]:
+        """
+        Get all mappings for one league and season.
+        
+        Args:
+            league_key: League key
+            season: Season year
+            
+        Returns:
+            dict: Dictionary of team_name -> manager_nickname
+        """
+        _, league_key, season = self._get_key('', league_key, season)
+        return self.mappings.get((league_key, season), _EMPTY).copy()
+    
+    def _store(self, team_name: str, league_key: str, season: str, manager_nickname: str) -> Optional[str]:
+        """Store a mapping from already-normalized key parts, returning the nickname it replaced (if any)."""
+        # Interned so every row of a league shares one key string (and equal keys compare by identity)
+        team_name, league_key, season = sys.intern(team_name), sys.intern(league_key), sys.intern(season)
+        league_mappings = self.mappings.setdefault((league_key, season), {})
+        previous = league_mappings.get(team_name)
+        if previous is None:
+            self._mapping_count += 1
+        league_mappings[team_name] = manager_nickname
+        return previous
+    
+    def _iter_mappings(self):
+        """Yield ((team_name, league_key, season), manager_nickname) for every mapping."""
+        for (league_key, season), league_mappings in self.mappings.items():
+            for team_name, manager_nickname in league_mappings.items():
+                yield (team_name, league_key, season), manager_nickname
     
     def set_manager_nickname(self, team_name: str, league_key: str, season: str, manager_nickname: str) -> bool:
         """
@@ -117,49 +280,134 @@ class ManagerNicknameMapper:
             return False
         
         key = self._get_key(team_name, league_key, season)
-        self.mappings[key] = manager_nickname
+        with self._lock:
+            team, league, year = key
+            if self.mappings.get((league, year), _EMPTY).get(team) == manager_nickname:
+                return True
+            previous = self._store(team, league, year, manager_nickname)
+            
+            # Write buffered rows first so they cannot supersede this one
+            if not self._flush_pending():
+                return False
+            
+            # Append to CSV (on load, the last row for a key wins), compacting once enough rows are stale
+            if not self._append_row(key, manager_nickname):
+                return False
+            if previous is not None:
+                self._stale_rows += 1
+                if self._stale_rows >= max(self.COMPACT_MIN_STALE_ROWS, self._mapping_count // 2):
+                    return self._compact()
+            return True
+    
+    def _append_row(self, key: tuple, manager_nickname: str) -> bool:
+        """Append a single mapping row to the CSV file."""
+        try:
+            unchanged = self._file_unchanged()
+            if not os.path.exists(self.csv_file):
+                self._create_csv_file()
+            with open(self.csv_file, 'a', encoding='utf-8', newline='') as f:
+                team_name, league_key, season = key
+                csv.writer(f).writerow([team_name, league_key, season, manager_nickname])
+            if unchanged:
+                self._remember_file_state()
+            return True
+        except Exception as e:
+            logging.error(f"Error saving manager nickname mapping: {e}")
+            return False
+    
+    def flush(self) -> bool:
+        """
+        Write auto-added mappings buffered by apply_mapping to the CSV file.
         
-        # Save to CSV
-        return self._save_mappings()
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        with self._lock:
+            return self._flush_pending()
     
-    def _save_mappings(self) -> bool:
-        """Save all mappings to CSV file."""
+    def _flush_pending(self) -> bool:
+        """Append all buffered rows to the CSV file in one write (caller holds the lock)."""
+        if not self._pending:
+            return True
         try:
-            # Read existing file to preserve any manually added entries
+            unchanged = self._file_unchanged()
+            if not os.path.exists(self.csv_file):
+                self._create_csv_file()
+            with open(self.csv_file, 'a', encoding='utf-8', newline='') as f:
+                csv.writer(f).writerows(self._pending)
+            self._pending.clear()
+            if unchanged:
+                self._remember_file_state()
+            return True
+        except Exception as e:
+            logging.error(f"Error saving manager nickname mappings: {e}")
+            return False
+    
+    def __enter__(self) -> 'ManagerNicknameMapper':
+        """Buffer auto-added mappings until the outermost `with` block exits."""
+        with self._lock:
+            self._batch_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        with self._lock:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_pending()
+    
+    def _current_file_state(self) -> Optional[tuple]:
+        """Get the CSV file's (mtime_ns, size), or None if it is missing."""
+        try:
+            st = os.stat(self.csv_file)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _remember_file_state(self) -> None:
+        """Record the CSV file's state after our own read or write."""
+        self._file_state = self._current_file_state()
+    
+    def _file_unchanged(self) -> bool:
+        """Check that nobody else has changed the CSV file since our last read or write."""
+        return self._file_state is not None and self._current_file_state() == self._file_state
+    
+    def reload(self) -> None:
+        """Reload mappings from the CSV file, picking up edits made outside this process."""
+        with self._lock:
+            self._flush_pending()
+            self.mappings = {}
+            self._mapping_count = 0
+            self._stale_rows = 0
+            self._load_mappings()
+    
+    def _compact(self) -> bool:
+        """Rewrite the CSV file with one sorted row per mapping, dropping superseded rows."""
+        try:
+            # Re-read the file to preserve manually added entries, but only if someone else
+            # changed it since our last read or write; otherwise self.mappings is already complete
             existing_rows = []
-            if os.path.exists(self.csv_file):
+            if not self._file_unchanged() and os.path.exists(self.csv_file):
                 with open(self.csv_file, 'r', encoding='utf-8', newline='') as f:
-                    reader = csv.DictReader(f)
-                    if reader.fieldnames and all(col in reader.fieldnames for col in self.CSV_COLUMNS):
-                        existing_rows = [row for row in reader]
+                    existing_rows = self._read_rows(f) or []
             
-            # Merge with current mappings
-            merged_mappings = {}
-            for row in existing_rows:
-                key = self._get_key(
-                    row.get('team_name', '').strip(),
-                    row.get('league_key', '').strip(),
-                    row.get('season', '').strip()
-                )
-                merged_mappings[key] = row.get('manager_nickname', '').strip()
-            
-            # Update with current mappings
-            merged_mappings.update(self.mappings)
+            # Merge entries added to the file into the current mappings (current mappings win),
+            # so later compactions that skip the re-read still keep them
+            for team_name, league_key, season, manager_nickname in existing_rows:
+                if team_name and league_key and season and manager_nickname:
+                    if self.mappings.get((league_key, season), _EMPTY).get(team_name) is None:
+                        self._store(team_name, league_key, season, manager_nickname)
             
             # Write back to file
+            # Sorted (compaction is rare) so the hand-edited file stays easy to scan and diff
+            rows = sorted((team_name, league_key, season, nickname)
+                          for (team_name, league_key, season), nickname in self._iter_mappings())
             with open(self.csv_file, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=self.CSV_COLUMNS)
-                writer.writeheader()
-                
-                for key, nickname in sorted(merged_mappings.items()):
-                    team_name, league_key, season = key
-                    writer.writerow({
-                        'team_name': team_name,
-                        'league_key': league_key,
-                        'season': season,
-                        'manager_nickname': nickname
-                    })
+                writer = csv.writer(f)
+                writer.writerow(self.CSV_COLUMNS)
+                writer.writerows(rows)
             
+            self._stale_rows = 0
+            self._remember_file_state()
             return True
         except Exception as e:
             logging.error(f"Error saving manager nickname mappings: {e}")
@@ -179,19 +427,60 @@ class ManagerNicknameMapper:
         Returns:
             str: Mapped nickname if available, "FIXME" if auto-added, otherwise current nickname
         """
-        if current_nickname == "--hidden--" or not current_nickname or current_nickname == "N/A":
+        if current_nickname in _UNMAPPED_NICKNAMES:
             mapped = self.get_manager_nickname(team_name, league_key, season)
             if mapped:
                 return mapped
             
             # If not found and nickname is "--hidden--", add to CSV with "FIXME"
             if current_nickname == "--hidden--" and team_name and team_name != 'N/A' and league_key and season:
-                # Add entry with FIXME as default
-                self.set_manager_nickname(team_name, league_key, season, "FIXME")
-                return "FIXME"
+                # Add entry with FIXME as default (buffered until flush inside a `with mapper:` block)
+                key = self._get_key(team_name, league_key, season)
+                team, league, year = key
+                with self._lock:
+                    existing = self.mappings.get((league, year), _EMPTY).get(team)
+                    if existing is not None:
+                        return existing
+                    self._store(team, league, year, "FIXME")
+                    if self._batch_depth:
+                        self._pending.append((*key, "FIXME"))
+                    else:
+                        self._append_row(key, "FIXME")
+                    return "FIXME"
         
         return current_nickname
     
+    def apply_mapping_batch(self, rows: List[tuple]) -> List[str]:
+        """
+        Apply apply_mapping to many rows at once, writing any auto-added entries in one go.
+        
+        Args:
+            rows: (team_name, league_key, season, current_nickname) tuples
+            
+        Returns:
+            list: Resulting nickname for each row, in order
+        """
+        results = []
+        mappings = self.mappings
+        # Rows usually all belong to one league, so resolve its mappings once rather than per row
+        league_season = None
+        league_mappings = _EMPTY
+        with self:
+            for team_name, league_key, season, current_nickname in rows:
+                if current_nickname in _UNMAPPED_NICKNAMES:
+                    # Inline lookup for the common case of an existing mapping
+                    team, league, year = self._get_key(team_name, league_key, season)
+                    if (league, year) != league_season:
+                        league_season = (league, year)
+                        league_mappings = mappings.get(league_season, _EMPTY)
+                    mapped = league_mappings.get(team)
+                    if not mapped:
+                        mapped = self.apply_mapping(team_name, league_key, season, current_nickname)
+                    results.append(mapped)
+                else:
+                    results.append(current_nickname)
+        return results
+    
     def get_all_mappings(self) -> Dict[tuple, str]:
         """
         Get all current mappings.
@@ -199,5 +488,5 @@ class ManagerNicknameMapper:
         Returns:
             dict: Dictionary of (team_name, league_key, season) -> manager_nickname
         """
-        return self.mappings.copy()
+        return dict(self._iter_mappings())
 
@@ -3,10 +3,23 @@ OAuth 2.0 flow implementation for Yahoo Fantasy Sports API using requests-oauthl
 """
 import os
 import json
+import logging
+import threading
+import time
 import webbrowser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from requests_oauthlib import OAuth2Session
 from oauthlib.oauth2.rfc6749.errors import OAuth2Error
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 
 class YahooOAuth:
     """Handles OAuth 2.0 authentication flow for Yahoo Fantasy Sports API."""
@@ -15,6 +28,19 @@ class YahooOAuth:
     AUTHORIZATION_BASE_URL = "https://api.login.yahoo.com/oauth2/request_auth"
     TOKEN_URL = "https://api.login.yahoo.com/oauth2/get_token"
     
+    # Connection pool of the shared session (sized for the app's concurrent API fetches)
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 8
+    
+    # Retries for transient server errors on idempotent requests. Rate limiting (429) is not
+    # retried: a sub-second backoff would only spend more of the quota, so the response is
+    # returned as-is. Retry-After (also sent with 503) is ignored so a large value cannot stall
+    # a fetch thread; the backoff sleeps 0, 0.6 and 1.2s. Worst case, a request makes 4 attempts,
+    # each bounded by the API client's timeouts (5s connect, 30s read), plus 1.8s of backoff.
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF_FACTOR = 0.3
+    RETRY_STATUS_CODES = (500, 502, 503, 504)
+    
     def __init__(self, client_id, client_secret, redirect_uri="oob", scope=None, token_file="oauth_tokens.json"):
         """
         Initialize Yahoo OAuth 2.0 client.
@@ -35,6 +61,34 @@ class YahooOAuth:
         self.token = None
         self.access_token = None
         self.refresh_token = None
+        # Serializes refreshes between request threads and the background refresher
+        self._refresh_lock = threading.RLock()
+    
+    def _get_session(self):
+        """
+        Get the OAuth2Session shared by the auth flow, token refreshes and API requests,
+        creating it on first use. Reusing one session keeps HTTPS connections alive
+        instead of paying a new TLS handshake for every refresh.
+        
+        Returns:
+            OAuth2Session: Shared session
+        """
+        if self.oauth_session is None:
+            session = OAuth2Session(
+                self.client_id,
+                redirect_uri=self.redirect_uri,
+                scope=self.scope
+            )
+            # Status retries only apply to idempotent methods, so token POSTs are never resent.
+            # The last response is returned rather than raised, so callers still see its status.
+            retries = Retry(total=self.RETRY_TOTAL, backoff_factor=self.RETRY_BACKOFF_FACTOR,
+                            status_forcelist=self.RETRY_STATUS_CODES, raise_on_status=False,
+                            respect_retry_after_header=False)
+            adapter = HTTPAdapter(pool_connections=self.POOL_CONNECTIONS, pool_maxsize=self.POOL_MAXSIZE,
+                                  max_retries=retries)
+            session.mount('https://', adapter)
+            self.oauth_session = session
+        return self.oauth_session
     
     def get_authorization_url(self):
         """
@@ -43,11 +97,7 @@ class YahooOAuth:
         Returns:
             str: Authorization URL
         """
-        oauth = OAuth2Session(
-            self.client_id,
-            redirect_uri=self.redirect_uri,
-            scope=self.scope
-        )
+        oauth = self._get_session()
         
         authorization_url, state = oauth.authorization_url(
             self.AUTHORIZATION_BASE_URL
@@ -80,10 +130,7 @@ class YahooOAuth:
         Returns:
             dict: Token dictionary containing access_token, refresh_token, etc.
         """
-        oauth = OAuth2Session(
-            self.client_id,
-            redirect_uri=self.redirect_uri
-        )
+        oauth = self._get_session()
         
         try:
             self.token = oauth.fetch_token(
@@ -101,13 +148,13 @@ class YahooOAuth:
     
     def create_authenticated_session(self, token=None):
         """
-        Create an authenticated OAuth 2.0 session for making API requests.
+        Authenticate the shared OAuth 2.0 session for making API requests.
         
         Args:
             token: Optional token dictionary. If not provided, uses stored token.
         
         Returns:
-            OAuth2Session: Authenticated session
+            OAuth2Session: Authenticated session (the same instance on every call)
         """
         if token:
             self.token = token
@@ -117,12 +164,10 @@ class YahooOAuth:
         if not self.token or not self.access_token:
             raise Exception("Access token not obtained. Complete OAuth flow first.")
         
-        self.oauth_session = OAuth2Session(
-            self.client_id,
-            token=self.token
-        )
+        oauth = self._get_session()
+        oauth.token = self.token
         
-        return self.oauth_session
+        return oauth
     
     def refresh_access_token(self):
         """
@@ -134,22 +179,55 @@ class YahooOAuth:
         if not self.refresh_token:
             raise Exception("No refresh token available. Complete OAuth flow first.")
         
-        oauth = OAuth2Session(self.client_id, token=self.token)
-        
-        try:
-            self.token = oauth.refresh_token(
-                self.TOKEN_URL,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-                refresh_token=self.refresh_token
-            )
+        with self._refresh_lock:
+            oauth = self._get_session()
+            if self.token:
+                oauth.token = self.token
             
-            self.access_token = self.token.get('access_token')
-            self.refresh_token = self.token.get('refresh_token', self.refresh_token)
+            try:
+                self.token = oauth.refresh_token(
+                    self.TOKEN_URL,
+                    client_id=self.client_id,
+                    client_secret=self.client_secret,
+                    refresh_token=self.refresh_token
+                )
+                
+                self.access_token = self.token.get('access_token')
+                self.refresh_token = self.token.get('refresh_token', self.refresh_token)
+                
+                return self.token
+            except OAuth2Error as e:
+                raise Exception(f"Failed to refresh access token: {e}")
+    
+    def token_expires_in(self):
+        """
+        Get the number of seconds until the access token expires.
+        
+        Returns:
+            float: Seconds until expiry (negative if expired), or None if unknown
+        """
+        expires_at = self.token.get('expires_at') if self.token else None
+        if expires_at is None:
+            return None
+        return float(expires_at) - time.time()
+    
+    def refresh_if_expiring(self, margin=120):
+        """
+        Refresh and save the access token if it expires within the given margin.
+        
+        Args:
+            margin: Seconds before expiry at which the token is refreshed
             
-            return self.token
-        except OAuth2Error as e:
-            raise Exception(f"Failed to refresh access token: {e}")
+        Returns:
+            bool: True if the token was refreshed, False otherwise
+        """
+        with self._refresh_lock:
+            expires_in = self.token_expires_in()
+            if expires_in is None or expires_in > margin or not self.refresh_token:
+                return False
+            self.refresh_access_token()
+            self.save_tokens()
+            return True
     
     def load_tokens(self):
         """
@@ -159,20 +237,25 @@ class YahooOAuth:
             bool: True if tokens loaded successfully, False otherwise
         """
         try:
-            if not os.path.exists(self.token_file):
+            try:
+                with open(self.token_file, 'rb') as f:
+                    data = f.read()
+                    written_at = os.fstat(f.fileno()).st_mtime
+            except FileNotFoundError:
                 return False
-            
-            with open(self.token_file, 'r') as f:
-                token = json.load(f)
+            token = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
             
             if token and token.get('access_token'):
+                # Tokens saved without an absolute expiry: estimate it from when the file was written
+                if 'expires_at' not in token and token.get('expires_in'):
+                    token['expires_at'] = written_at + float(token['expires_in'])
                 self.token = token
                 self.access_token = token.get('access_token')
                 self.refresh_token = token.get('refresh_token')
                 return True
             return False
         except Exception as e:
-            print(f"Error loading tokens: {e}")
+            logger.error("Error loading tokens: %s", e)
             return False
     
     def save_tokens(self):
@@ -188,9 +271,17 @@ class YahooOAuth:
                     'token_type': 'Bearer'
                 }
             
-            with open(self.token_file, 'w') as f:
-                json.dump(self.token, f, indent=2)
-            print(f"✓ Tokens saved to {self.token_file}")
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(self.token, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.token, indent=2).encode('utf-8')
+            
+            # Write a temp file and swap it in, so a crash mid-write cannot leave a truncated token file
+            tmp_file = f"{self.token_file}.{os.getpid()}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.token_file)
+            logger.debug("Tokens saved to %s", self.token_file)
         except Exception as e:
-            print(f"Error saving tokens: {e}")
+            logger.error("Error saving tokens: %s", e)
 
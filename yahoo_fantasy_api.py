@@ -7,9 +7,15 @@ including API calls and data parsing functions.
 Author: Braedon Giblin
 """
 
+import hashlib
 import json
+import logging
 import os
-from typing import Dict, List, Optional, Any
+import re
+import threading
+from contextlib import nullcontext
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 try:
     import pandas as pd
     PANDAS_AVAILABLE = True
@@ -19,11 +25,12 @@ except ImportError:
 
 # Import cache manager if available
 try:
-    from cache_manager import CacheManager
+    from cache_manager import CacheManager, TTLCache
     CACHE_AVAILABLE = True
 except ImportError:
     CACHE_AVAILABLE = False
     CacheManager = None
+    TTLCache = None
 
 # Import manager nickname mapper if available
 try:
@@ -33,6 +40,14 @@ except ImportError:
     NICKNAME_MAPPER_AVAILABLE = False
     ManagerNicknameMapper = None
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 
 class YahooFantasyAPI:
     """
@@ -43,6 +58,26 @@ class YahooFantasyAPI:
     """
     
     BASE_URL = "https://fantasysports.yahooapis.com/fantasy/v2"
+    # (connect, read) timeouts in seconds, so a stalled connection cannot hold a fetch thread forever
+    REQUEST_TIMEOUT = (5, 30)
+    # Error messages that indicate an expired or rejected access token
+    TOKEN_ERROR_PATTERN = re.compile(r'token.*expired|expired.*token|unauthorized|401', re.IGNORECASE | re.DOTALL)
+    # Transaction types counted as roster moves (trades are counted separately)
+    MOVE_TRANSACTION_TYPES = frozenset({'add', 'drop', 'add/drop'})
+    # Manager nicknames that need a mapping from the nickname CSV (NaN is treated the same)
+    UNMAPPED_NICKNAMES = frozenset({'--hidden--', 'N/A', '', None})
+    # Team names that cannot be looked up in the nickname CSV
+    INVALID_TEAM_NAMES = frozenset({'N/A', '', None})
+    # Short-lived in-memory memo of league lookups repeated by several reports in one burst
+    MEMO_TTL = 60  # seconds
+    PRIOR_SEASON_MEMO_TTL = 3600  # seconds; finished seasons no longer change
+    MEMO_MAXSIZE = 256
+    # Parsed responses reused when Yahoo returns a byte-identical body (see _parse_response_cached)
+    PARSE_CACHE_TTL = 3600  # seconds
+    PARSE_CACHE_MAXSIZE = 128
+    
+    # League info fields Yahoo returns as numeric strings; stored as int once per fetch
+    LEAGUE_WEEK_FIELDS = ('current_week', 'start_week', 'end_week')
     
     def __init__(self, oauth_session, oauth_client=None, use_cache=True):
         """
@@ -57,7 +92,59 @@ class YahooFantasyAPI:
         self.oauth_client = oauth_client
         self.use_cache = use_cache and CACHE_AVAILABLE
         self.cache_manager = CacheManager() if self.use_cache else None
-        self.nickname_mapper = ManagerNicknameMapper() if NICKNAME_MAPPER_AVAILABLE else None
+        self.nickname_mapper = ManagerNicknameMapper.get_default() if NICKNAME_MAPPER_AVAILABLE else None
+        # Memoizes league lookups in front of the disk cache and the API (see _memoized)
+        self._memo = TTLCache(maxsize=self.MEMO_MAXSIZE, ttl=self.MEMO_TTL) if CACHE_AVAILABLE else None
+        self._parse_cache = TTLCache(maxsize=self.PARSE_CACHE_MAXSIZE, ttl=self.PARSE_CACHE_TTL) if CACHE_AVAILABLE else None
+        # Serializes token refreshes when requests are made from several threads
+        self._refresh_lock = threading.Lock()
+    
+    def _nickname_batch(self):
+        """
+        Get a context manager that buffers nickname mappings auto-added inside it
+        and writes them to the CSV file in one go when it exits.
+        
+        Returns:
+            Context manager (a no-op if no nickname mapper is available)
+        """
+        return self.nickname_mapper if self.nickname_mapper else nullcontext()
+    
+    @staticmethod
+    def _season_from_league_key(league_key: str) -> str:
+        """
+        Extract the season (game ID) from a league key of the form {game_id}.l.{league_id}.
+        
+        Args:
+            league_key: League key
+            
+        Returns:
+            str: Season, or '' if the league key has no numeric game ID
+        """
+        season, sep, _ = league_key.partition('.') if league_key else ('', '', '')
+        return season if sep and season.isdigit() else ''
+    
+    @classmethod
+    def _coerce_league_weeks(cls, league_info: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Return league info with its numeric week fields stored as int. The input may be
+        a shared cached parse, so it is copied rather than modified when a field changes.
+        
+        Args:
+            league_info: Parsed league information, or None
+            
+        Returns:
+            dict: League information with int week fields (the input itself if nothing changed)
+        """
+        if not league_info:
+            return league_info
+        coerced = None
+        for field in cls.LEAGUE_WEEK_FIELDS:
+            value = league_info.get(field)
+            if isinstance(value, str) and value.isdigit():
+                if coerced is None:
+                    coerced = dict(league_info)
+                coerced[field] = int(value)
+        return league_info if coerced is None else coerced
     
     def _apply_nickname_mapping_to_df(self, df: 'pd.DataFrame', league_key: str) -> 'pd.DataFrame':
         """
@@ -76,25 +163,30 @@ class YahooFantasyAPI:
         if not self.nickname_mapper:
             return df
         
-        # Extract season from league_key (format: {game_id}.l.{league_id})
-        season = league_key.split('.')[0] if '.' in league_key and league_key else ''
-        if not season or not season.isdigit():
+        season = self._season_from_league_key(league_key)
+        if not season:
             return df
         
         # Check if DataFrame has the required columns
         if 'manager_nickname' not in df.columns or 'team_name' not in df.columns:
             return df
         
-        # Apply mapping to rows with "--hidden--" nickname
-        for idx in df.index:
-            nickname = df.loc[idx, 'manager_nickname']
-            if nickname == "--hidden--" or nickname == "N/A" or not nickname:
-                team_name = df.loc[idx, 'team_name']
-                if team_name and team_name != 'N/A':
-                    mapped_nickname = self.nickname_mapper.apply_mapping(
-                        team_name, league_key, season, nickname
-                    )
-                    df.loc[idx, 'manager_nickname'] = mapped_nickname
+        # Apply mapping to rows with "--hidden--" nickname in one batch (auto-added entries are written once at the end)
+        nicknames = df['manager_nickname']
+        team_names = df['team_name']
+        mask = ((nicknames.isin(self.UNMAPPED_NICKNAMES) | nicknames.isna())
+                & team_names.notna() & ~team_names.isin(self.INVALID_TEAM_NAMES))
+        if mask.any():
+            # Map teams with an existing mapping in one vectorized lookup
+            mapped = team_names[mask].map(self.nickname_mapper.get_all_for_league(league_key, season))
+            missing = mapped.isna()
+            if missing.any():
+                # The rest go through the mapper (whitespace normalization, auto-added FIXME entries)
+                rows = [(team_name, league_key, season, nickname)
+                        for team_name, nickname in zip(team_names[mask][missing].to_numpy(),
+                                                       nicknames[mask][missing].to_numpy())]
+                mapped[missing] = self.nickname_mapper.apply_mapping_batch(rows)
+            df.loc[mask, 'manager_nickname'] = mapped
         
         return df
     
@@ -112,25 +204,65 @@ class YahooFantasyAPI:
         if not data_list or not self.nickname_mapper:
             return data_list
         
-        # Extract season from league_key (format: {game_id}.l.{league_id})
-        season = league_key.split('.')[0] if '.' in league_key and league_key else ''
-        if not season or not season.isdigit():
+        season = self._season_from_league_key(league_key)
+        if not season:
             return data_list
         
-        # Apply mapping to each item
+        # Apply mapping to items with "--hidden--" nickname in one batch (auto-added entries are written once at the end)
+        items = []
+        rows = []
         for item in data_list:
             if isinstance(item, dict):
                 nickname = item.get('manager_nickname', '')
-                if nickname == "--hidden--" or nickname == "N/A" or not nickname:
+                if nickname in self.UNMAPPED_NICKNAMES:
                     team_name = item.get('team_name', '')
-                    if team_name and team_name != 'N/A':
-                        mapped_nickname = self.nickname_mapper.apply_mapping(
-                            team_name, league_key, season, nickname
-                        )
-                        item['manager_nickname'] = mapped_nickname
+                    if team_name not in self.INVALID_TEAM_NAMES:
+                        items.append(item)
+                        rows.append((team_name, league_key, season, nickname))
+        if rows:
+            for item, mapped_nickname in zip(items, self.nickname_mapper.apply_mapping_batch(rows)):
+                item['manager_nickname'] = mapped_nickname
         
         return data_list
     
+    def _refresh_session(self, stale_token):
+        """
+        Refresh the access token and re-authenticate the session, at most once per expired token.
+        
+        Args:
+            stale_token: Access token that was rejected
+            
+        Returns:
+            OAuth2Session: Session with a fresh token
+        """
+        with self._refresh_lock:
+            # Another thread may already have refreshed while we waited for the lock
+            if self.oauth_client.access_token == stale_token:
+                self.oauth_client.refresh_access_token()
+                self.oauth_client.save_tokens()
+                # Re-authenticate the session with the new token
+                self.oauth_session = self.oauth_client.create_authenticated_session()
+            return self.oauth_session
+    
+    def refresh_token_if_expiring(self, margin=120):
+        """
+        Proactively refresh the access token if it expires within the given margin,
+        so requests do not hit a 401 and refresh inline.
+        
+        Args:
+            margin: Seconds before expiry at which the token is refreshed
+            
+        Returns:
+            bool: True if the token was refreshed, False otherwise
+        """
+        if not self.oauth_client:
+            return False
+        with self._refresh_lock:
+            if not self.oauth_client.refresh_if_expiring(margin):
+                return False
+            self.oauth_session = self.oauth_client.create_authenticated_session()
+            return True
+    
     def _make_request(self, url, params=None, retry=True):
         """
         Make an API request with automatic token refresh on expiration.
@@ -146,34 +278,28 @@ class YahooFantasyAPI:
         Raises:
             Exception: If API call fails after token refresh attempt
         """
+        session = self.oauth_session
+        # The session is shared and re-authenticated in place, so remember which token this request used
+        token = self.oauth_client.access_token if self.oauth_client else None
         try:
-            response = self.oauth_session.get(url, params=params)
+            response = session.get(url, params=params, timeout=self.REQUEST_TIMEOUT)
             # Check for token expiration (401 Unauthorized)
             if response.status_code == 401 and retry and self.oauth_client:
                 # Try to refresh the token
                 try:
-                    self.oauth_client.refresh_access_token()
-                    self.oauth_client.save_tokens()
-                    # Recreate the session with the new token
-                    self.oauth_session = self.oauth_client.create_authenticated_session()
+                    session = self._refresh_session(token)
                     # Retry the request once
-                    response = self.oauth_session.get(url, params=params)
+                    response = session.get(url, params=params, timeout=self.REQUEST_TIMEOUT)
                 except Exception as refresh_error:
                     raise Exception(f"Token expired and refresh failed: {refresh_error}")
         except Exception as e:
             # Check if it's a token expiration error (common error messages)
-            error_str = str(e).lower()
-            if retry and self.oauth_client and ('token' in error_str and 'expired' in error_str or 
-                                                'unauthorized' in error_str or 
-                                                '401' in error_str):
+            if retry and self.oauth_client and self.TOKEN_ERROR_PATTERN.search(str(e)):
                 try:
                     # Try to refresh the token
-                    self.oauth_client.refresh_access_token()
-                    self.oauth_client.save_tokens()
-                    # Recreate the session with the new token
-                    self.oauth_session = self.oauth_client.create_authenticated_session()
+                    session = self._refresh_session(token)
                     # Retry the request once (without retry flag to prevent infinite loops)
-                    response = self.oauth_session.get(url, params=params)
+                    response = session.get(url, params=params, timeout=self.REQUEST_TIMEOUT)
                 except Exception as refresh_error:
                     raise Exception(f"Token expired and refresh failed: {refresh_error}")
             else:
@@ -198,11 +324,11 @@ class YahooFantasyAPI:
         url = f"{self.BASE_URL}/users;use_login=1/games"
         response = self._make_request(url, params={'format': 'json'})
         
-        if not response.text or not response.text.strip():
+        if not response.content.strip():
             raise Exception(f"Empty response from API. Status: {response.status_code}")
         
         try:
-            games_data = response.json()
+            games_data = self._parse_json(response)
         except ValueError as e:
             if response.text.strip().startswith('<?xml') or response.text.strip().startswith('<'):
                 raise Exception(f"API returned XML instead of JSON. Check API format parameter.")
@@ -228,11 +354,11 @@ class YahooFantasyAPI:
         url = f"{self.BASE_URL}/users;use_login=1/games;game_keys={game_key}/leagues"
         response = self._make_request(url, params={'format': 'json'})
         
-        if not response.text or not response.text.strip():
+        if not response.content.strip():
             raise Exception(f"Empty response from API. Status: {response.status_code}")
         
         try:
-            leagues_data = response.json()
+            leagues_data = self._parse_json(response)
         except ValueError as e:
             raise Exception(f"Failed to parse JSON response. Status: {response.status_code}, Response: {response.text[:200]}")
         
@@ -254,26 +380,31 @@ class YahooFantasyAPI:
         Raises:
             Exception: If API call fails or response cannot be parsed
         """
+        return self._memoized(('league_info', league_key),
+                              lambda: self._get_league_info_uncached(league_key, force_refresh),
+                              force=force_refresh, ttl=self._league_info_memo_ttl)
+    
+    def _get_league_info_uncached(self, league_key: str, force_refresh: bool) -> Optional[Dict[str, Any]]:
+        """Fetch league info from the disk cache or the API (see get_league_info)."""
         # Check cache first (unless forcing refresh)
         if self.use_cache and not force_refresh:
             cached_data = self.cache_manager.get(league_key, 'league_info')
             if cached_data is not None:
-                return cached_data
+                return self._coerce_league_weeks(cached_data)
         
         url = f"{self.BASE_URL}/league/{league_key}"
         response = self._make_request(url, params={'format': 'json'})
         
-        if not response.text or not response.text.strip():
+        if not response.content.strip():
             raise Exception(f"Empty response from API. Status: {response.status_code}")
         
         try:
-            league_data = response.json()
+            # Parse league info (reused if the body is unchanged since an earlier fetch)
+            league_info = self._coerce_league_weeks(
+                self._parse_response_cached('league_info', response, self._parse_league_info))
         except ValueError as e:
             raise Exception(f"Failed to parse JSON response. Status: {response.status_code}, Response: {response.text[:200]}")
         
-        # Parse and return league info
-        league_info = self._parse_league_info(league_data)
-        
         # Cache the result if it's a prior season
         if self.use_cache and league_info:
             is_prior = self.cache_manager.is_prior_season(league_info)
@@ -295,19 +426,21 @@ class YahooFantasyAPI:
         Raises:
             Exception: If API call fails or response cannot be parsed
         """
+        return self._memoized(('league_teams', league_key), lambda: self._get_league_teams_uncached(league_key))
+    
+    def _get_league_teams_uncached(self, league_key: str) -> List[Dict[str, Any]]:
+        """Fetch and parse a league's teams from the API (see get_league_teams)."""
         url = f"{self.BASE_URL}/league/{league_key}/teams"
         response = self._make_request(url, params={'format': 'json'})
         
-        if not response.text or not response.text.strip():
+        if not response.content.strip():
             raise Exception(f"Empty response from API. Status: {response.status_code}")
         
         try:
-            teams_data = response.json()
+            # Parse and return teams (reused if the body is unchanged since an earlier fetch)
+            return self._parse_response_cached('league_teams', response, self._parse_teams)
         except ValueError as e:
             raise Exception(f"Failed to parse JSON response. Status: {response.status_code}, Response: {response.text[:200]}")
-        
-        # Parse and return teams
-        return self._parse_teams(teams_data)
     
     def get_team_roster(self, team_key: str) -> Dict[str, Any]:
         """
@@ -325,11 +458,11 @@ class YahooFantasyAPI:
         url = f"{self.BASE_URL}/team/{team_key}/roster"
         response = self._make_request(url, params={'format': 'json'})
         
-        if not response.text or not response.text.strip():
+        if not response.content.strip():
             raise Exception(f"Empty response from API. Status: {response.status_code}")
         
         try:
-            return response.json()
+            return self._parse_json(response)
         except ValueError as e:
             raise Exception(f"Failed to parse JSON response. Status: {response.status_code}, Response: {response.text[:200]}")
     
@@ -342,11 +475,16 @@ class YahooFantasyAPI:
             week: Optional week number (default: current week)
             
         Returns:
-            dict: Team stats data from API
+            dict: Team stats data from API (shared; do not modify)
             
         Raises:
             Exception: If API call fails or response cannot be parsed
         """
+        return self._memoized(('team_stats', team_key, week or None),
+                              lambda: self._get_team_stats_uncached(team_key, week))
+    
+    def _get_team_stats_uncached(self, team_key: str, week: Optional[int]) -> Dict[str, Any]:
+        """Fetch team stats from the API (see get_team_stats)."""
         if week:
             url = f"{self.BASE_URL}/team/{team_key}/stats;week={week}"
         else:
@@ -354,11 +492,11 @@ class YahooFantasyAPI:
         
         response = self._make_request(url, params={'format': 'json'})
         
-        if not response.text or not response.text.strip():
+        if not response.content.strip():
             raise Exception(f"Empty response from API. Status: {response.status_code}")
         
         try:
-            return response.json()
+            return self._parse_response_cached('team_stats', response, lambda data: data)
         except ValueError as e:
             raise Exception(f"Failed to parse JSON response. Status: {response.status_code}, Response: {response.text[:200]}")
     
@@ -377,10 +515,108 @@ class YahooFantasyAPI:
             stats_data = self.get_team_stats(team_key, week)
             return self._parse_team_stats_for_week(stats_data, team_key, week)
         except Exception as e:
-            import logging
-            logging.debug(f"Failed to get team stats for {team_key} week {week}: {e}")
+            logger.debug("Failed to get team stats for %s week %s: %s", team_key, week, e)
             return None
     
+    # Yahoo caps the number of keys accepted in one collection request
+    MAX_KEYS_PER_REQUEST = 25
+    
+    def get_teams_stats_by_week(self, team_keys: List[str], week: int) -> Dict[str, Dict[str, Any]]:
+        """
+        Get stats for several teams for a specific week, including moves, trades, and FAAB.
+        Uses one teams collection request per 25 teams instead of one request per team.
+        
+        Args:
+            team_keys: Team keys (e.g., ['461.l.621700.t.1', '461.l.621700.t.2'])
+            week: Week number
+            
+        Returns:
+            dict: Parsed team stats for the week keyed by team_key (teams that fail are omitted)
+        """
+        stats_by_team = {}
+        for i in range(0, len(team_keys), self.MAX_KEYS_PER_REQUEST):
+            batch = team_keys[i:i + self.MAX_KEYS_PER_REQUEST]
+            url = f"{self.BASE_URL}/teams;team_keys={','.join(batch)}/stats;type=week;week={week}"
+            try:
+                response = self._make_request(url, params={'format': 'json'})
+                if not response.content.strip():
+                    raise Exception(f"Empty response from API. Status: {response.status_code}")
+                teams_obj = self._parse_json(response).get('fantasy_content', {}).get('teams', {})
+            except Exception as e:
+                logger.debug("Failed to get team stats for %d team(s) week %s: %s", len(batch), week, e)
+                continue
+            
+            if not isinstance(teams_obj, dict):
+                continue
+            for team_entry in self._numbered_values(teams_obj):
+                if not isinstance(team_entry, dict):
+                    continue
+                # Each entry has the same shape as a single-team response
+                parsed = self._parse_team_stats_for_week(
+                    {'fantasy_content': {'team': team_entry.get('team', {})}}, '', week
+                )
+                if not parsed:
+                    continue
+                team_key = self._find_team_key(team_entry.get('team', {}))
+                if team_key:
+                    parsed['team_key'] = team_key
+                    stats_by_team[team_key] = parsed
+        
+        return stats_by_team
+    
+    def get_teams_stats(self, team_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get season stats for several teams.
+        Uses one teams collection request per 25 teams instead of one request per team.
+        
+        Args:
+            team_keys: Team keys (e.g., ['461.l.621700.t.1', '461.l.621700.t.2'])
+            
+        Returns:
+            dict: Team stats data keyed by team_key, each shaped like a get_team_stats() response
+                  (teams in a failed request are omitted)
+        """
+        stats_by_team = {}
+        for i in range(0, len(team_keys), self.MAX_KEYS_PER_REQUEST):
+            batch = team_keys[i:i + self.MAX_KEYS_PER_REQUEST]
+            url = f"{self.BASE_URL}/teams;team_keys={','.join(batch)}/stats"
+            try:
+                response = self._make_request(url, params={'format': 'json'})
+                if not response.content.strip():
+                    raise Exception(f"Empty response from API. Status: {response.status_code}")
+                teams_obj = self._parse_json(response).get('fantasy_content', {}).get('teams', {})
+            except Exception as e:
+                logger.debug("Failed to get season stats for %d team(s): %s", len(batch), e)
+                continue
+            
+            if not isinstance(teams_obj, dict):
+                continue
+            for team_entry in self._numbered_values(teams_obj):
+                if not isinstance(team_entry, dict):
+                    continue
+                team_obj = team_entry.get('team', {})
+                team_key = self._find_team_key(team_obj)
+                if team_key:
+                    stats_by_team[team_key] = {'fantasy_content': {'team': team_obj}}
+        
+        return stats_by_team
+    
+    def _find_team_key(self, team_obj: Any) -> Optional[str]:
+        """
+        Find the team_key in a team object (list of single-key dicts under team[0]).
+        
+        Args:
+            team_obj: Team object from an API response
+            
+        Returns:
+            str: Team key, or None if not found
+        """
+        if isinstance(team_obj, list) and len(team_obj) > 0 and isinstance(team_obj[0], list):
+            for item in team_obj[0]:
+                if isinstance(item, dict) and 'team_key' in item:
+                    return item['team_key']
+        return None
+    
     def get_transactions_by_week(self, league_key: str) -> Dict[int, Dict[str, Dict[str, int]]]:
         """
         Get transactions grouped by week and team, calculating cumulative moves and trades.
@@ -400,8 +636,7 @@ class YahooFantasyAPI:
             return {}
         
         # Get transactions
-        transactions_data = self.get_league_transactions(league_key)
-        transactions_list = self._parse_transactions(transactions_data)
+        transactions_list = self.get_parsed_league_transactions(league_key)
         
         # Get start date to calculate week numbers from timestamps
         start_date_str = league_info.get('start_date', '')
@@ -415,8 +650,6 @@ class YahooFantasyAPI:
         
         # Initialize weekly transaction counts
         weekly_transactions = {}
-        teams = self.get_league_teams(league_key)
-        team_keys = [t.get('team_key') for t in teams if isinstance(t, dict) and t.get('team_key')]
         
         # Process each transaction
         for transaction in transactions_list:
@@ -441,7 +674,7 @@ class YahooFantasyAPI:
             team_key = None
             
             # Extract team key from transaction
-            if trans_type in ['add', 'drop', 'add/drop']:
+            if trans_type in self.MOVE_TRANSACTION_TYPES:
                 # For add/drop, get team from players
                 players = transaction.get('players', [])
                 if players and len(players) > 0:
@@ -498,9 +731,9 @@ class YahooFantasyAPI:
         if not league_info:
             return []
         
-        current_week = int(league_info.get('current_week', 1))
-        start = int(league_info.get('start_week', 1))
-        end = int(league_info.get('end_week', current_week))
+        current_week = league_info.get('current_week', 1)
+        start = league_info.get('start_week', 1)
+        end = league_info.get('end_week', current_week)
         start_date_str = league_info.get('start_date', '')
         
         # Override with provided parameters if specified
@@ -515,8 +748,8 @@ class YahooFantasyAPI:
             return []
         
         # Get transactions to calculate actual week-by-week data
-        transactions_data = self.get_league_transactions(league_key)
-        transactions_list = self._parse_transactions(transactions_data)
+        # Transactions paired with their (local) date ordinals, converted once per memo window
+        dated_transactions = self._get_dated_transactions(league_key)
         
         # Calculate week from timestamps using Tuesday boundaries
         # Fantasy weeks run Tuesday to Tuesday
@@ -537,161 +770,92 @@ class YahooFantasyAPI:
             except:
                 pass
         
-        # Initialize cumulative counts per team per week
-        team_weekly_counts = {}
+        # Per-team counts added in each week (index = week - start); summed into running totals below
+        last_week = min(end, current_week)
+        num_weeks = max(last_week - start + 1, 0)
+        team_week_deltas = {}  # team_key -> (moves, trades, faab_spent) lists
         for team in teams:
             if isinstance(team, dict):
                 team_key = team.get('team_key')
                 if team_key:
-                    team_weekly_counts[team_key] = {'moves': 0, 'trades': 0}
+                    team_week_deltas[team_key] = ([0] * num_weeks, [0] * num_weeks, [0] * num_weeks)
         
-        # Process transactions to build week-by-week cumulative counts
-        # Initialize cumulative counts per team per week
-        team_weekly_counts = {}  # week -> team_key -> {'moves': count, 'trades': count}
+        # Fantasy weeks run Tuesday to Tuesday and first_tuesday is a Tuesday, so a transaction's
+        # week is the number of whole weeks between the two dates (no weekday adjustment needed)
+        first_tuesday_ordinal = first_tuesday.toordinal() if first_tuesday else None
         
-        # Get starting FAAB balance (default 100, but check league settings)
-        # Try to get from current team stats to determine starting amount
-        starting_faab = 100
-        try:
-            # Get current week stats to see if we can determine starting FAAB
-            # We'll calculate starting FAAB by looking at total spent + current balance
-            sample_team = teams[0] if teams else None
-            if sample_team and isinstance(sample_team, dict):
-                sample_team_key = sample_team.get('team_key')
-                if sample_team_key:
-                    current_stats = self.get_team_stats_by_week(sample_team_key, current_week)
-                    if current_stats:
-                        # This won't give us starting balance directly, but we'll use 100 as default
-                        # and calculate from current balance + total spent
-                        pass
-        except:
-            pass
-        
-        # Initialize all weeks and teams
-        for week_num in range(start, min(end + 1, current_week + 1)):
-            team_weekly_counts[week_num] = {}
-            for team in teams:
-                if isinstance(team, dict):
-                    team_key = team.get('team_key')
-                    if team_key:
-                        team_weekly_counts[week_num][team_key] = {'moves': 0, 'trades': 0, 'faab_spent': 0}
-        
-        # Sort transactions by timestamp
-        sorted_transactions = sorted(transactions_list, key=lambda t: int(t.get('timestamp', '0')))
-        
-        # Process each transaction and accumulate counts
-        for transaction in sorted_transactions:
-            timestamp = transaction.get('timestamp')
-            if not timestamp or not first_tuesday:
+        # Process each transaction and accumulate counts (order doesn't matter, totals are summed below)
+        move_types = self.MOVE_TRANSACTION_TYPES
+        for transaction, day_ordinal in dated_transactions:
+            # Classify the transaction once rather than per team
+            trans_type = transaction.get('type', '')
+            is_move = trans_type in move_types
+            is_trade = trans_type == 'trade'
+            faab_bid = transaction.get('faab_bid', 0)
+            # FAAB spending only counts for successful transactions with FAAB bids
+            faab_spent = faab_bid if faab_bid > 0 and transaction.get('status') == 'successful' else 0
+            if not (is_move or is_trade or faab_spent):
+                # Changes no count (e.g. commissioner edits), so skip the date math
                 continue
             
-            try:
-                trans_date = datetime.fromtimestamp(int(timestamp))
-                
-                # Calculate which Tuesday-aligned week this transaction belongs to
-                # Weeks run Tuesday to Tuesday (Tuesday is the start of the week)
-                # Find the Tuesday that starts the week containing this transaction
-                # If transaction is on Tuesday or later in the week, go back to that Tuesday
-                # If transaction is on Monday, go back to previous Tuesday
-                if trans_date.weekday() == 1:  # Tuesday
-                    trans_tuesday = trans_date
-                elif trans_date.weekday() == 0:  # Monday
-                    # Go back to previous Tuesday (6 days)
-                    trans_tuesday = trans_date - timedelta(days=6)
-                else:  # Wednesday-Sunday (weekday 2-6)
-                    # Go back to Tuesday of this week
-                    days_since_tuesday = trans_date.weekday() - 1
-                    trans_tuesday = trans_date - timedelta(days=days_since_tuesday)
-                
-                # Calculate weeks since first Tuesday
-                days_diff = (trans_tuesday - first_tuesday).days
-                week = (days_diff // 7) + 1
-                
-                # Ensure week is at least 1
-                if week < 1:
-                    week = 1
-                
-                if week < start or week > end:
-                    continue
-            except:
+            if day_ordinal is None or first_tuesday_ordinal is None:
                 continue
             
-            trans_type = transaction.get('type', '')
-            faab_bid = transaction.get('faab_bid', 0)
+            # Weeks since first Tuesday, at least 1
+            week = max(((day_ordinal - first_tuesday_ordinal) // 7) + 1, 1)
+            if week < start or week > last_week:
+                continue
+            week_index = week - start
             
             # For trades, use trade_teams to avoid duplicates
             # For other transactions, use team_keys
-            if trans_type == 'trade':
-                team_keys = transaction.get('trade_teams', [])
-                # Remove duplicates and ensure we have valid team keys
-                team_keys = list(set([tk for tk in team_keys if tk and tk.startswith(league_key)]))
-            else:
-                team_keys = transaction.get('team_keys', [])
-                # Remove duplicates
-                team_keys = list(set([tk for tk in team_keys if tk and tk.startswith(league_key)]))
+            team_keys = transaction.get('trade_teams' if is_trade else 'team_keys', [])
             
-            # Count move or trade, and track FAAB spending
+            # Count move or trade, and track FAAB spending, in the week of the transaction.
+            # Only this league's teams have deltas, so the lookup also drops empty and foreign keys;
+            # a team listed twice is counted once (most transactions involve one or two teams)
+            if len(team_keys) > 1:
+                team_keys = set(team_keys)
             for team_key in team_keys:
-                if team_key and team_key.startswith(league_key):
-                    # Update cumulative counts for this week and all subsequent weeks
-                    for week_num in range(week, min(end + 1, current_week + 1) + 1):
-                        if week_num in team_weekly_counts and team_key in team_weekly_counts[week_num]:
-                            if trans_type in ['add', 'drop', 'add/drop']:
-                                team_weekly_counts[week_num][team_key]['moves'] += 1
-                            elif trans_type == 'trade':
-                                # Count trade once per team (each trade involves 2 teams)
-                                team_weekly_counts[week_num][team_key]['trades'] += 1
-                            
-                            # Add FAAB spending (only for successful transactions with FAAB bids)
-                            if faab_bid > 0 and transaction.get('status') == 'successful':
-                                team_weekly_counts[week_num][team_key]['faab_spent'] += faab_bid
+                deltas = team_week_deltas.get(team_key)
+                if deltas is None:
+                    continue
+                if is_move:
+                    deltas[0][week_index] += 1
+                elif is_trade:
+                    # Count trade once per team (each trade involves 2 teams)
+                    deltas[1][week_index] += 1
+                if faab_spent:
+                    deltas[2][week_index] += faab_spent
+        
+        # Running totals turn the per-week counts into cumulative counts as of each week
+        team_weekly_totals = {
+            team_key: tuple(list(accumulate(delta)) for delta in deltas)
+            for team_key, deltas in team_week_deltas.items()
+        }
         
         # All teams start with 100 FAAB
-        team_starting_faab = {}
+        starting_faab = 100
+        
+        # Resolve each team's key, name and cumulative totals once for all weeks
+        team_rows = []
         for team in teams:
-            if not isinstance(team, dict):
-                continue
-            team_key = team.get('team_key')
-            if not team_key:
-                continue
-            
-            # Always use 100 as starting FAAB
-            team_starting_faab[team_key] = 100
+            if isinstance(team, dict) and team.get('team_key'):
+                team_key = team['team_key']
+                team_rows.append((team_key, team.get('name', 'N/A'), team_weekly_totals[team_key]))
         
         # Build weekly stats list from cumulative counts
         weekly_stats_list = []
-        for week_num in range(start, min(end + 1, current_week + 1)):
-            for team in teams:
-                if not isinstance(team, dict):
-                    continue
-                
-                team_key = team.get('team_key')
-                if not team_key:
-                    continue
-                
-                # Get team name
-                team_name = team.get('name', 'N/A')
-                
-                # Get cumulative counts for this week
-                moves = 0
-                trades = 0
-                faab_spent = 0
-                if week_num in team_weekly_counts and team_key in team_weekly_counts[week_num]:
-                    moves = team_weekly_counts[week_num][team_key]['moves']
-                    trades = team_weekly_counts[week_num][team_key]['trades']
-                    faab_spent = team_weekly_counts[week_num][team_key]['faab_spent']
-                
-                # Calculate balance for this week: starting - spent up to this week
-                starting_faab = team_starting_faab.get(team_key, 100)
-                faab_balance = starting_faab - faab_spent
-                
+        for week_index, week_num in enumerate(range(start, last_week + 1)):
+            for team_key, team_name, (moves, trades, faab_spent) in team_rows:
                 weekly_stats_list.append({
                     'team_key': team_key,
                     'week': week_num,
                     'team_name': team_name,
-                    'number_of_moves': moves,
-                    'number_of_trades': trades,
-                    'faab_balance': faab_balance
+                    'number_of_moves': moves[week_index],
+                    'number_of_trades': trades[week_index],
+                    # Balance for this week: starting - spent up to this week
+                    'faab_balance': starting_faab - faab_spent[week_index]
                 })
         
         # Cache the result if it's a prior season
@@ -700,6 +864,34 @@ class YahooFantasyAPI:
         
         return weekly_stats_list
     
+    # Columns of the rows returned by get_all_teams_weekly_stats
+    WEEKLY_STATS_COLUMNS = ['team_key', 'week', 'team_name', 'number_of_moves', 'number_of_trades', 'faab_balance']
+    
+    def get_all_teams_weekly_stats_dataframe(self, league_key: str, start_week: Optional[int] = None,
+                                             end_week: Optional[int] = None, force_refresh: bool = False) -> 'pd.DataFrame':
+        """
+        Get weekly stats for all teams in a league as a DataFrame (see get_all_teams_weekly_stats).
+        
+        Args:
+            league_key: League key (e.g., '461.l.621700')
+            start_week: Starting week number (default: 1)
+            end_week: Ending week number (default: current week)
+            force_refresh: If True, bypass cache and fetch from API
+            
+        Returns:
+            pd.DataFrame: One row per team per week
+        """
+        if not PANDAS_AVAILABLE:
+            raise ImportError("pandas is required for this functionality. Install it with: pip install pandas")
+        
+        weekly_stats = self.get_all_teams_weekly_stats(league_key, start_week=start_week, end_week=end_week,
+                                                       force_refresh=force_refresh)
+        # Build from columns: the row keys are fixed, so pandas need not infer them row by row
+        return pd.DataFrame({
+            column: [row.get(column) for row in weekly_stats]
+            for column in self.WEEKLY_STATS_COLUMNS
+        })
+    
     def _parse_team_stats_for_week(self, stats_data: Dict[str, Any], team_key: str, week: int) -> Optional[Dict[str, Any]]:
         """
         Parse team stats from API response for a specific week.
@@ -731,26 +923,24 @@ class YahooFantasyAPI:
                                 team_info[k] = v
         elif isinstance(team_obj, dict):
             # Numeric key structure
-            for key in team_obj.keys():
-                if key != 'count' and key.isdigit():
-                    team_data = team_obj.get(key, {})
-                    if isinstance(team_data, dict):
-                        if 'team' in team_data:
-                            team_nested = team_data.get('team', {})
-                            if isinstance(team_nested, list):
-                                if len(team_nested) > 0 and isinstance(team_nested[0], list):
-                                    for item in team_nested[0]:
-                                        if isinstance(item, dict):
-                                            for k, v in item.items():
-                                                if isinstance(v, dict):
-                                                    team_info.update(v)
-                                                elif not isinstance(v, list):
-                                                    team_info[k] = v
-                            elif isinstance(team_nested, dict):
-                                team_info = team_nested
-                        else:
-                            team_info = team_data
-                        break
+            for team_data in self._numbered_values(team_obj):
+                if isinstance(team_data, dict):
+                    if 'team' in team_data:
+                        team_nested = team_data.get('team', {})
+                        if isinstance(team_nested, list):
+                            if len(team_nested) > 0 and isinstance(team_nested[0], list):
+                                for item in team_nested[0]:
+                                    if isinstance(item, dict):
+                                        for k, v in item.items():
+                                            if isinstance(v, dict):
+                                                team_info.update(v)
+                                            elif not isinstance(v, list):
+                                                team_info[k] = v
+                        elif isinstance(team_nested, dict):
+                            team_info = team_nested
+                    else:
+                        team_info = team_data
+                    break
         
         if not team_info:
             return None
@@ -760,9 +950,9 @@ class YahooFantasyAPI:
             'team_key': team_key,
             'week': week,
             'team_name': team_info.get('name', 'N/A'),
-            'number_of_moves': int(team_info.get('number_of_moves', 0)) if team_info.get('number_of_moves') else 0,
-            'number_of_trades': int(team_info.get('number_of_trades', 0)) if team_info.get('number_of_trades') else 0,
-            'faab_balance': int(team_info.get('faab_balance', 100)) if team_info.get('faab_balance') else 100,
+            'number_of_moves': int(team_info.get('number_of_moves') or 0),
+            'number_of_trades': int(team_info.get('number_of_trades') or 0),
+            'faab_balance': int(team_info.get('faab_balance') or 100),
         }
         
         return parsed_stats
@@ -781,14 +971,12 @@ class YahooFantasyAPI:
             raise ImportError("pandas is required for this functionality. Install it with: pip install pandas")
         
         try:
-            transactions_data = self.get_league_transactions(league_key)
-            transactions_list = self._parse_transactions(transactions_data)
+            transactions_list = self.get_parsed_league_transactions(league_key)
             if transactions_list:
                 df = pd.DataFrame(transactions_list)
                 return df
         except Exception as e:
-            import logging
-            logging.debug(f"Failed to get transactions: {e}")
+            logger.debug("Failed to get transactions: %s", e)
         
         return None
     
@@ -806,50 +994,18 @@ class YahooFantasyAPI:
         league_obj = fantasy_content.get('league', {})
         
         # Handle league as list or dict with numeric keys
-        transactions = None
-        
-        if isinstance(league_obj, list):
-            # League is a list - find transactions
-            for item in league_obj:
-                if isinstance(item, dict) and 'transactions' in item:
-                    transactions = item.get('transactions', {})
-                    break
-        elif isinstance(league_obj, dict):
-            # Numeric key structure
-            for key in league_obj.keys():
-                if key != 'count' and key.isdigit():
-                    league_data = league_obj.get(key, {})
-                    if isinstance(league_data, dict):
-                        if 'league' in league_data:
-                            league_nested = league_data.get('league', {})
-                            if isinstance(league_nested, list):
-                                for item in league_nested:
-                                    if isinstance(item, dict) and 'transactions' in item:
-                                        transactions = item.get('transactions', {})
-                                        break
-                            elif isinstance(league_nested, dict) and 'transactions' in league_nested:
-                                transactions = league_nested.get('transactions', {})
-                        elif 'transactions' in league_data:
-                            transactions = league_data.get('transactions', {})
-                        break
+        transactions = self._find_league_section(league_obj, 'transactions')
         
         if not isinstance(transactions, dict):
             return []
         
-        # Extract transactions
-        transactions_list = []
-        for key in transactions.keys():
-            if key != 'count' and key.isdigit():
-                transaction_data = transactions.get(key, {})
-                if isinstance(transaction_data, dict) and 'transaction' in transaction_data:
-                    transaction_raw = transaction_data.get('transaction', {})
-                    
-                    # Parse transaction
-                    parsed_transaction = self._parse_single_transaction(transaction_raw)
-                    if parsed_transaction:
-                        transactions_list.append(parsed_transaction)
-        
-        return transactions_list
+        # Extract and parse transactions, dropping any that fail to parse
+        parsed_transactions = (
+            self._parse_single_transaction(transaction_data.get('transaction', {}))
+            for transaction_data in self._numbered_values(transactions)
+            if isinstance(transaction_data, dict) and 'transaction' in transaction_data
+        )
+        return [transaction for transaction in parsed_transactions if transaction]
     
     def _parse_single_transaction(self, transaction_raw: Any) -> Optional[Dict[str, Any]]:
         """
@@ -863,28 +1019,28 @@ class YahooFantasyAPI:
         """
         transaction_info = {}
         
-        if isinstance(transaction_raw, list):
+        if type(transaction_raw) is list:
             # Transaction is a list of single-key dicts or mixed structure
             for item in transaction_raw:
-                if isinstance(item, dict):
+                if type(item) is dict:
                     for k, v in item.items():
                         if k == 'players':
                             # Preserve players structure for later processing
                             transaction_info[k] = v
-                        elif isinstance(v, dict):
+                        elif type(v) is dict:
                             transaction_info.update(v)
-                        elif not isinstance(v, list):
+                        elif type(v) is not list:
                             transaction_info[k] = v
-                elif isinstance(item, list):
+                elif type(item) is list:
                     # Nested list structure - extract dicts
                     for sub_item in item:
-                        if isinstance(sub_item, dict):
+                        if type(sub_item) is dict:
                             for k, v in sub_item.items():
-                                if isinstance(v, dict):
+                                if type(v) is dict:
                                     transaction_info.update(v)
-                                elif not isinstance(v, list):
+                                elif type(v) is not list:
                                     transaction_info[k] = v
-        elif isinstance(transaction_raw, dict):
+        elif type(transaction_raw) is dict:
             transaction_info = transaction_raw.copy()
         
         if not transaction_info:
@@ -897,42 +1053,38 @@ class YahooFantasyAPI:
             'type': transaction_info.get('type', 'N/A'),
             'status': transaction_info.get('status', 'N/A'),
             'timestamp': transaction_info.get('timestamp', 'N/A'),
-            'faab_bid': int(transaction_info.get('faab_bid', 0)) if transaction_info.get('faab_bid') else 0,
+            'faab_bid': int(transaction_info.get('faab_bid') or 0),
         }
         
         # Extract team info from players/transaction_data
         team_keys_involved = set()
         player_transactions = []
         
-        if 'players' in transaction_info:
-            players = transaction_info.get('players', {})
-            if isinstance(players, dict):
-                # Extract player transactions (adds/drops)
-                for key in players.keys():
-                    if key != 'count' and key.isdigit():
-                        player_data = players.get(key, {})
-                        if isinstance(player_data, dict) and 'player' in player_data:
-                            player_obj = player_data.get('player', {})
-                            player_info, team_key = self._extract_player_and_team_from_transaction(player_obj)
-                            if player_info:
-                                player_transactions.append(player_info)
-                            if team_key:
-                                team_keys_involved.add(team_key)
+        players = transaction_info.get('players')
+        if type(players) is dict:
+            # Extract player transactions (adds/drops)
+            for player_data in self._numbered_values(players):
+                if type(player_data) is dict and 'player' in player_data:
+                    player_obj = player_data.get('player', {})
+                    player_info, team_key = self._extract_player_and_team_from_transaction(player_obj)
+                    if player_info:
+                        player_transactions.append(player_info)
+                    if team_key:
+                        team_keys_involved.add(team_key)
         
         parsed['players'] = player_transactions
         parsed['team_keys'] = list(team_keys_involved)
         
         # Extract trade info if it's a trade
         if parsed['type'] == 'trade':
-            trade_info = transaction_info.get('trader_team_key') or transaction_info.get('tradee_team_key')
-            if trade_info:
+            trader_key = transaction_info.get('trader_team_key')
+            tradee_key = transaction_info.get('tradee_team_key')
+            if trader_key or tradee_key:
                 parsed['trade_teams'] = [
                     transaction_info.get('trader_team_key', 'N/A'),
                     transaction_info.get('tradee_team_key', 'N/A')
                 ]
                 # Add trade team keys to team_keys
-                trader_key = transaction_info.get('trader_team_key')
-                tradee_key = transaction_info.get('tradee_team_key')
                 if trader_key:
                     parsed['team_keys'].append(trader_key)
                 if tradee_key:
@@ -940,7 +1092,7 @@ class YahooFantasyAPI:
         
         return parsed
     
-    def _extract_player_and_team_from_transaction(self, player_raw: Any) -> tuple:
+    def _extract_player_and_team_from_transaction(self, player_raw: Any) -> Tuple[Dict[str, Any], Optional[str]]:
         """
         Extract player info and team key from transaction player structure.
         
@@ -948,21 +1100,21 @@ class YahooFantasyAPI:
             player_raw: Player data from transaction (can be list or dict)
             
         Returns:
-            tuple: (player_info dict, team_key string) or (None, None)
+            tuple: (player_info dict, empty if not found; team_key string, or None if not found)
         """
         player_info = {}
         team_key = None
         
-        if isinstance(player_raw, list):
+        if type(player_raw) is list:
             # Handle list structure: [player_info_list, transaction_data_dict]
             for item in player_raw:
-                if isinstance(item, dict):
+                if type(item) is dict:
                     # Check if this is transaction_data dict
                     if 'transaction_data' in item:
                         trans_data_list = item.get('transaction_data', [])
-                        if isinstance(trans_data_list, list):
+                        if type(trans_data_list) is list:
                             for trans_data in trans_data_list:
-                                if isinstance(trans_data, dict):
+                                if type(trans_data) is dict:
                                     # Check for destination_team_key (add) or source_team_key (drop)
                                     team_key = trans_data.get('destination_team_key') or trans_data.get('source_team_key')
                                     if team_key:
@@ -970,50 +1122,56 @@ class YahooFantasyAPI:
                     else:
                         # Regular player info dict
                         player_info.update(item)
-                elif isinstance(item, list):
+                elif type(item) is list:
                     # Nested list - extract player info
                     for sub_item in item:
-                        if isinstance(sub_item, dict):
+                        if type(sub_item) is dict:
                             for k, v in sub_item.items():
-                                if isinstance(v, dict):
+                                if type(v) is dict:
                                     player_info.update(v)
-                                elif not isinstance(v, list):
+                                elif type(v) is not list:
                                     player_info[k] = v
-        elif isinstance(player_raw, dict):
+        elif type(player_raw) is dict:
             player_info = player_raw.copy()
             # Check for transaction_data in dict structure
-            if 'transaction_data' in player_raw:
-                trans_data_list = player_raw.get('transaction_data', [])
-                if isinstance(trans_data_list, list):
-                    for trans_data in trans_data_list:
-                        if isinstance(trans_data, dict):
-                            team_key = trans_data.get('destination_team_key') or trans_data.get('source_team_key')
-                            if team_key:
-                                break
+            trans_data_list = player_raw.get('transaction_data')
+            if type(trans_data_list) is list:
+                for trans_data in trans_data_list:
+                    if type(trans_data) is dict:
+                        team_key = trans_data.get('destination_team_key') or trans_data.get('source_team_key')
+                        if team_key:
+                            break
         
         return player_info, team_key
     
-    def get_league_standings(self, league_key: str) -> Dict[str, Any]:
+    def get_league_standings(self, league_key: str, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get league standings which includes team stats.
         
         Args:
             league_key: League key (e.g., '461.l.621700')
+            force_refresh: If True, skip the in-memory memo and fetch from the API
             
         Returns:
-            dict: League standings data from API
+            dict: League standings data from API (shared; do not modify)
             
         Raises:
             Exception: If API call fails or response cannot be parsed
         """
+        return self._memoized(('league_standings', league_key),
+                              lambda: self._get_league_standings_uncached(league_key),
+                              force=force_refresh)
+    
+    def _get_league_standings_uncached(self, league_key: str) -> Dict[str, Any]:
+        """Fetch league standings from the API (see get_league_standings)."""
         url = f"{self.BASE_URL}/league/{league_key}/standings"
         response = self._make_request(url, params={'format': 'json'})
         
-        if not response.text or not response.text.strip():
+        if not response.content.strip():
             raise Exception(f"Empty response from API. Status: {response.status_code}")
         
         try:
-            return response.json()
+            return self._parse_response_cached('league_standings', response, lambda data: data)
         except ValueError as e:
             raise Exception(f"Failed to parse JSON response. Status: {response.status_code}, Response: {response.text[:200]}")
     
@@ -1032,6 +1190,12 @@ class YahooFantasyAPI:
         Raises:
             Exception: If API call fails or response cannot be parsed
         """
+        return self._memoized(('league_transactions', league_key, transaction_type, count),
+                              lambda: self._get_league_transactions_uncached(league_key, transaction_type, count))
+    
+    def _get_league_transactions_uncached(self, league_key: str, transaction_type: Optional[str],
+                                          count: Optional[int]) -> Dict[str, Any]:
+        """Fetch league transactions from the API (see get_league_transactions)."""
         url = f"{self.BASE_URL}/league/{league_key}/transactions"
         params = {'format': 'json'}
         if transaction_type:
@@ -1041,28 +1205,78 @@ class YahooFantasyAPI:
         
         response = self._make_request(url, params=params)
         
-        if not response.text or not response.text.strip():
+        if not response.content.strip():
             raise Exception(f"Empty response from API. Status: {response.status_code}")
         
         try:
-            return response.json()
+            # Transactions responses are the largest; skip decoding an unchanged body again
+            return self._parse_response_cached('league_transactions', response, lambda data: data)
         except ValueError as e:
             raise Exception(f"Failed to parse JSON response. Status: {response.status_code}, Response: {response.text[:200]}")
     
-    def get_league_scoreboard(self, league_key: str, week: Optional[int] = None) -> Dict[str, Any]:
+    def get_parsed_league_transactions(self, league_key: str) -> List[Dict[str, Any]]:
+        """
+        Get all league transactions, parsed. The parsed list is memoized alongside the raw
+        response, so reports built from the same league parse the transactions only once.
+        
+        Args:
+            league_key: League key (e.g., '461.l.621700')
+            
+        Returns:
+            list: List of transaction dictionaries (shared; do not modify)
+        """
+        return self._memoized(('parsed_league_transactions', league_key),
+                              lambda: self._parse_transactions(self.get_league_transactions(league_key)))
+    
+    def _get_dated_transactions(self, league_key: str) -> List[Tuple[Dict[str, Any], Optional[int]]]:
+        """
+        Get parsed league transactions paired with the local date of their timestamp,
+        memoized so repeated reports do not convert every timestamp again.
+        
+        Args:
+            league_key: League key (e.g., '461.l.621700')
+            
+        Returns:
+            list: (transaction, date ordinal) tuples; the ordinal is None for a missing or invalid timestamp
+        """
+        def compute():
+            from datetime import datetime
+            
+            dated = []
+            for transaction in self.get_parsed_league_transactions(league_key):
+                timestamp = transaction.get('timestamp')
+                day_ordinal = None
+                if timestamp:
+                    try:
+                        day_ordinal = datetime.fromtimestamp(int(timestamp)).toordinal()
+                    except (TypeError, ValueError, OverflowError, OSError):
+                        pass
+                dated.append((transaction, day_ordinal))
+            return dated
+        
+        return self._memoized(('dated_league_transactions', league_key), compute)
+    
+    def get_league_scoreboard(self, league_key: str, week: Optional[int] = None, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get league scoreboard/matchups for a specific week.
         
         Args:
             league_key: League key (e.g., '461.l.621700')
             week: Week number (default: current week)
+            force_refresh: If True, skip the in-memory memo and fetch from the API
             
         Returns:
-            dict: Scoreboard/matchup data from API
+            dict: Scoreboard/matchup data from API (shared; do not modify)
             
         Raises:
             Exception: If API call fails or response cannot be parsed
         """
+        return self._memoized(('league_scoreboard', league_key, week or None),
+                              lambda: self._get_league_scoreboard_uncached(league_key, week),
+                              force=force_refresh)
+    
+    def _get_league_scoreboard_uncached(self, league_key: str, week: Optional[int]) -> Dict[str, Any]:
+        """Fetch a league scoreboard from the API (see get_league_scoreboard)."""
         if week:
             url = f"{self.BASE_URL}/league/{league_key}/scoreboard;week={week}"
         else:
@@ -1070,15 +1284,15 @@ class YahooFantasyAPI:
         
         response = self._make_request(url, params={'format': 'json'})
         
-        if not response.text or not response.text.strip():
+        if not response.content.strip():
             raise Exception(f"Empty response from API. Status: {response.status_code}")
         
         try:
-            return response.json()
+            return self._parse_response_cached('league_scoreboard', response, lambda data: data)
         except ValueError as e:
             raise Exception(f"Failed to parse JSON response. Status: {response.status_code}, Response: {response.text[:200]}")
     
-    def _calculate_expected_wins_losses(self, league_key: str) -> Dict[str, Dict[str, float]]:
+    def _calculate_expected_wins_losses(self, league_key: str, force_refresh: bool = False, league_info: Optional[Dict[str, Any]] = None, weekly_performance_df: Optional['pd.DataFrame'] = None) -> Dict[str, Dict[str, float]]:
         """
         Calculate expected wins and losses for each team based on record percentage vs all.
         An expected win is when record_percentage_vs_all > 50%, expected loss when < 50%.
@@ -1086,6 +1300,10 @@ class YahooFantasyAPI:
         
         Args:
             league_key: League key (e.g., '461.l.621700')
+            force_refresh: If True, bypass cache and fetch from API
+            league_info: Optional league info already fetched for this league
+            weekly_performance_df: Optional weekly performance DataFrame (from
+                get_weekly_team_performance_dataframe), so it is not built a second time
             
         Returns:
             dict: Dictionary mapping team_key -> {'expected_wins': float, 'expected_losses': float}
@@ -1093,7 +1311,8 @@ class YahooFantasyAPI:
         expected_stats = {}
         
         # Get league info to determine current week (incomplete weeks)
-        league_info = self.get_league_info(league_key)
+        if league_info is None:
+            league_info = self.get_league_info(league_key, force_refresh=force_refresh)
         current_week = None
         if league_info:
             try:
@@ -1102,44 +1321,41 @@ class YahooFantasyAPI:
                 current_week = None
         
         # Get weekly performance data
-        weekly_performance_df = self.get_weekly_team_performance_dataframe(league_key)
+        if weekly_performance_df is None:
+            weekly_performance_df = self.get_weekly_team_performance_dataframe(league_key, force_refresh=force_refresh)
         if weekly_performance_df is None or weekly_performance_df.empty:
             return expected_stats
         
-        # Filter out incomplete weeks (current week and future weeks)
+        if 'team_key' not in weekly_performance_df.columns:
+            return expected_stats
+        
+        # Keep rows with a team key, filtering out incomplete weeks (current week and future weeks)
+        # with the same mask, so the frame is indexed only once
+        team_keys = weekly_performance_df['team_key']
+        mask = team_keys.notna() & (team_keys != '')
         if current_week is not None:
-            weekly_performance_df = weekly_performance_df[weekly_performance_df['week'] < current_week]
+            mask &= weekly_performance_df['week'] < current_week
+        df = weekly_performance_df[mask]
         
-        if weekly_performance_df.empty:
+        if df.empty:
             return expected_stats
         
-        # Initialize expected stats for all teams
-        for _, row in weekly_performance_df.iterrows():
-            team_key = row.get('team_key')
-            if team_key and team_key not in expected_stats:
-                expected_stats[team_key] = {'expected_wins': 0.0, 'expected_losses': 0.0}
+        # Count expected wins/losses per team over the completed weeks in one pass.
+        # Exactly 50% counts as neither.
+        if 'record_percentage_vs_all' in df.columns:
+            record_pct = pd.to_numeric(df['record_percentage_vs_all'], errors='coerce').fillna(0.0)
+        else:
+            record_pct = pd.Series(0.0, index=df.index)
         
-        # Calculate expected wins/losses per week (only for completed weeks)
-        for _, row in weekly_performance_df.iterrows():
-            team_key = row.get('team_key')
-            record_pct = row.get('record_percentage_vs_all', 0.0)
-            
-            try:
-                record_pct = float(record_pct)
-            except (ValueError, TypeError):
-                record_pct = 0.0
-            
-            if team_key and team_key in expected_stats:
-                if record_pct > 50.0:
-                    expected_stats[team_key]['expected_wins'] += 1.0
-                elif record_pct < 50.0:
-                    expected_stats[team_key]['expected_losses'] += 1.0
-                # If exactly 50%, don't count as either (or could count as 0.5 each)
-                # For now, we'll leave it as 0 for both
+        counts = pd.DataFrame({
+            'expected_wins': (record_pct > 50.0).astype(float),
+            'expected_losses': (record_pct < 50.0).astype(float),
+        }).groupby(df['team_key'], sort=False).sum()
+        expected_stats = counts.to_dict('index')
         
         return expected_stats
     
-    def get_teams_stats_dataframe(self, league_key: str, force_refresh: bool = False) -> Optional['pd.DataFrame']:
+    def get_teams_stats_dataframe(self, league_key: str, force_refresh: bool = False, weekly_performance_df: Optional['pd.DataFrame'] = None) -> Optional['pd.DataFrame']:
         """
         Get all team stats for a league and return as a pandas DataFrame.
         Uses standings endpoint which includes team stats and standings information.
@@ -1149,6 +1365,9 @@ class YahooFantasyAPI:
         Args:
             league_key: League key (e.g., '461.l.621700')
             force_refresh: If True, bypass cache and fetch from API
+            weekly_performance_df: Optional weekly performance DataFrame (from
+                get_weekly_team_performance_dataframe) for the expected wins and losses,
+                so it is not built a second time
             
         Returns:
             pd.DataFrame: DataFrame containing team stats, or None if pandas is not available
@@ -1158,10 +1377,9 @@ class YahooFantasyAPI:
         
         # Check cache first (unless forcing refresh)
         if self.use_cache and not force_refresh:
-            cached_data = self.cache_manager.get(league_key, 'teams_stats')
-            if cached_data is not None:
+            df = self._get_cached_dataframe(league_key, 'teams_stats')
+            if df is not None:
                 try:
-                    df = pd.DataFrame(cached_data)
                     # Apply nickname mapping to cached data
                     df = self._apply_nickname_mapping_to_df(df, league_key)
                     return df
@@ -1175,13 +1393,16 @@ class YahooFantasyAPI:
         
         # Try to get standings first (includes team stats)
         try:
-            standings_data = self.get_league_standings(league_key)
-            team_stats_list = self._parse_standings(standings_data, league_key)
+            standings_data = self.get_league_standings(league_key, force_refresh=force_refresh)
+            with self._nickname_batch():
+                team_stats_list = self._parse_standings(standings_data, league_key)
             if team_stats_list:
                 df = pd.DataFrame(team_stats_list)
                 
                 # Add expected wins and losses
-                expected_stats = self._calculate_expected_wins_losses(league_key)
+                expected_stats = self._calculate_expected_wins_losses(
+                    league_key, force_refresh=force_refresh, league_info=league_info,
+                    weekly_performance_df=weekly_performance_df)
                 # Initialize columns with 0.0 for all teams
                 df['expected_wins'] = 0.0
                 df['expected_losses'] = 0.0
@@ -1189,50 +1410,35 @@ class YahooFantasyAPI:
                 df['win_percentage_difference'] = 0.0
                 
                 if expected_stats:
-                    # Update with calculated values
-                    for team_key, stats in expected_stats.items():
-                        mask = df['team_key'] == team_key
-                        expected_wins = round(stats.get('expected_wins', 0.0), 1)
-                        expected_losses = round(stats.get('expected_losses', 0.0), 1)
-                        
-                        df.loc[mask, 'expected_wins'] = expected_wins
-                        df.loc[mask, 'expected_losses'] = expected_losses
-                        
-                        # Calculate expected win percentage
-                        total_expected_games = expected_wins + expected_losses
-                        if total_expected_games > 0:
-                            expected_win_pct = (expected_wins / total_expected_games) * 100
-                            df.loc[mask, 'expected_win_percentage'] = round(expected_win_pct, 3)
-                        
-                        # Calculate difference between actual and expected win percentage
-                        actual_win_pct = df.loc[mask, 'win_percentage'].values
-                        if len(actual_win_pct) > 0:
-                            try:
-                                actual_win_pct_val = float(actual_win_pct[0])
-                                # Convert to percentage if stored as decimal (0.0-1.0)
-                                if actual_win_pct_val <= 1.0:
-                                    actual_win_pct_val = actual_win_pct_val * 100
-                                
-                                if total_expected_games > 0:
-                                    expected_win_pct_val = (expected_wins / total_expected_games) * 100
-                                    difference = actual_win_pct_val - expected_win_pct_val
-                                    df.loc[mask, 'win_percentage_difference'] = round(difference, 3)
-                            except (ValueError, TypeError):
-                                pass
+                    # Look up every team's expected record at once; teams without one keep 0.0
+                    expected = pd.DataFrame.from_dict(expected_stats, orient='index').round(1)
+                    expected_wins = df['team_key'].map(expected['expected_wins'])
+                    expected_losses = df['team_key'].map(expected['expected_losses'])
+                    total_expected_games = expected_wins + expected_losses
+                    has_expected_games = total_expected_games > 0
+                    expected_win_pct = (expected_wins / total_expected_games) * 100
+                    
+                    df['expected_wins'] = expected_wins.fillna(0.0)
+                    df['expected_losses'] = expected_losses.fillna(0.0)
+                    df['expected_win_percentage'] = expected_win_pct.where(has_expected_games, 0.0).round(3)
+                    
+                    # Difference between actual and expected win percentage
+                    if 'win_percentage' in df.columns:
+                        actual_win_pct = pd.to_numeric(df['win_percentage'], errors='coerce')
+                        # Convert to percentage if stored as decimal (0.0-1.0)
+                        actual_win_pct = actual_win_pct.where(actual_win_pct > 1.0, actual_win_pct * 100)
+                        difference = (actual_win_pct - expected_win_pct).where(has_expected_games, 0.0)
+                        df['win_percentage_difference'] = difference.fillna(0.0).round(3)
                 
                 # Cache the result if it's a prior season
                 if self.use_cache and is_prior_season:
-                    # Convert DataFrame to dict for caching
-                    df_dict = df.to_dict(orient='records')
-                    self.cache_manager.set(league_key, 'teams_stats', df_dict)
+                    self._cache_dataframe(league_key, 'teams_stats', df)
                 
                 return df
             else:
-                import logging
-                logging.debug(f"Standings parsed but returned empty list, trying individual team stats")
+                logger.debug("Standings parsed but returned empty list, trying individual team stats")
         except Exception as e:
-            import logging
-            logging.debug(f"Failed to get standings, trying individual team stats: {e}")
+            logger.debug("Failed to get standings, trying individual team stats: %s", e)
         
         # Fallback: get individual team stats
         teams = self.get_league_teams(league_key)
@@ -1241,24 +1447,22 @@ class YahooFantasyAPI:
         
         # Collect team stats
         team_stats_list = []
+        team_keys = [team.get('team_key') for team in teams if isinstance(team, dict) and team.get('team_key')]
         
-        for team in teams:
-            if not isinstance(team, dict):
-                continue
-            
-            team_key = team.get('team_key')
-            if not team_key:
-                continue
-            
+        # Fetch the whole league in collection requests; teams missing from them are fetched one at a time
+        stats_by_team = self.get_teams_stats(team_keys)
+        
+        for team_key in team_keys:
             try:
-                stats_data = self.get_team_stats(team_key)
+                stats_data = stats_by_team.get(team_key)
+                if stats_data is None:
+                    stats_data = self.get_team_stats(team_key)
                 team_stats = self._parse_team_stats(stats_data, team_key)
                 if team_stats:
                     team_stats_list.append(team_stats)
             except Exception as e:
                 # Log error but continue with other teams
-                import logging
-                logging.debug(f"Failed to get stats for team {team_key}: {e}")
+                logger.debug("Failed to get stats for team %s: %s", team_key, e)
         
         if not team_stats_list:
             return None
@@ -1267,17 +1471,17 @@ class YahooFantasyAPI:
         df = pd.DataFrame(team_stats_list)
         
         # Add expected wins and losses
-        expected_stats = self._calculate_expected_wins_losses(league_key)
+        expected_stats = self._calculate_expected_wins_losses(
+            league_key, force_refresh=force_refresh, league_info=league_info,
+            weekly_performance_df=weekly_performance_df)
         # Initialize columns with 0.0 for all teams
         df['expected_wins'] = 0.0
         df['expected_losses'] = 0.0
         
         if expected_stats:
-            # Update with calculated values
-            for team_key, stats in expected_stats.items():
-                mask = df['team_key'] == team_key
-                df.loc[mask, 'expected_wins'] = round(stats.get('expected_wins', 0.0), 1)
-                df.loc[mask, 'expected_losses'] = round(stats.get('expected_losses', 0.0), 1)
+            expected = pd.DataFrame.from_dict(expected_stats, orient='index').round(1)
+            df['expected_wins'] = df['team_key'].map(expected['expected_wins']).fillna(0.0)
+            df['expected_losses'] = df['team_key'].map(expected['expected_losses']).fillna(0.0)
         
         return df
     
@@ -1309,18 +1513,16 @@ class YahooFantasyAPI:
         # Extract games from numeric keys
         games = []
         if isinstance(games_obj, dict):
-            for key in games_obj.keys():
-                if key != 'count' and key.isdigit():
-                    game_data = games_obj.get(key, {})
-                    if isinstance(game_data, dict):
-                        if 'game' in game_data:
-                            game = game_data.get('game')
-                            if isinstance(game, dict):
-                                games.append(game)
-                            elif isinstance(game, list) and len(game) > 0:
-                                games.extend([g for g in game if isinstance(g, dict)])
-                        else:
-                            games.append(game_data)
+            for game_data in self._numbered_values(games_obj):
+                if isinstance(game_data, dict):
+                    if 'game' in game_data:
+                        game = game_data.get('game')
+                        if isinstance(game, dict):
+                            games.append(game)
+                        elif isinstance(game, list) and len(game) > 0:
+                            games.extend([g for g in game if isinstance(g, dict)])
+                    else:
+                        games.append(game_data)
         
         return games
     
@@ -1358,17 +1560,8 @@ class YahooFantasyAPI:
         if not isinstance(users, dict):
             return []
         
-        # Find user key
-        user_key = None
-        for key in users.keys():
-            if key != 'count' and key.isdigit():
-                user_key = key
-                break
-        
-        if not user_key:
-            return []
-        
-        user_data = users.get(user_key, {})
+        # First numbered user entry
+        user_data = next(self._numbered_values(users), None)
         if not isinstance(user_data, dict) or 'user' not in user_data:
             return []
         
@@ -1382,19 +1575,17 @@ class YahooFantasyAPI:
             return []
         
         # Find the game with leagues
-        for key in games_obj.keys():
-            if key != 'count' and key.isdigit():
-                game_data = games_obj.get(key, {})
-                if isinstance(game_data, dict) and 'game' in game_data:
-                    game_raw = game_data.get('game', {})
-                    
-                    # Game can be a list where game[1] contains leagues
-                    if isinstance(game_raw, list):
-                        for game_item in game_raw:
-                            if isinstance(game_item, dict) and 'leagues' in game_item:
-                                return self.extract_leagues_from_dict(game_item.get('leagues', {}))
-                    elif isinstance(game_raw, dict) and 'leagues' in game_raw:
-                        return self.extract_leagues_from_dict(game_raw.get('leagues', {}))
+        for game_data in self._numbered_values(games_obj):
+            if isinstance(game_data, dict) and 'game' in game_data:
+                game_raw = game_data.get('game', {})
+                
+                # Game can be a list where game[1] contains leagues
+                if isinstance(game_raw, list):
+                    for game_item in game_raw:
+                        if isinstance(game_item, dict) and 'leagues' in game_item:
+                            return self.extract_leagues_from_dict(game_item.get('leagues', {}))
+                elif isinstance(game_raw, dict) and 'leagues' in game_raw:
+                    return self.extract_leagues_from_dict(game_raw.get('leagues', {}))
         
         return []
     
@@ -1416,19 +1607,17 @@ class YahooFantasyAPI:
         if isinstance(league_raw, list) and len(league_raw) > 0:
             league_info = league_raw[0] if isinstance(league_raw[0], dict) else {}
         elif isinstance(league_raw, dict):
-            for key in league_raw.keys():
-                if key != 'count' and key.isdigit():
-                    league_data_item = league_raw.get(key, {})
-                    if isinstance(league_data_item, dict):
-                        if 'league' in league_data_item:
-                            league_nested = league_data_item.get('league', {})
-                            if isinstance(league_nested, list) and len(league_nested) > 0:
-                                league_info = league_nested[0] if isinstance(league_nested[0], dict) else {}
-                            elif isinstance(league_nested, dict):
-                                league_info = league_nested
-                        else:
-                            league_info = league_data_item
-                        break
+            for league_data_item in self._numbered_values(league_raw):
+                if isinstance(league_data_item, dict):
+                    if 'league' in league_data_item:
+                        league_nested = league_data_item.get('league', {})
+                        if isinstance(league_nested, list) and len(league_nested) > 0:
+                            league_info = league_nested[0] if isinstance(league_nested[0], dict) else {}
+                        elif isinstance(league_nested, dict):
+                            league_info = league_nested
+                    else:
+                        league_info = league_data_item
+                    break
         
         return league_info if league_info else None
     
@@ -1446,55 +1635,28 @@ class YahooFantasyAPI:
         teams_league_raw = teams_fantasy.get('league', {})
         
         # Handle league as list or dict with numeric keys
-        teams_obj = None
-        
-        if isinstance(teams_league_raw, list):
-            # Check all elements in the list for teams
-            for item in teams_league_raw:
-                if isinstance(item, dict) and 'teams' in item:
-                    teams_obj = item.get('teams', {})
-                    break
-        elif isinstance(teams_league_raw, dict):
-            # Numeric key structure
-            for key in teams_league_raw.keys():
-                if key != 'count' and key.isdigit():
-                    league_data = teams_league_raw.get(key, {})
-                    if isinstance(league_data, dict):
-                        if 'league' in league_data:
-                            league_nested = league_data.get('league', {})
-                            if isinstance(league_nested, list):
-                                for item in league_nested:
-                                    if isinstance(item, dict) and 'teams' in item:
-                                        teams_obj = item.get('teams', {})
-                                        break
-                            elif isinstance(league_nested, dict) and 'teams' in league_nested:
-                                teams_obj = league_nested.get('teams', {})
-                        elif 'teams' in league_data:
-                            teams_obj = league_data.get('teams', {})
-                        break
+        teams_obj = self._find_league_section(teams_league_raw, 'teams')
         
         if not isinstance(teams_obj, dict):
             return []
         
         # Extract teams from numeric keys
         teams = []
-        for key in teams_obj.keys():
-            if key != 'count' and key.isdigit():
-                team_data = teams_obj.get(key, {})
-                if isinstance(team_data, dict) and 'team' in team_data:
-                    team_raw = team_data.get('team', {})
-                    # Yahoo API returns teams as nested lists of single-key dicts
-                    if isinstance(team_raw, list) and len(team_raw) > 0:
-                        team_data_list = team_raw[0] if isinstance(team_raw[0], list) else team_raw
-                        # Combine all single-key dictionaries into one team dict
-                        team = {}
-                        for item in team_data_list:
-                            if isinstance(item, dict):
-                                team.update(item)
-                        if team:
-                            teams.append(team)
-                    elif isinstance(team_raw, dict):
-                        teams.append(team_raw)
+        for team_data in self._numbered_values(teams_obj):
+            if isinstance(team_data, dict) and 'team' in team_data:
+                team_raw = team_data.get('team', {})
+                # Yahoo API returns teams as nested lists of single-key dicts
+                if isinstance(team_raw, list) and len(team_raw) > 0:
+                    team_data_list = team_raw[0] if isinstance(team_raw[0], list) else team_raw
+                    # Combine all single-key dictionaries into one team dict
+                    team = {}
+                    for item in team_data_list:
+                        if isinstance(item, dict):
+                            team.update(item)
+                    if team:
+                        teams.append(team)
+                elif isinstance(team_raw, dict):
+                    teams.append(team_raw)
         
         return teams
     
@@ -1514,32 +1676,30 @@ class YahooFantasyAPI:
         
         # Handle team as list or dict with numeric keys
         team_info = None
-        if isinstance(team_obj, list) and len(team_obj) > 0:
+        if type(team_obj) is list and len(team_obj) > 0:
             # Find the element with stats
             for item in team_obj:
-                if isinstance(item, dict) and 'team_stats' in item:
+                if type(item) is dict and 'team_stats' in item:
                     team_info = item
                     break
             if not team_info and len(team_obj) > 0:
-                team_info = team_obj[0] if isinstance(team_obj[0], dict) else {}
-        elif isinstance(team_obj, dict):
+                team_info = team_obj[0] if type(team_obj[0]) is dict else {}
+        elif type(team_obj) is dict:
             # Numeric key structure
-            for key in team_obj.keys():
-                if key != 'count' and key.isdigit():
-                    team_data = team_obj.get(key, {})
-                    if isinstance(team_data, dict):
-                        if 'team' in team_data:
-                            team_nested = team_data.get('team', {})
-                            if isinstance(team_nested, list):
-                                for item in team_nested:
-                                    if isinstance(item, dict) and 'team_stats' in item:
-                                        team_info = item
-                                        break
-                            elif isinstance(team_nested, dict) and 'team_stats' in team_nested:
-                                team_info = team_nested
-                        elif 'team_stats' in team_data:
-                            team_info = team_data
-                        break
+            for team_data in self._numbered_values(team_obj):
+                if type(team_data) is dict:
+                    if 'team' in team_data:
+                        team_nested = team_data.get('team', {})
+                        if type(team_nested) is list:
+                            for item in team_nested:
+                                if type(item) is dict and 'team_stats' in item:
+                                    team_info = item
+                                    break
+                        elif type(team_nested) is dict and 'team_stats' in team_nested:
+                            team_info = team_nested
+                    elif 'team_stats' in team_data:
+                        team_info = team_data
+                    break
         
         if not team_info:
             return None
@@ -1553,20 +1713,18 @@ class YahooFantasyAPI:
         
         # Extract team stats if available
         team_stats = team_info.get('team_stats', {})
-        if isinstance(team_stats, dict):
+        if type(team_stats) is dict:
             # Extract stats from team_stats structure
             stats = team_stats.get('stats', {})
-            if isinstance(stats, dict):
-                for key in stats.keys():
-                    if key != 'count' and key.isdigit():
-                        stat_data = stats.get(key, {})
-                        if isinstance(stat_data, dict):
-                            stat = stat_data.get('stat', {})
-                            if isinstance(stat, dict):
-                                stat_id = stat.get('stat_id', '')
-                                value = stat.get('value', '')
-                                if stat_id:
-                                    parsed_stats[f'stat_{stat_id}'] = value
+            if type(stats) is dict:
+                for stat_data in self._numbered_values(stats):
+                    if type(stat_data) is dict:
+                        stat = stat_data.get('stat', {})
+                        if type(stat) is dict:
+                            stat_id = stat.get('stat_id', '')
+                            value = stat.get('value', '')
+                            if stat_id:
+                                parsed_stats[f'stat_{stat_id}'] = value
         
         return parsed_stats
     
@@ -1583,6 +1741,8 @@ class YahooFantasyAPI:
         """
         fantasy_content = standings_data.get('fantasy_content', {})
         league_obj = fantasy_content.get('league', {})
+        # Season for nickname mapping, parsed once for all teams
+        season = self._season_from_league_key(league_key)
         
         # Handle league as list or dict with numeric keys
         standings = None
@@ -1599,131 +1759,121 @@ class YahooFantasyAPI:
                         teams_obj = standings[0].get('teams', {}) if isinstance(standings[0], dict) else {}
         elif isinstance(league_obj, dict):
             # Numeric key structure
-            for key in league_obj.keys():
-                if key != 'count' and key.isdigit():
-                    league_data = league_obj.get(key, {})
-                    if isinstance(league_data, dict):
-                        if 'league' in league_data:
-                            league_nested = league_data.get('league', {})
-                            if isinstance(league_nested, list) and len(league_nested) > 1:
-                                standings_item = league_nested[1]
-                                if isinstance(standings_item, dict) and 'standings' in standings_item:
-                                    standings = standings_item.get('standings', {})
-                                    if isinstance(standings, list) and len(standings) > 0:
-                                        teams_obj = standings[0].get('teams', {}) if isinstance(standings[0], dict) else {}
-                        elif 'standings' in league_data:
-                            standings = league_data.get('standings', {})
-                            if isinstance(standings, list) and len(standings) > 0:
-                                teams_obj = standings[0].get('teams', {}) if isinstance(standings[0], dict) else {}
-                        break
+            for league_data in self._numbered_values(league_obj):
+                if isinstance(league_data, dict):
+                    if 'league' in league_data:
+                        league_nested = league_data.get('league', {})
+                        if isinstance(league_nested, list) and len(league_nested) > 1:
+                            standings_item = league_nested[1]
+                            if isinstance(standings_item, dict) and 'standings' in standings_item:
+                                standings = standings_item.get('standings', {})
+                                if isinstance(standings, list) and len(standings) > 0:
+                                    teams_obj = standings[0].get('teams', {}) if isinstance(standings[0], dict) else {}
+                    elif 'standings' in league_data:
+                        standings = league_data.get('standings', {})
+                        if isinstance(standings, list) and len(standings) > 0:
+                            teams_obj = standings[0].get('teams', {}) if isinstance(standings[0], dict) else {}
+                    break
         
         if not isinstance(teams_obj, dict):
-            import logging
-            logging.debug(f"Teams not found in standings. League object type: {type(league_obj)}")
+            logger.debug("Teams not found in standings. League object type: %s", type(league_obj))
             return []
         
         # Extract teams from teams_obj
         teams_list = []
-        for key in teams_obj.keys():
-            if key != 'count' and key.isdigit():
-                team_data = teams_obj.get(key, {})
-                if isinstance(team_data, dict) and 'team' in team_data:
-                    team_raw = team_data.get('team', {})
+        for team_data in self._numbered_values(teams_obj):
+            if isinstance(team_data, dict) and 'team' in team_data:
+                team_raw = team_data.get('team', {})
                     
-                    # Extract team info - team_raw is a list where:
-                    # team[0] is a list of single-key dicts with team info
-                    # team[1] is team_points
-                    # team[2] is team_standings
-                    team_info = {}
-                    team_standings = None
+                # Extract team info - team_raw is a list where:
+                # team[0] is a list of single-key dicts with team info
+                # team[1] is team_points
+                # team[2] is team_standings
+                team_info = {}
+                team_standings = None
                     
-                    if isinstance(team_raw, list):
-                        # First element is list of team info dicts
-                        if len(team_raw) > 0 and isinstance(team_raw[0], list):
-                            for item in team_raw[0]:
-                                if isinstance(item, dict):
-                                    # Extract key-value pairs from single-key dicts
-                                    for k, v in item.items():
-                                        # Handle managers structure
-                                        if k == 'managers' and isinstance(v, list):
-                                            # Extract manager nickname from managers list
-                                            for manager_item in v:
-                                                if isinstance(manager_item, dict) and 'manager' in manager_item:
-                                                    manager = manager_item.get('manager', {})
-                                                    if isinstance(manager, dict):
-                                                        team_info['manager_nickname'] = manager.get('nickname', 'N/A')
-                                                        # Apply nickname mapping if available (auto-adds to CSV if not found)
-                                                        if self.nickname_mapper and team_info.get('manager_nickname') == "--hidden--":
-                                                            team_name = team_info.get('name', 'N/A')
-                                                            # Extract season from league_key (format: {game_id}.l.{league_id})
-                                                            season = league_key.split('.')[0] if '.' in league_key and league_key else ''
-                                                            if season and season.isdigit() and team_name != 'N/A':
-                                                                # Apply mapping (will auto-add to CSV with "FIXME" if not found)
-                                                                team_info['manager_nickname'] = self.nickname_mapper.apply_mapping(
-                                                                    team_name, league_key, season, team_info['manager_nickname']
-                                                                )
-                                                        break  # Use first manager's nickname
-                                        elif isinstance(v, dict):
-                                            team_info.update(v)
-                                        elif not isinstance(v, list):
-                                            team_info[k] = v
+                if isinstance(team_raw, list):
+                    # First element is list of team info dicts
+                    if len(team_raw) > 0 and isinstance(team_raw[0], list):
+                        for item in team_raw[0]:
+                            if isinstance(item, dict):
+                                # Extract key-value pairs from single-key dicts
+                                for k, v in item.items():
+                                    # Handle managers structure
+                                    if k == 'managers' and isinstance(v, list):
+                                        # Extract manager nickname from managers list
+                                        for manager_item in v:
+                                            if isinstance(manager_item, dict) and 'manager' in manager_item:
+                                                manager = manager_item.get('manager', {})
+                                                if isinstance(manager, dict):
+                                                    team_info['manager_nickname'] = manager.get('nickname', 'N/A')
+                                                    # Apply nickname mapping if available (auto-adds to CSV if not found)
+                                                    if self.nickname_mapper and team_info.get('manager_nickname') == "--hidden--":
+                                                        team_name = team_info.get('name', 'N/A')
+                                                        if season and team_name != 'N/A':
+                                                            # Apply mapping (will auto-add to CSV with "FIXME" if not found)
+                                                            team_info['manager_nickname'] = self.nickname_mapper.apply_mapping(
+                                                                team_name, league_key, season, team_info['manager_nickname']
+                                                            )
+                                                    break  # Use first manager's nickname
+                                    elif isinstance(v, dict):
+                                        team_info.update(v)
+                                    elif not isinstance(v, list):
+                                        team_info[k] = v
                         
-                        # Second element has team_points
-                        # Third element has team_standings
-                        if len(team_raw) > 2 and isinstance(team_raw[2], dict):
-                            team_standings = team_raw[2].get('team_standings', {})
-                    elif isinstance(team_raw, dict):
-                        team_info = team_raw
-                        team_standings = team_info.get('team_standings', {})
+                    # Second element has team_points
+                    # Third element has team_standings
+                    if len(team_raw) > 2 and isinstance(team_raw[2], dict):
+                        team_standings = team_raw[2].get('team_standings', {})
+                elif isinstance(team_raw, dict):
+                    team_info = team_raw
+                    team_standings = team_info.get('team_standings', {})
                     
-                    # Extract basic team info
-                    manager_nickname = team_info.get('manager_nickname', 'N/A')
-                    team_name = team_info.get('name', 'N/A')
-                    team_key = team_info.get('team_key', 'N/A')
+                # Extract basic team info
+                manager_nickname = team_info.get('manager_nickname', 'N/A')
+                team_name = team_info.get('name', 'N/A')
+                team_key = team_info.get('team_key', 'N/A')
                     
-                    # Apply nickname mapping if available (auto-adds to CSV if not found)
-                    if self.nickname_mapper and manager_nickname == "--hidden--":
-                        # Extract season from league_key (format: {game_id}.l.{league_id})
-                        # Season is typically the first part before the dot
-                        season = league_key.split('.')[0] if '.' in league_key else ''
-                        if season and season.isdigit():
-                            # Apply mapping (will auto-add to CSV with "FIXME" if not found)
-                            manager_nickname = self.nickname_mapper.apply_mapping(
-                                team_name, league_key, season, manager_nickname
-                            )
+                # Apply nickname mapping if available (auto-adds to CSV if not found)
+                if self.nickname_mapper and manager_nickname == "--hidden--":
+                    if season:
+                        # Apply mapping (will auto-add to CSV with "FIXME" if not found)
+                        manager_nickname = self.nickname_mapper.apply_mapping(
+                            team_name, league_key, season, manager_nickname
+                        )
                     
-                    parsed_team = {
-                        'team_key': team_key,
-                        'team_name': team_name,
-                        'team_id': team_info.get('team_id', 'N/A'),
-                        'number_of_moves': team_info.get('number_of_moves', 'N/A'),
-                        'number_of_trades': team_info.get('number_of_trades', 'N/A'),
-                        'faab_balance': team_info.get('faab_balance', 'N/A'),
-                        'draft_grade': team_info.get('draft_grade', 'N/A'),
-                        'manager_nickname': manager_nickname,
-                    }
+                parsed_team = {
+                    'team_key': team_key,
+                    'team_name': team_name,
+                    'team_id': team_info.get('team_id', 'N/A'),
+                    'number_of_moves': team_info.get('number_of_moves', 'N/A'),
+                    'number_of_trades': team_info.get('number_of_trades', 'N/A'),
+                    'faab_balance': team_info.get('faab_balance', 'N/A'),
+                    'draft_grade': team_info.get('draft_grade', 'N/A'),
+                    'manager_nickname': manager_nickname,
+                }
                     
-                    # Add standings info if available
-                    if isinstance(team_standings, dict):
-                        parsed_team['rank'] = team_standings.get('rank', 'N/A')
-                        outcome_totals = team_standings.get('outcome_totals', {})
-                        if isinstance(outcome_totals, dict):
-                            parsed_team['wins'] = outcome_totals.get('wins', 'N/A')
-                            parsed_team['losses'] = outcome_totals.get('losses', 'N/A')
-                            parsed_team['ties'] = outcome_totals.get('ties', 'N/A')
-                        parsed_team['points_for'] = team_standings.get('points_for', 'N/A')
-                        parsed_team['points_against'] = team_standings.get('points_against', 'N/A')
-                        parsed_team['win_percentage'] = outcome_totals.get('percentage', 'N/A') if isinstance(outcome_totals, dict) else 'N/A'
-                    else:
-                        parsed_team['rank'] = 'N/A'
-                        parsed_team['wins'] = 'N/A'
-                        parsed_team['losses'] = 'N/A'
-                        parsed_team['ties'] = 'N/A'
-                        parsed_team['points_for'] = 'N/A'
-                        parsed_team['points_against'] = 'N/A'
-                        parsed_team['win_percentage'] = 'N/A'
+                # Add standings info if available
+                if isinstance(team_standings, dict):
+                    parsed_team['rank'] = team_standings.get('rank', 'N/A')
+                    outcome_totals = team_standings.get('outcome_totals', {})
+                    if isinstance(outcome_totals, dict):
+                        parsed_team['wins'] = outcome_totals.get('wins', 'N/A')
+                        parsed_team['losses'] = outcome_totals.get('losses', 'N/A')
+                        parsed_team['ties'] = outcome_totals.get('ties', 'N/A')
+                    parsed_team['points_for'] = team_standings.get('points_for', 'N/A')
+                    parsed_team['points_against'] = team_standings.get('points_against', 'N/A')
+                    parsed_team['win_percentage'] = outcome_totals.get('percentage', 'N/A') if isinstance(outcome_totals, dict) else 'N/A'
+                else:
+                    parsed_team['rank'] = 'N/A'
+                    parsed_team['wins'] = 'N/A'
+                    parsed_team['losses'] = 'N/A'
+                    parsed_team['ties'] = 'N/A'
+                    parsed_team['points_for'] = 'N/A'
+                    parsed_team['points_against'] = 'N/A'
+                    parsed_team['win_percentage'] = 'N/A'
                     
-                    teams_list.append(parsed_team)
+                teams_list.append(parsed_team)
         
         return teams_list
     
@@ -1751,9 +1901,9 @@ class YahooFantasyAPI:
         
         is_prior_season = self.cache_manager.is_prior_season(league_info) if self.use_cache and league_info else False
         
-        current_week = int(league_info.get('current_week', 1))
-        start = int(league_info.get('start_week', 1))
-        end = int(league_info.get('end_week', current_week))
+        current_week = league_info.get('current_week', 1)
+        start = league_info.get('start_week', 1)
+        end = league_info.get('end_week', current_week)
         
         # Override with provided parameters if specified
         if start_week is not None:
@@ -1763,10 +1913,9 @@ class YahooFantasyAPI:
         
         # Check cache first for prior seasons (unless forcing refresh)
         if self.use_cache and not force_refresh and is_prior_season:
-            cached_data = self.cache_manager.get(league_key, 'weekly_data')
-            if cached_data is not None:
+            df = self._get_cached_dataframe(league_key, 'weekly_data')
+            if df is not None:
                 try:
-                    df = pd.DataFrame(cached_data)
                     # Filter by week range if specified
                     if start_week is not None or end_week is not None:
                         df = df[(df['week'] >= start) & (df['week'] <= end)]
@@ -1778,15 +1927,15 @@ class YahooFantasyAPI:
         # Collect weekly data
         weekly_data_list = []
         
-        for week in range(start, min(end + 1, current_week + 1)):
-            try:
-                scoreboard_data = self.get_league_scoreboard(league_key, week)
-                week_matchups = self._parse_scoreboard(scoreboard_data, week, league_key)
-                if week_matchups:
-                    weekly_data_list.extend(week_matchups)
-            except Exception as e:
-                import logging
-                logging.debug(f"Failed to get scoreboard for week {week}: {e}")
+        with self._nickname_batch():
+            for week in range(start, min(end + 1, current_week + 1)):
+                try:
+                    scoreboard_data = self.get_league_scoreboard(league_key, week, force_refresh=force_refresh)
+                    week_matchups = self._parse_scoreboard(scoreboard_data, week, league_key)
+                    if week_matchups:
+                        weekly_data_list.extend(week_matchups)
+                except Exception as e:
+                    logger.debug("Failed to get scoreboard for week %s: %s", week, e)
         
         if not weekly_data_list:
             return None
@@ -1799,9 +1948,7 @@ class YahooFantasyAPI:
         
         # Cache the result if it's a prior season
         if self.use_cache and is_prior_season:
-            # Convert DataFrame to dict for caching
-            df_dict = df.to_dict(orient='records')
-            self.cache_manager.set(league_key, 'weekly_data', df_dict)
+            self._cache_dataframe(league_key, 'weekly_data', df)
         
         return df
     
@@ -1821,32 +1968,7 @@ class YahooFantasyAPI:
         league_obj = fantasy_content.get('league', {})
         
         # Handle league as list or dict with numeric keys
-        scoreboard = None
-        
-        if isinstance(league_obj, list):
-            # League is a list - index 0 is league info, index 1 has scoreboard
-            if len(league_obj) > 1:
-                scoreboard_item = league_obj[1]
-                if isinstance(scoreboard_item, dict) and 'scoreboard' in scoreboard_item:
-                    scoreboard = scoreboard_item.get('scoreboard', {})
-        elif isinstance(league_obj, dict):
-            # Numeric key structure
-            for key in league_obj.keys():
-                if key != 'count' and key.isdigit():
-                    league_data = league_obj.get(key, {})
-                    if isinstance(league_data, dict):
-                        if 'league' in league_data:
-                            league_nested = league_data.get('league', {})
-                            if isinstance(league_nested, list):
-                                for item in league_nested:
-                                    if isinstance(item, dict) and 'scoreboard' in item:
-                                        scoreboard = item.get('scoreboard', {})
-                                        break
-                            elif isinstance(league_nested, dict) and 'scoreboard' in league_nested:
-                                scoreboard = league_nested.get('scoreboard', {})
-                        elif 'scoreboard' in league_data:
-                            scoreboard = league_data.get('scoreboard', {})
-                        break
+        scoreboard = self._find_league_section(league_obj, 'scoreboard')
         
         if not isinstance(scoreboard, dict):
             return []
@@ -1862,78 +1984,70 @@ class YahooFantasyAPI:
             matchups = scoreboard.get('matchups', {})
         
         if isinstance(matchups, dict):
-            for key in matchups.keys():
-                if key != 'count' and key.isdigit():
-                    matchup_data = matchups.get(key, {})
-                    if isinstance(matchup_data, dict) and 'matchup' in matchup_data:
-                        matchup_raw = matchup_data.get('matchup', {})
+            for matchup_data in self._numbered_values(matchups):
+                if isinstance(matchup_data, dict) and 'matchup' in matchup_data:
+                    matchup_raw = matchup_data.get('matchup', {})
+                    
+                    # Parse matchup - can be list or dict with numeric keys
+                    teams_in_matchup = []
+                    
+                    if isinstance(matchup_raw, dict):
+                        # Check for numeric keys (like '0', '1') containing teams
+                        for teams_obj in self._numbered_values(matchup_raw):
+                            if isinstance(teams_obj, dict) and 'teams' in teams_obj:
+                                teams_dict = teams_obj.get('teams', {})
+                                if isinstance(teams_dict, dict):
+                                    for team_data in self._numbered_values(teams_dict):
+                                        if isinstance(team_data, dict) and 'team' in team_data:
+                                            team_info = self._extract_team_from_matchup(team_data.get('team', {}), league_key)
+                                            if team_info:
+                                                teams_in_matchup.append(team_info)
+                            elif isinstance(teams_obj, dict) and 'team' in teams_obj:
+                                team_info = self._extract_team_from_matchup(teams_obj.get('team', {}), league_key)
+                                if team_info:
+                                    teams_in_matchup.append(team_info)
+                    elif isinstance(matchup_raw, list):
+                        # Extract teams from matchup list
+                        for item in matchup_raw:
+                            if isinstance(item, dict):
+                                if 'teams' in item:
+                                    # Teams are nested
+                                    teams_obj = item.get('teams', {})
+                                    if isinstance(teams_obj, dict):
+                                        for team_data in self._numbered_values(teams_obj):
+                                            if isinstance(team_data, dict) and 'team' in team_data:
+                                                team_info = self._extract_team_from_matchup(team_data.get('team', {}), league_key)
+                                                if team_info:
+                                                    teams_in_matchup.append(team_info)
+                                elif 'team' in item:
+                                    team_info = self._extract_team_from_matchup(item.get('team', {}), league_key)
+                                    if team_info:
+                                        teams_in_matchup.append(team_info)
+                        
+                    # Create matchup entries
+                    if len(teams_in_matchup) >= 2:
+                        # Two teams matched up
+                        team1 = teams_in_matchup[0]
+                        team2 = teams_in_matchup[1]
                         
-                        # Parse matchup - can be list or dict with numeric keys
-                        teams_in_matchup = []
+                        # Calculate winner
+                        try:
+                            team1_points = float(str(team1.get('points', 0)).replace('N/A', '0'))
+                            team2_points = float(str(team2.get('points', 0)).replace('N/A', '0'))
+                            winner = team1.get('name', 'N/A') if team1_points > team2_points else (team2.get('name', 'N/A') if team2_points > team1_points else 'Tie')
+                        except (ValueError, TypeError):
+                            winner = 'N/A'
                         
-                        if isinstance(matchup_raw, dict):
-                            # Check for numeric keys (like '0', '1') containing teams
-                            for matchup_key in matchup_raw.keys():
-                                if matchup_key.isdigit():
-                                    teams_obj = matchup_raw.get(matchup_key, {})
-                                    if isinstance(teams_obj, dict) and 'teams' in teams_obj:
-                                        teams_dict = teams_obj.get('teams', {})
-                                        if isinstance(teams_dict, dict):
-                                            for team_key in teams_dict.keys():
-                                                if team_key != 'count' and team_key.isdigit():
-                                                    team_data = teams_dict.get(team_key, {})
-                                                    if isinstance(team_data, dict) and 'team' in team_data:
-                                                        team_info = self._extract_team_from_matchup(team_data.get('team', {}), league_key)
-                                                        if team_info:
-                                                            teams_in_matchup.append(team_info)
-                                    elif isinstance(teams_obj, dict) and 'team' in teams_obj:
-                                        team_info = self._extract_team_from_matchup(teams_obj.get('team', {}), league_key)
-                                        if team_info:
-                                            teams_in_matchup.append(team_info)
-                        elif isinstance(matchup_raw, list):
-                            # Extract teams from matchup list
-                            for item in matchup_raw:
-                                if isinstance(item, dict):
-                                    if 'teams' in item:
-                                        # Teams are nested
-                                        teams_obj = item.get('teams', {})
-                                        if isinstance(teams_obj, dict):
-                                            for team_key in teams_obj.keys():
-                                                if team_key != 'count' and team_key.isdigit():
-                                                    team_data = teams_obj.get(team_key, {})
-                                                    if isinstance(team_data, dict) and 'team' in team_data:
-                                                        team_info = self._extract_team_from_matchup(team_data.get('team', {}), league_key)
-                                                        if team_info:
-                                                            teams_in_matchup.append(team_info)
-                                    elif 'team' in item:
-                                        team_info = self._extract_team_from_matchup(item.get('team', {}), league_key)
-                                        if team_info:
-                                            teams_in_matchup.append(team_info)
-                            
-                        # Create matchup entries
-                        if len(teams_in_matchup) >= 2:
-                            # Two teams matched up
-                            team1 = teams_in_matchup[0]
-                            team2 = teams_in_matchup[1]
-                            
-                            # Calculate winner
-                            try:
-                                team1_points = float(str(team1.get('points', 0)).replace('N/A', '0'))
-                                team2_points = float(str(team2.get('points', 0)).replace('N/A', '0'))
-                                winner = team1.get('name', 'N/A') if team1_points > team2_points else (team2.get('name', 'N/A') if team2_points > team1_points else 'Tie')
-                            except (ValueError, TypeError):
-                                winner = 'N/A'
-                            
-                            matchups_list.append({
-                                'week': week,
-                                'team1_name': team1.get('name', 'N/A'),
-                                'team1_key': team1.get('team_key', 'N/A'),
-                                'team1_points': team1.get('points', 'N/A'),
-                                'team2_name': team2.get('name', 'N/A'),
-                                'team2_key': team2.get('team_key', 'N/A'),
-                                'team2_points': team2.get('points', 'N/A'),
-                                'winner': winner,
-                            })
+                        matchups_list.append({
+                            'week': week,
+                            'team1_name': team1.get('name', 'N/A'),
+                            'team1_key': team1.get('team_key', 'N/A'),
+                            'team1_points': team1.get('points', 'N/A'),
+                            'team2_name': team2.get('name', 'N/A'),
+                            'team2_key': team2.get('team_key', 'N/A'),
+                            'team2_points': team2.get('points', 'N/A'),
+                            'winner': winner,
+                        })
         
         return matchups_list
     
@@ -1951,106 +2065,31 @@ class YahooFantasyAPI:
         if df.empty:
             return df
         
-        # Create a list to store team-week records with points
-        team_week_points = []
+        # Coerce both points columns once ('N/A' and other non-numeric values count as 0)
+        # and stack them so each team-week score sits in one Series: team1 rows, then team2 rows
+        num_rows = len(df)
+        weeks = pd.concat([df['week'], df['week']], ignore_index=True)
+        points = pd.concat([
+            pd.to_numeric(df['team1_points'], errors='coerce'),
+            pd.to_numeric(df['team2_points'], errors='coerce')
+        ], ignore_index=True).fillna(0.0)
         
-        # Extract all team points by week from the matchup dataframe
-        for _, row in df.iterrows():
-            week = row.get('week')
-            team1_key = row.get('team1_key')
-            team1_points = row.get('team1_points')
-            team2_key = row.get('team2_key')
-            team2_points = row.get('team2_points')
-            
-            # Convert points to float, handling 'N/A' and other non-numeric values
-            try:
-                team1_pts = float(str(team1_points).replace('N/A', '0')) if team1_points != 'N/A' else 0.0
-            except (ValueError, TypeError):
-                team1_pts = 0.0
-            
-            try:
-                team2_pts = float(str(team2_points).replace('N/A', '0')) if team2_points != 'N/A' else 0.0
-            except (ValueError, TypeError):
-                team2_pts = 0.0
-            
-            team_week_points.append({
-                'week': week,
-                'team_key': team1_key,
-                'points': team1_pts
-            })
-            team_week_points.append({
-                'week': week,
-                'team_key': team2_key,
-                'points': team2_pts
-            })
-        
-        # Create a DataFrame from team-week points
-        team_points_df = pd.DataFrame(team_week_points)
-        
-        # Calculate record percentage vs all for each team-week combination
-        record_percentages = []
-        
-        for week in team_points_df['week'].unique():
-            week_data = team_points_df[team_points_df['week'] == week]
-            week_points = week_data['points'].values
-            total_teams = len(week_points)
-            
-            if total_teams == 0:
-                continue
-            
-            # For each team in this week, calculate percentage of teams they would beat
-            for _, team_row in week_data.iterrows():
-                team_key = team_row['team_key']
-                team_points = team_row['points']
-                
-                # Count how many teams this team would beat (strictly greater)
-                teams_beaten = sum(1 for pts in week_points if team_points > pts)
-                
-                # Calculate percentage (excluding the team itself from denominator)
-                # If only one team, set to 0% or handle edge case
-                if total_teams <= 1:
-                    record_pct = 0.0
-                else:
-                    record_pct = (teams_beaten / (total_teams - 1)) * 100
-                
-                record_percentages.append({
-                    'week': week,
-                    'team_key': team_key,
-                    'record_percentage_vs_all': record_pct
-                })
+        # Count how many teams each team would beat that week (strictly greater): with
+        # method='min', a score's rank is one more than the number of lower scores
+        by_week = points.groupby(weeks)
+        teams_beaten = by_week.rank(method='min') - 1
+        total_teams = by_week.transform('count')
+        
+        # Calculate percentage (excluding the team itself from denominator); 0% if only one team
+        record_pct = (teams_beaten / (total_teams - 1) * 100).where(total_teams > 1, 0.0).fillna(0.0)
         
-        # Create DataFrame with record percentages
-        record_pct_df = pd.DataFrame(record_percentages)
-        
-        # Add record_percentage_vs_all to original dataframe
-        # We need to add it for both team1 and team2 in each matchup row
-        df['team1_record_percentage_vs_all'] = 0.0
-        df['team2_record_percentage_vs_all'] = 0.0
-        
-        for idx, row in df.iterrows():
-            week = row.get('week')
-            team1_key = row.get('team1_key')
-            team2_key = row.get('team2_key')
-            
-            # Get record percentage vs all for team1
-            team1_record = record_pct_df[
-                (record_pct_df['week'] == week) & 
-                (record_pct_df['team_key'] == team1_key)
-            ]
-            if not team1_record.empty:
-                df.at[idx, 'team1_record_percentage_vs_all'] = team1_record.iloc[0]['record_percentage_vs_all']
-            
-            # Get record percentage vs all for team2
-            team2_record = record_pct_df[
-                (record_pct_df['week'] == week) & 
-                (record_pct_df['team_key'] == team2_key)
-            ]
-            if not team2_record.empty:
-                df.at[idx, 'team2_record_percentage_vs_all'] = team2_record.iloc[0]['record_percentage_vs_all']
+        # Add record_percentage_vs_all for both team1 and team2 in each matchup row
+        df['team1_record_percentage_vs_all'] = record_pct.iloc[:num_rows].to_numpy()
+        df['team2_record_percentage_vs_all'] = record_pct.iloc[num_rows:].to_numpy()
         
         return df
     
-    def get_weekly_team_performance_dataframe(self, league_key: str, start_week: Optional[int] = None, end_week: Optional[int] = None, force_refresh: bool = False) -> Optional['pd.DataFrame']:
+    def get_weekly_team_performance_dataframe(self, league_key: str, start_week: Optional[int] = None, end_week: Optional[int] = None, force_refresh: bool = False, weekly_df: Optional['pd.DataFrame'] = None) -> Optional['pd.DataFrame']:
         """
         Get weekly performance data for all teams with points and record percentage vs all.
         Returns one row per team per week.
@@ -2061,6 +2100,8 @@ class YahooFantasyAPI:
             start_week: Starting week number (default: 1)
             end_week: Ending week number (default: current week from league info)
             force_refresh: If True, bypass cache and fetch from API
+            weekly_df: Optional weekly matchup DataFrame for the same week range (from
+                get_weekly_dataframe), so the scoreboards are not fetched a second time
             
         Returns:
             pd.DataFrame: DataFrame with columns: week, team_key, team_name, points, record_percentage_vs_all
@@ -2074,55 +2115,54 @@ class YahooFantasyAPI:
         
         # Check cache first for prior seasons (unless forcing refresh)
         if self.use_cache and not force_refresh and is_prior_season:
-            cached_data = self.cache_manager.get(league_key, 'weekly_performance')
-            if cached_data is not None:
+            df = self._get_cached_dataframe(league_key, 'weekly_performance')
+            if df is not None:
                 try:
-                    df = pd.DataFrame(cached_data)
                     # Filter by week range if specified
                     if start_week is not None or end_week is not None:
                         league_info = self.get_league_info(league_key, force_refresh=force_refresh)
-                        start = start_week if start_week is not None else int(league_info.get('start_week', 1))
-                        end = end_week if end_week is not None else int(league_info.get('end_week', int(league_info.get('current_week', 1))))
+                        start = start_week if start_week is not None else league_info.get('start_week', 1)
+                        end = end_week if end_week is not None else league_info.get('end_week', league_info.get('current_week', 1))
                         df = df[(df['week'] >= start) & (df['week'] <= end)]
                     return df
                 except Exception:
                     # If cached data is invalid, continue to fetch from API
                     pass
         
-        # Get the weekly matchup dataframe
-        weekly_df = self.get_weekly_dataframe(league_key, start_week, end_week, force_refresh=force_refresh)
+        # Get the weekly matchup dataframe (unless the caller already has it)
+        if weekly_df is None:
+            weekly_df = self.get_weekly_dataframe(league_key, start_week, end_week, force_refresh=force_refresh)
         if weekly_df is None or weekly_df.empty:
             return None
         
-        # Extract team-week records with points and record percentage vs all
-        team_performance_list = []
-        
-        for _, row in weekly_df.iterrows():
-            week = row.get('week')
-            
-            # Team 1
-            team_performance_list.append({
-                'week': week,
-                'team_key': row.get('team1_key'),
-                'team_name': row.get('team1_name'),
-                'points': row.get('team1_points'),
-                'record_percentage_vs_all': row.get('team1_record_percentage_vs_all', 0.0)
-            })
-            
-            # Team 2
-            team_performance_list.append({
-                'week': week,
-                'team_key': row.get('team2_key'),
-                'team_name': row.get('team2_name'),
-                'points': row.get('team2_points'),
-                'record_percentage_vs_all': row.get('team2_record_percentage_vs_all', 0.0)
-            })
+        # Extract team-week records with points and record percentage vs all, column by column.
+        # Team 1 and team 2 of each matchup are interleaved, so duplicates resolve as before.
+        num_rows = len(weekly_df)
+        
+        def interleave(team1_column, team2_column, default=None):
+            values = [default] * (2 * num_rows)
+            if team1_column in weekly_df.columns:
+                values[0::2] = weekly_df[team1_column].tolist()
+            if team2_column in weekly_df.columns:
+                values[1::2] = weekly_df[team2_column].tolist()
+            return values
         
         # Create DataFrame and remove duplicates (in case a team appears multiple times in a week)
-        df = pd.DataFrame(team_performance_list)
+        df = pd.DataFrame({
+            'week': weekly_df['week'].repeat(2).tolist() if 'week' in weekly_df.columns else [None] * (2 * num_rows),
+            'team_key': interleave('team1_key', 'team2_key'),
+            'team_name': interleave('team1_name', 'team2_name'),
+            'points': interleave('team1_points', 'team2_points'),
+            'record_percentage_vs_all': interleave('team1_record_percentage_vs_all',
+                                                   'team2_record_percentage_vs_all', 0.0),
+        })
         df = df.drop_duplicates(subset=['week', 'team_key'], keep='first')
         df = df.sort_values(['week', 'record_percentage_vs_all'], ascending=[True, False])
         
+        # Cache the full-range result if it's a prior season
+        if self.use_cache and is_prior_season and start_week is None and end_week is None:
+            self._cache_dataframe(league_key, 'weekly_performance', df)
+        
         return df
     
     def _extract_team_from_matchup(self, team_raw: Any, league_key: str = '') -> Optional[Dict[str, Any]]:
@@ -2160,9 +2200,8 @@ class YahooFantasyAPI:
                                                     # Apply nickname mapping if available (auto-adds to CSV if not found)
                                                     if self.nickname_mapper and team_info.get('manager_nickname') == "--hidden--":
                                                         team_name = team_info.get('name', 'N/A')
-                                                        # Extract season from league_key (format: {game_id}.l.{league_id})
-                                                        season = league_key.split('.')[0] if '.' in league_key and league_key else ''
-                                                        if season and season.isdigit() and team_name != 'N/A':
+                                                        season = self._season_from_league_key(league_key)
+                                                        if season and team_name != 'N/A':
                                                             # Apply mapping (will auto-add to CSV with "FIXME" if not found)
                                                             team_info['manager_nickname'] = self.nickname_mapper.apply_mapping(
                                                                 team_name, league_key, season, team_info['manager_nickname']
@@ -2186,7 +2225,8 @@ class YahooFantasyAPI:
                     if isinstance(points_data, dict):
                         team_info['points'] = points_data.get('total', 'N/A')
         elif isinstance(team_raw, dict):
-            team_info = team_raw
+            # Copy: the scoreboard response is shared through the memo and parse cache
+            team_info = dict(team_raw)
             # Extract points if available
             if 'team_points' in team_raw:
                 points_data = team_raw.get('team_points', {})
@@ -2197,6 +2237,173 @@ class YahooFantasyAPI:
     
     # ==================== Helper Methods ====================
     
+    @staticmethod
+    def _numbered_values(collection: Dict[str, Any]) -> Iterator[Any]:
+        """
+        Iterate the entries of a Yahoo collection object ({'count': n, '0': ..., '1': ...}) in order.
+        Entries are indexed directly when 'count' matches the object's size; otherwise the
+        numeric keys are scanned.
+        
+        Args:
+            collection: Collection dictionary from an API response
+            
+        Yields:
+            Each numbered entry
+        """
+        count = collection.get('count')
+        if type(count) is int and len(collection) == count + 1:
+            for i in range(count):
+                yield collection.get(str(i), {})
+        else:
+            for key, value in collection.items():
+                if key != 'count' and key.isdigit():
+                    yield value
+    
+    def _parse_response_cached(self, kind: str, response, parse) -> Any:
+        """
+        Decode and parse a JSON API response, reusing the earlier result when Yahoo
+        returns a byte-identical body for the same kind of request.
+        
+        Args:
+            kind: Kind of response (part of the cache key, e.g. 'league_info')
+            response: requests.Response with a JSON body
+            parse: Callable turning the decoded JSON into the result
+            
+        Returns:
+            Parsed result (shared between callers; do not modify)
+            
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        if self._parse_cache is None:
+            return parse(self._parse_json(response))
+        digest = hashlib.blake2b(response.content, digest_size=16).digest()
+        return self._parse_cache.get_or_compute((kind, digest), lambda: parse(self._parse_json(response)))
+    
+    def _find_league_section(self, league_obj: Any, section: str) -> Any:
+        """
+        Find a section (e.g. 'transactions') in the league object of an API response.
+        Yahoo returns the league either as a list of dicts, or as a numbered collection
+        whose first entry may wrap the list in 'league'.
+        
+        Args:
+            league_obj: fantasy_content['league'] from an API response
+            section: Key of the section to find
+            
+        Returns:
+            The section's value, or None if not found
+        """
+        if isinstance(league_obj, dict):
+            # Numeric key structure: only the first league entry is used
+            league_data = next((entry for entry in self._numbered_values(league_obj) if isinstance(entry, dict)), None)
+            if league_data is None:
+                return None
+            if 'league' not in league_data:
+                return league_data.get(section)
+            league_obj = league_data.get('league')
+            if isinstance(league_obj, dict):
+                return league_obj.get(section)
+        
+        if isinstance(league_obj, list):
+            for item in league_obj:
+                if isinstance(item, dict) and section in item:
+                    return item.get(section)
+        return None
+    
+    def _memoized(self, key: tuple, compute, force: bool = False, ttl=None) -> Any:
+        """
+        Return a value from the short-lived in-memory memo, computing it on a miss.
+        Concurrent callers for the same key share a single API call.
+        
+        Args:
+            key: Memo key, e.g. ('league_info', league_key)
+            compute: Zero-argument callable fetching the value
+            force: If True, ignore any memoized value and recompute
+            ttl: Optional time-to-live override, in seconds, or a callable computing it from the value
+            
+        Returns:
+            Memoized or freshly computed value
+        """
+        if self._memo is None:
+            return compute()
+        return self._memo.get_or_compute(key, compute, force=force, ttl=ttl)
+    
+    def _league_info_memo_ttl(self, league_info: Optional[Dict[str, Any]]) -> Optional[float]:
+        """
+        Choose how long to memoize league info: prior seasons are kept longer than the default.
+        
+        Args:
+            league_info: Parsed league information, or None
+            
+        Returns:
+            float: Time-to-live in seconds, or None for the memo's default
+        """
+        if league_info and self.use_cache and self.cache_manager.is_prior_season(league_info):
+            return self.PRIOR_SEASON_MEMO_TTL
+        return None
+    
+    def clear_memo(self) -> None:
+        """Drop all memoized league lookups, so the next calls go to the disk cache or the API."""
+        if self._memo is not None:
+            self._memo.clear()
+    
+    @staticmethod
+    def _parse_json(response) -> Any:
+        """
+        Parse a JSON API response from its raw bytes, with orjson when available.
+        
+        Args:
+            response: requests.Response with a JSON body
+            
+        Returns:
+            Parsed JSON data
+            
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        if ORJSON_AVAILABLE:
+            # orjson.JSONDecodeError subclasses ValueError, like the stdlib's
+            return orjson.loads(response.content)
+        # json.loads detects UTF-8/16/32 in bytes itself, skipping requests' text decoding
+        return json.loads(response.content)
+    
+    def _get_cached_dataframe(self, league_key: str, data_type: str) -> Optional['pd.DataFrame']:
+        """
+        Retrieve a cached DataFrame, reading the columnar cache file first and
+        falling back to a JSON records cache written by older versions.
+        
+        Args:
+            league_key: League key
+            data_type: Type of data (e.g., 'teams_stats', 'weekly_data')
+            
+        Returns:
+            pd.DataFrame: Cached DataFrame, or None if not cached or invalid
+        """
+        df = self.cache_manager.get_dataframe(league_key, data_type)
+        if df is not None:
+            return df
+        
+        cached_data = self.cache_manager.get(league_key, data_type)
+        if cached_data is None:
+            return None
+        try:
+            return pd.DataFrame(cached_data)
+        except Exception:
+            return None
+    
+    def _cache_dataframe(self, league_key: str, data_type: str, df: 'pd.DataFrame') -> None:
+        """
+        Store a DataFrame in the cache as a columnar file, falling back to JSON
+        records when the DataFrame can't be written that way (e.g. mixed-type columns).
+        
+        Args:
+            league_key: League key
+            data_type: Type of data
+            df: DataFrame to cache
+        """
+        if not self.cache_manager.set_dataframe(league_key, data_type, df):
+            self.cache_manager.set(league_key, data_type, df.to_dict(orient='records'))
+    
     def _extract_user(self, fantasy_content: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Extract user object from fantasy_content.
@@ -2217,19 +2424,17 @@ class YahooFantasyAPI:
             users = fantasy_content.get('users', {})
             if isinstance(users, dict):
                 # Find first numeric key
-                for key in users.keys():
-                    if key != 'count' and key.isdigit():
-                        user_data = users.get(key, {})
-                        if isinstance(user_data, dict) and 'user' in user_data:
-                            user_raw = user_data.get('user')
-                            if isinstance(user_raw, list) and len(user_raw) > 0:
-                                # The second element (index 1) usually has the games
-                                return user_raw[1] if len(user_raw) > 1 else user_raw[0]
-                            elif isinstance(user_raw, dict):
-                                return user_raw
-                        elif isinstance(user_data, dict):
-                            return user_data
-                        break
+                for user_data in self._numbered_values(users):
+                    if isinstance(user_data, dict) and 'user' in user_data:
+                        user_raw = user_data.get('user')
+                        if isinstance(user_raw, list) and len(user_raw) > 0:
+                            # The second element (index 1) usually has the games
+                            return user_raw[1] if len(user_raw) > 1 else user_raw[0]
+                        elif isinstance(user_raw, dict):
+                            return user_raw
+                    elif isinstance(user_data, dict):
+                        return user_data
+                    break
         
         return None
     
@@ -2245,20 +2450,18 @@ class YahooFantasyAPI:
         """
         leagues = []
         if isinstance(leagues_obj, dict):
-            for key in leagues_obj.keys():
-                if key != 'count' and key.isdigit():
-                    league_data = leagues_obj.get(key, {})
-                    if isinstance(league_data, dict):
-                        if 'league' in league_data:
-                            league_raw = league_data.get('league')
-                            if isinstance(league_raw, list):
-                                for league_item in league_raw:
-                                    if isinstance(league_item, dict):
-                                        leagues.append(league_item)
-                            elif isinstance(league_raw, dict):
-                                leagues.append(league_raw)
-                        else:
-                            leagues.append(league_data)
+            for league_data in self._numbered_values(leagues_obj):
+                if isinstance(league_data, dict):
+                    if 'league' in league_data:
+                        league_raw = league_data.get('league')
+                        if isinstance(league_raw, list):
+                            for league_item in league_raw:
+                                if isinstance(league_item, dict):
+                                    leagues.append(league_item)
+                        elif isinstance(league_raw, dict):
+                            leagues.append(league_raw)
+                    else:
+                        leagues.append(league_data)
         return leagues
     
     def is_football_game(self, game: Dict[str, Any]) -> bool:
@@ -2406,8 +2609,8 @@ class YahooFantasyAPI:
         if not league_info:
             return []
         
-        current_week = int(league_info.get('current_week', 1))
-        end_week = int(league_info.get('end_week', current_week))
+        current_week = league_info.get('current_week', 1)
+        end_week = league_info.get('end_week', current_week)
         
         # Get weekly stats starting from playoff week
         return self.get_all_teams_weekly_stats(league_key, start_week=playoff_start_week, end_week=end_week)
@@ -2431,8 +2634,8 @@ class YahooFantasyAPI:
         if not league_info:
             return None
         
-        current_week = int(league_info.get('current_week', 1))
-        end_week = int(league_info.get('end_week', current_week))
+        current_week = league_info.get('current_week', 1)
+        end_week = league_info.get('end_week', current_week)
         
         # Get weekly data starting from playoff week
         return self.get_weekly_dataframe(league_key, start_week=playoff_start_week, end_week=end_week)
@@ -2492,8 +2695,8 @@ class YahooFantasyAPI:
         if not league_info:
             return {}
         
-        current_week = int(league_info.get('current_week', 1))
-        end_week = int(league_info.get('end_week', current_week))
+        current_week = league_info.get('current_week', 1)
+        end_week = league_info.get('end_week', current_week)
         
         # Aggregate stats across all playoff weeks
         playoff_stats = {
@@ -2511,17 +2714,27 @@ class YahooFantasyAPI:
         for week in range(playoff_start_week, min(end_week + 1, current_week + 1)):
             week_stats = self.get_team_stats_by_week(team_key, week)
             if week_stats:
-                playoff_stats['weeks'].append(week_stats)
-                # Aggregate cumulative stats (use the last week's cumulative values)
-                playoff_stats['number_of_moves'] = week_stats.get('number_of_moves', 0)
-                playoff_stats['number_of_trades'] = week_stats.get('number_of_trades', 0)
-                playoff_stats['faab_balance'] = week_stats.get('faab_balance', 100)
+                self._add_playoff_week_stats(playoff_stats, week_stats)
         
         # Calculate FAAB spent (starting - ending balance)
         playoff_stats['faab_spent'] = 100 - playoff_stats['faab_balance']
         
         return playoff_stats
     
+    def _add_playoff_week_stats(self, playoff_stats: Dict[str, Any], week_stats: Dict[str, Any]) -> None:
+        """
+        Add one playoff week's stats to a team's aggregated playoff stats.
+        
+        Args:
+            playoff_stats: Aggregated playoff stats (updated in place)
+            week_stats: Parsed team stats for the week
+        """
+        playoff_stats['weeks'].append(week_stats)
+        # Aggregate cumulative stats (use the last week's cumulative values)
+        playoff_stats['number_of_moves'] = week_stats.get('number_of_moves', 0)
+        playoff_stats['number_of_trades'] = week_stats.get('number_of_trades', 0)
+        playoff_stats['faab_balance'] = week_stats.get('faab_balance', 100)
+    
     def get_all_teams_playoff_stats(self, league_key: str) -> List[Dict[str, Any]]:
         """
         Get cumulative playoff stats for all teams in a league.
@@ -2536,7 +2749,18 @@ class YahooFantasyAPI:
         if not teams:
             return []
         
-        playoff_stats_list = []
+        playoff_start_week = self.get_playoff_start_week(league_key)
+        if not playoff_start_week:
+            return []
+        
+        league_info = self.get_league_info(league_key)
+        if not league_info:
+            return []
+        
+        current_week = league_info.get('current_week', 1)
+        end_week = league_info.get('end_week', current_week)
+        
+        playoff_stats_by_team = {}
         for team in teams:
             if not isinstance(team, dict):
                 continue
@@ -2545,15 +2769,31 @@ class YahooFantasyAPI:
             if not team_key:
                 continue
             
-            try:
-                team_playoff_stats = self.get_team_playoff_stats(team_key, league_key)
-                if team_playoff_stats:
-                    # Add team name
-                    team_playoff_stats['team_name'] = team.get('name', 'N/A')
-                    playoff_stats_list.append(team_playoff_stats)
-            except Exception as e:
-                import logging
-                logging.debug(f"Failed to get playoff stats for team {team_key}: {e}")
+            playoff_stats_by_team[team_key] = {
+                'team_key': team_key,
+                'playoff_start_week': playoff_start_week,
+                'playoff_end_week': end_week,
+                'number_of_moves': 0,
+                'number_of_trades': 0,
+                'faab_spent': 0,
+                'faab_balance': 100,  # Starting balance
+                'weeks': [],
+                'team_name': team.get('name', 'N/A')
+            }
+        
+        # One batched request per playoff week covers every team
+        team_keys = list(playoff_stats_by_team)
+        for week in range(playoff_start_week, min(end_week + 1, current_week + 1)):
+            week_stats_by_team = self.get_teams_stats_by_week(team_keys, week)
+            for team_key, week_stats in week_stats_by_team.items():
+                if team_key in playoff_stats_by_team:
+                    self._add_playoff_week_stats(playoff_stats_by_team[team_key], week_stats)
+        
+        playoff_stats_list = []
+        for playoff_stats in playoff_stats_by_team.values():
+            # Calculate FAAB spent (starting - ending balance)
+            playoff_stats['faab_spent'] = 100 - playoff_stats['faab_balance']
+            playoff_stats_list.append(playoff_stats)
         
         return playoff_stats_list
 
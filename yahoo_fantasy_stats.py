@@ -35,6 +35,9 @@ def authenticate():
         logging.info("Found existing tokens, attempting to create authenticated session")
         try:
             oauth.create_authenticated_session()
+            # Refresh a saved token that is about to expire now instead of after a rejected request
+            if oauth.refresh_if_expiring():
+                logging.info("Refreshed expiring access token")
             logging.info("Successfully authenticated with saved tokens")
             return oauth
         except Exception as e:
@@ -321,17 +324,14 @@ def main():
                                     weekly_team_stats_df = None
                                     try:
                                         logging.info("Fetching weekly team stats (moves, trades, FAAB)...")
-                                        weekly_team_stats = api.get_all_teams_weekly_stats(league_key)
-                                        if weekly_team_stats:
-                                            try:
-                                                import pandas as pd
-                                                weekly_team_stats_df = pd.DataFrame(weekly_team_stats)
-                                                if weekly_team_stats_df is not None and not weekly_team_stats_df.empty:
-                                                    logging.info(f"Successfully created weekly team stats DataFrame with {len(weekly_team_stats_df)} row(s)")
-                                                    print(f"\nWeekly Team Stats DataFrame:")
-                                                    print(weekly_team_stats_df.to_string())
-                                            except ImportError:
-                                                logging.debug("pandas not available for weekly team stats DataFrame")
+                                        try:
+                                            weekly_team_stats_df = api.get_all_teams_weekly_stats_dataframe(league_key)
+                                            if weekly_team_stats_df is not None and not weekly_team_stats_df.empty:
+                                                logging.info(f"Successfully created weekly team stats DataFrame with {len(weekly_team_stats_df)} row(s)")
+                                                print(f"\nWeekly Team Stats DataFrame:")
+                                                print(weekly_team_stats_df.to_string())
+                                        except ImportError:
+                                            logging.debug("pandas not available for weekly team stats DataFrame")
                                     except Exception as e:
                                         logging.debug(f"Failed to fetch weekly team stats: {e}")
                                     